@@ -0,0 +1,101 @@
+import hashlib
+import random
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
+
+# 합성 기사 문장 재료 (관련 키워드와 감정분석 사전 단어를 섞어 실제 수집 기사와 비슷한 분포를 만듦)
+SUBJECTS = ["한국수자원공사", "K-water", "kwater", "수자원공사", "환경부", "지방자치단체", "물산업 협회"]
+TOPICS = ["댐 운영", "광역상수도", "하수도 정비", "물관리 일원화", "수도 요금", "스마트 물관리", "가뭄 대응",
+          "홍수 예보", "수질 개선", "상수도 누수 감시"]
+POSITIVE_PHRASES = ["성과가 향상되었다", "주민 만족도가 증가했다", "효율 개선 효과를 기대한다",
+                    "협력 사업이 성공적으로 마무리됐다", "지속가능 친환경 성장을 지원한다"]
+NEGATIVE_PHRASES = ["운영 문제로 주민 불만이 커졌다", "사고 위험에 대한 우려가 나온다",
+                    "예산 손실과 관리 부실이 논란이다", "갈등과 반발이 이어지고 있다", "수질 악화로 불안이 커졌다"]
+NEUTRAL_PHRASES = ["관련 계획을 발표했다", "정책 검토 회의를 열었다", "사업 추진 현황을 보고했다",
+                   "조사 결과를 분석해 평가할 예정이다", "제도 개선을 논의했다"]
+FILLERS = ["관계자는 이날 현장을 점검했다.", "올해 하반기까지 단계적으로 추진한다.",
+           "지역 주민 설명회도 함께 진행된다.", "세부 일정은 추후 공지할 계획이다.",
+           "전문가들은 장기적인 관점의 대응이 필요하다고 밝혔다."]
+PRESSES = ["news.example.com", "daily.example.co.kr", "water.example.kr", "econ.example.com"]
+# 수집 필터에 걸러지는 무관한 기사
+UNRELATED_TITLES = ["프로야구 개막전 매진", "신작 영화 흥행 순위", "주말 날씨 맑고 포근", "신제품 스마트폰 출시"]
+
+KST = timezone(timedelta(hours=9))
+
+
+class SyntheticArticleGenerator:
+    """
+    재현 가능한 합성 한국어 기사를 만듭니다.
+
+    같은 seed와 순번이면 항상 같은 기사가 나오므로 스텁 서버의 페이지 내용이 요청마다 바뀌지 않습니다.
+    duplicate_ratio만큼은 앞선 기사를 살짝 고친 재게재 기사로, unrelated_ratio만큼은 관련 없는 기사로 만듭니다.
+    """
+
+    def __init__(self, seed: int = 42, duplicate_ratio: float = 0.1, unrelated_ratio: float = 0.05,
+                 newest: Optional[datetime] = None, interval_seconds: int = 300):
+        self.seed = seed
+        self.duplicate_ratio = duplicate_ratio
+        self.unrelated_ratio = unrelated_ratio
+        self.newest = newest or datetime.now(timezone.utc).replace(microsecond=0)
+        self.interval_seconds = interval_seconds
+
+    def _rng(self, *key) -> random.Random:
+        return random.Random(f"{self.seed}:{':'.join(str(part) for part in key)}")
+
+    @staticmethod
+    def _slug(namespace: str) -> str:
+        return hashlib.blake2b(namespace.encode("utf-8"), digest_size=4).hexdigest()
+
+    def _body(self, rng: random.Random) -> Dict[str, str]:
+        if rng.random() < self.unrelated_ratio:
+            return {"title": rng.choice(UNRELATED_TITLES), "content": " ".join(rng.sample(FILLERS, 2))}
+        subject = rng.choice(SUBJECTS)
+        topic = rng.choice(TOPICS)
+        phrases = rng.choice([POSITIVE_PHRASES, NEGATIVE_PHRASES, NEUTRAL_PHRASES])
+        title = f"{subject}, {topic} {rng.choice(phrases)}"
+        sentences = [f"{subject}는 {topic} 분야에서 {rng.choice(phrases)}."]
+        sentences += rng.sample(FILLERS, rng.randint(2, 4))
+        sentences.append(f"{rng.choice(SUBJECTS)} {rng.choice(TOPICS)} {rng.choice(phrases)}.")
+        return {"title": title, "content": " ".join(sentences)}
+
+    def article(self, index: int, namespace: str = "") -> Dict[str, Any]:
+        """
+        순번 index의 기사를 수집기 저장 형식(title, content, url, published_at)으로 반환합니다.
+        index가 클수록 오래된 기사입니다.
+        """
+        rng = self._rng(namespace, index)
+        if index > 0 and rng.random() < self.duplicate_ratio:
+            # 앞선 기사를 다른 매체가 재게재한 것처럼 끝 문장만 바꿈
+            original = self.article(rng.randrange(index), namespace)
+            body = {"title": original["title"], "content": f"{original['content']} {rng.choice(FILLERS)}"}
+        else:
+            body = self._body(rng)
+        published_at = self.newest - timedelta(seconds=index * self.interval_seconds)
+        return {
+            **body,
+            "url": f"https://{rng.choice(PRESSES)}/article/{self.seed}/{self._slug(namespace)}/{index}",
+            "published_at": published_at.isoformat()
+        }
+
+    def articles(self, count: int, start: int = 0, namespace: str = "") -> List[Dict[str, Any]]:
+        return [self.article(index, namespace) for index in range(start, start + count)]
+
+    def naver_item(self, index: int, namespace: str = "") -> Dict[str, Any]:
+        """
+        네이버 뉴스 검색 API 응답 항목 형식(HTML 강조 태그와 엔티티, RFC 822 pubDate)으로 반환합니다.
+        """
+        article = self.article(index, namespace)
+        published_at = datetime.fromisoformat(article["published_at"]).astimezone(KST)
+        title = article["title"]
+        # 검색어 강조 태그 (긴 이름부터 찾아 한 번만 감쌈)
+        for subject in sorted(SUBJECTS, key=len, reverse=True):
+            if subject in title:
+                title = title.replace(subject, f"<b>{subject}</b>", 1)
+                break
+        return {
+            "title": title.replace("&", "&amp;"),
+            "originallink": article["url"],
+            "link": article["url"],
+            "description": article["content"].replace("&", "&amp;"),
+            "pubDate": published_at.strftime("%a, %d %b %Y %H:%M:%S %z")
+        }
@@ -0,0 +1,119 @@
+import argparse
+import asyncio
+import random
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict
+from aiohttp import web
+from benchmarks.article_generator import SyntheticArticleGenerator
+
+# 네이버 검색 API의 start 최대값
+NAVER_MAX_START = 1000
+NEWS_PATH = "/v1/search/news.json"
+
+
+class NaverApiStub:
+    """
+    네이버 뉴스 검색 API(/v1/search/news.json)를 흉내 내는 로컬 aiohttp 서버입니다.
+
+    - latency_ms(+ latency_jitter_ms)만큼 응답을 늦춥니다.
+    - 키워드마다 total_results개의 기사가 있는 것처럼 페이지를 나눠 돌려줍니다.
+    - throttle_rate 확률로 429와 Retry-After 헤더를 돌려줍니다.
+    기사는 SyntheticArticleGenerator로 키워드별로 만들며, 같은 요청에는 항상 같은 페이지를 돌려줍니다.
+    """
+
+    def __init__(self, latency_ms: float = 50.0, latency_jitter_ms: float = 20.0, total_results: int = 1000,
+                 throttle_rate: float = 0.0, retry_after: float = 0.05, seed: int = 42,
+                 generator: SyntheticArticleGenerator = None):
+        self.latency_ms = latency_ms
+        self.latency_jitter_ms = latency_jitter_ms
+        self.total_results = total_results
+        self.throttle_rate = throttle_rate
+        self.retry_after = retry_after
+        self.generator = generator or SyntheticArticleGenerator(seed=seed)
+        self._random = random.Random(seed)
+        self._runner = None
+        self.url = None
+        self.stats = {"requests": 0, "throttled": 0, "items": 0}
+
+    def reset_stats(self):
+        self.stats = {"requests": 0, "throttled": 0, "items": 0}
+
+    async def handle_news(self, request: web.Request) -> web.Response:
+        self.stats["requests"] += 1
+        delay = self.latency_ms + self._random.uniform(-self.latency_jitter_ms, self.latency_jitter_ms)
+        await asyncio.sleep(max(delay, 0) / 1000)
+
+        if self.throttle_rate and self._random.random() < self.throttle_rate:
+            self.stats["throttled"] += 1
+            return web.json_response(
+                {"errorMessage": "Rate limit exceeded.", "errorCode": "012"},
+                status=429,
+                headers={"Retry-After": str(self.retry_after)}
+            )
+
+        try:
+            query = request.query["query"]
+            display = min(int(request.query.get("display", "10")), 100)
+            start = int(request.query.get("start", "1"))
+        except (KeyError, ValueError):
+            return web.json_response({"errorMessage": "Incorrect query request.", "errorCode": "SE01"}, status=400)
+        if start > NAVER_MAX_START:
+            return web.json_response({"errorMessage": "Invalid start value.", "errorCode": "SE03"}, status=400)
+
+        end = min(start - 1 + display, self.total_results)
+        items = [self.generator.naver_item(index, namespace=query) for index in range(start - 1, end)]
+        self.stats["items"] += len(items)
+        return web.json_response({
+            "lastBuildDate": datetime.now(timezone(timedelta(hours=9))).strftime("%a, %d %b %Y %H:%M:%S %z"),
+            "total": self.total_results,
+            "start": start,
+            "display": len(items),
+            "items": items
+        })
+
+    def app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_get(NEWS_PATH, self.handle_news)
+        return app
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """
+        서버를 시작하고 수집기의 NAVER_API_URL로 쓸 주소를 반환합니다. port=0이면 빈 포트를 고릅니다.
+        """
+        self._runner = web.AppRunner(self.app(), access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        bound_port = site._server.sockets[0].getsockname()[1]
+        self.url = f"http://{host}:{bound_port}{NEWS_PATH}"
+        return self.url
+
+    async def stop(self):
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    def config(self) -> Dict[str, Any]:
+        return {
+            "latency_ms": self.latency_ms,
+            "latency_jitter_ms": self.latency_jitter_ms,
+            "total_results": self.total_results,
+            "throttle_rate": self.throttle_rate,
+            "retry_after": self.retry_after
+        }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="네이버 뉴스 검색 API 스텁 서버를 실행합니다.")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency-ms", type=float, default=50.0)
+    parser.add_argument("--latency-jitter-ms", type=float, default=20.0)
+    parser.add_argument("--total-results", type=int, default=1000, help="키워드별 기사 수")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="429를 돌려줄 확률 (0~1)")
+    parser.add_argument("--retry-after", type=float, default=0.05, help="429 응답의 Retry-After (초)")
+    args = parser.parse_args()
+
+    stub = NaverApiStub(args.latency_ms, args.latency_jitter_ms, args.total_results,
+                        args.throttle_rate, args.retry_after)
+    print(f"네이버 API 스텁: http://127.0.0.1:{args.port}{NEWS_PATH}")
+    web.run_app(stub.app(), host="127.0.0.1", port=args.port, print=None)
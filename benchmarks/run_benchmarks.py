@@ -0,0 +1,357 @@
+import argparse
+import asyncio
+import json
+import logging
+import os
+import platform
+import socket
+import sys
+import time
+import uuid
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List
+import aiohttp
+from benchmarks.article_generator import SyntheticArticleGenerator
+from benchmarks.naver_stub import NaverApiStub
+
+# 로깅 설정
+logging.basicConfig(level=logging.WARNING)
+logger = logging.getLogger(__name__)
+
+SCENARIOS = ("fetch", "save", "sentiment", "search")
+RESULTS_DIR = "benchmark_results"
+
+# (시나리오 이름, 경로, 쿼리 파라미터)
+SEARCH_REQUESTS = [
+    ("search_substring", "/news/search", {"keyword": "수자원", "limit": 20}),
+    ("search_substring_rare", "/news/search", {"keyword": "누수 감시", "limit": 20}),
+    ("search_fulltext", "/news/search", {"keyword": "댐", "mode": "fulltext", "limit": 20}),
+    ("search_advanced", "/news/search/advanced", {"title_keyword": "상수도", "content_keyword": "점검", "limit": 20}),
+    ("db_list", "/news/db", {"limit": 50})
+]
+
+
+def percentile(sorted_samples: List[float], fraction: float) -> float:
+    """
+    정렬된 표본의 백분위수를 선형 보간으로 계산합니다.
+    """
+    if not sorted_samples:
+        return 0.0
+    position = (len(sorted_samples) - 1) * fraction
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_samples) - 1)
+    return sorted_samples[lower] + (sorted_samples[upper] - sorted_samples[lower]) * (position - lower)
+
+
+def summarize(samples_ms: List[float], units: int, elapsed: float, unit: str, **extra) -> Dict[str, Any]:
+    """
+    반복별 소요 시간(ms)과 처리량을 결과 항목으로 정리합니다.
+    """
+    ordered = sorted(samples_ms)
+    return {
+        "iterations": len(ordered),
+        "p50_ms": round(percentile(ordered, 0.50), 3),
+        "p95_ms": round(percentile(ordered, 0.95), 3),
+        "p99_ms": round(percentile(ordered, 0.99), 3),
+        "mean_ms": round(sum(ordered) / len(ordered), 3) if ordered else 0.0,
+        "max_ms": round(ordered[-1], 3) if ordered else 0.0,
+        "throughput": round(units / elapsed, 3) if elapsed > 0 else 0.0,
+        "throughput_unit": f"{unit}/s",
+        **extra
+    }
+
+
+async def measure(run: Callable[[int], Awaitable[int]], iterations: int, warmup: int = 1):
+    """
+    run(i)를 반복 실행하고 (반복별 소요 시간 ms 목록, 처리한 단위 수 합계, 전체 소요 시간)을 반환합니다.
+    run은 처리한 단위 수(기사 수, 요청 수 등)를 반환합니다. 워밍업 실행은 측정에서 뺍니다.
+    """
+    for i in range(warmup):
+        await run(-1 - i)
+    samples = []
+    units = 0
+    started = time.perf_counter()
+    for i in range(iterations):
+        iteration_started = time.perf_counter()
+        units += await run(i)
+        samples.append((time.perf_counter() - iteration_started) * 1000)
+    return samples, units, time.perf_counter() - started
+
+
+async def bench_fetch(args, stub: NaverApiStub) -> Dict[str, Any]:
+    from news_collector_mongo import NewsCollectorMongo
+    from rate_limiter import NaverRateLimiter
+
+    results = {}
+    for concurrent in (False, True):
+        collector = NewsCollectorMongo(rate_limiter=NaverRateLimiter(rate_per_second=args.naver_rate,
+                                                                     daily_limit=10 ** 9, shared_quota=False))
+        stub.reset_stats()
+
+        async def run(_):
+            articles = await collector.fetch_news_extensive(max_results=args.fetch_max_results,
+                                                            concurrent=concurrent)
+            return len(articles)
+
+        try:
+            samples, units, elapsed = await measure(run, args.iterations, args.warmup)
+        finally:
+            await collector.close_session()
+        name = "fetch_news_extensive_concurrent" if concurrent else "fetch_news_extensive_sequential"
+        results[name] = summarize(samples, units, elapsed, "articles",
+                                  max_results=args.fetch_max_results, stub_requests=stub.stats["requests"],
+                                  stub_throttled=stub.stats["throttled"])
+    return results
+
+
+async def bench_save(args, generator: SyntheticArticleGenerator) -> Dict[str, Any]:
+    from news_collector_mongo import NewsCollectorMongo
+    from simple_sentiment_analyzer import SimpleSentimentAnalyzer
+
+    collector = NewsCollectorMongo()
+    analyzer = SimpleSentimentAnalyzer()
+    results = {}
+    try:
+        for bulk in (False, True):
+            mode = "bulk" if bulk else "per_doc"
+
+            async def run(i):
+                # 반복마다 새 URL 묶음을 저장 (중복 검사로 건너뛰지 않도록)
+                articles = generator.articles(args.save_batch_size, namespace=f"save-{mode}-{i}")
+                result = await collector.save_articles_to_mongo(articles, analyzer, bulk=bulk)
+                return result["saved_count"]
+
+            samples, units, elapsed = await measure(run, args.iterations, args.warmup)
+            results[f"save_articles_to_mongo_{mode}"] = summarize(samples, units, elapsed, "articles",
+                                                                 batch_size=args.save_batch_size)
+    finally:
+        analyzer.shutdown()
+    return results
+
+
+async def bench_sentiment(args, generator: SyntheticArticleGenerator) -> Dict[str, Any]:
+    from simple_sentiment_analyzer import SimpleSentimentAnalyzer
+
+    analyzer = SimpleSentimentAnalyzer()
+    results = {}
+    try:
+        for size in args.sentiment_batch_sizes:
+            texts = [f"{article['title']} {article['content']}"
+                     for article in generator.articles(size, namespace="sentiment")]
+
+            async def run(_):
+                return len(analyzer.analyze_batch(texts))
+
+            samples, units, elapsed = await measure(run, args.iterations, args.warmup)
+            results[f"analyze_batch_{size}"] = summarize(samples, units, elapsed, "texts", batch_size=size)
+    finally:
+        analyzer.shutdown()
+    return results
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def _seed_search_corpus(args, generator: SyntheticArticleGenerator):
+    """
+    검색 대상 기사가 search_corpus개가 되도록 합성 기사를 채웁니다 (측정에 포함하지 않음).
+    """
+    from database_mongo import get_async_collection
+    from news_collector_mongo import NewsCollectorMongo
+    from simple_sentiment_analyzer import SimpleSentimentAnalyzer
+
+    collection = await get_async_collection()
+    missing = args.search_corpus - await collection.count_documents({})
+    if missing <= 0:
+        return
+    collector = NewsCollectorMongo()
+    analyzer = SimpleSentimentAnalyzer()
+    try:
+        await collector.save_articles_to_mongo(generator.articles(missing, namespace="search"), analyzer, bulk=True)
+    finally:
+        analyzer.shutdown()
+
+
+async def bench_search(args, generator: SyntheticArticleGenerator) -> Dict[str, Any]:
+    import uvicorn
+
+    await _seed_search_corpus(args, generator)
+    # 서버 모듈은 벤치마크용 환경변수를 설정한 뒤에 불러와야 함
+    from main_mongo import app
+
+    port = _free_port()
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning"))
+    server_task = asyncio.create_task(server.serve())
+    while not server.started:
+        if server_task.done():
+            server_task.result()
+        await asyncio.sleep(0.05)
+
+    results = {}
+    semaphore = asyncio.Semaphore(args.search_concurrency)
+    try:
+        async with aiohttp.ClientSession(f"http://127.0.0.1:{port}") as session:
+            for name, path, params in SEARCH_REQUESTS:
+                samples = []
+
+                async def request():
+                    async with semaphore:
+                        request_started = time.perf_counter()
+                        async with session.get(path, params=params) as response:
+                            await response.read()
+                            response.raise_for_status()
+                        samples.append((time.perf_counter() - request_started) * 1000)
+
+                for _ in range(args.warmup):
+                    await request()
+                samples.clear()
+                started = time.perf_counter()
+                await asyncio.gather(*(request() for _ in range(args.search_requests)))
+                elapsed = time.perf_counter() - started
+                results[name] = summarize(samples, len(samples), elapsed, "requests", path=path, params=params,
+                                          concurrency=args.search_concurrency, corpus=args.search_corpus)
+    finally:
+        server.should_exit = True
+        await server_task
+    return results
+
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any], threshold: float) -> List[str]:
+    """
+    기준 결과와 p95를 비교해 threshold(비율)보다 느려진 시나리오 목록을 반환합니다.
+    """
+    regressions = []
+    for name, current in results["scenarios"].items():
+        previous = baseline.get("scenarios", {}).get(name)
+        if not previous or not previous.get("p95_ms"):
+            continue
+        change = current["p95_ms"] / previous["p95_ms"] - 1
+        print(f"{name:40s} p95 {previous['p95_ms']:>10.2f}ms -> {current['p95_ms']:>10.2f}ms ({change:+.1%})")
+        if change > threshold:
+            regressions.append(name)
+    return regressions
+
+
+async def run_benchmarks(args) -> Dict[str, Any]:
+    generator = SyntheticArticleGenerator(seed=args.seed)
+    stub = NaverApiStub(args.latency_ms, args.latency_jitter_ms, args.total_results,
+                        args.throttle_rate, args.retry_after, args.seed)
+    stub_url = await stub.start()
+
+    # 저장소 모듈은 불러올 때 환경변수를 읽으므로 먼저 벤치마크용 값을 설정
+    database_name = args.database or f"news_bench_{uuid.uuid4().hex[:8]}"
+    os.environ.update({
+        "MONGO_URL": args.mongo_url,
+        "MONGO_DATABASE": database_name,
+        "NAVER_API_URL": stub_url,
+        "NAVER_BACKOFF_BASE": str(args.retry_after),
+        # 검색 시나리오에서 앱을 띄울 때 수집, 통계 재계산, 추이 재생성, 변경 스트림이
+        # 측정 중인 요청과 함께 돌지 않도록 끔
+        "INGEST_SCHEDULER_ENABLED": "false",
+        "STATS_RECONCILE_INTERVAL": "0",
+        "TRENDS_REBUILD_INTERVAL": "0",
+        "LIVE_FEED_SOURCE": "local"
+    })
+
+    results = {
+        "meta": {
+            "started_at": datetime.now().isoformat(),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "mongo_url": args.mongo_url,
+            "database": database_name,
+            "seed": args.seed,
+            "iterations": args.iterations,
+            "stub": stub.config()
+        },
+        "scenarios": {}
+    }
+    try:
+        from database_mongo import create_indexes
+        create_indexes()
+        for scenario in args.scenarios:
+            print(f"시나리오 실행 중: {scenario}")
+            if scenario == "fetch":
+                results["scenarios"].update(await bench_fetch(args, stub))
+            elif scenario == "save":
+                results["scenarios"].update(await bench_save(args, generator))
+            elif scenario == "sentiment":
+                results["scenarios"].update(await bench_sentiment(args, generator))
+            elif scenario == "search":
+                results["scenarios"].update(await bench_search(args, generator))
+    finally:
+        await stub.stop()
+        if not args.keep_db:
+            from database_mongo import get_mongo_client
+            get_mongo_client().drop_database(database_name)
+    results["meta"]["finished_at"] = datetime.now().isoformat()
+    return results
+
+
+def parse_args(argv: List[str] = None):
+    parser = argparse.ArgumentParser(
+        description="로컬 네이버 API 스텁과 일회용 MongoDB 데이터베이스로 수집·저장·감정분석·검색 성능을 측정합니다."
+    )
+    parser.add_argument("--scenarios", default=",".join(SCENARIOS),
+                        type=lambda value: [item for item in value.split(",") if item],
+                        help=f"실행할 시나리오 (쉼표 구분: {', '.join(SCENARIOS)})")
+    parser.add_argument("--iterations", type=int, default=5)
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help=f"결과 JSON 경로 (기본값: {RESULTS_DIR}/bench_<시각>.json)")
+    parser.add_argument("--baseline", help="비교할 이전 결과 JSON")
+    parser.add_argument("--regression-threshold", type=float, default=0.2,
+                        help="p95가 이 비율보다 느려지면 회귀로 보고 종료 코드 1을 반환")
+
+    mongo = parser.add_argument_group("MongoDB")
+    mongo.add_argument("--mongo-url", default=os.getenv("BENCH_MONGO_URL", "mongodb://localhost:27017"))
+    mongo.add_argument("--database", help="사용할 데이터베이스 이름 (기본값: news_bench_<임의값>)")
+    mongo.add_argument("--keep-db", action="store_true", help="끝난 뒤 벤치마크 데이터베이스를 지우지 않음")
+
+    stub = parser.add_argument_group("네이버 API 스텁")
+    stub.add_argument("--latency-ms", type=float, default=50.0)
+    stub.add_argument("--latency-jitter-ms", type=float, default=20.0)
+    stub.add_argument("--total-results", type=int, default=1000, help="키워드별 기사 수")
+    stub.add_argument("--throttle-rate", type=float, default=0.0, help="429를 돌려줄 확률 (0~1)")
+    stub.add_argument("--retry-after", type=float, default=0.05, help="429 응답의 Retry-After (초)")
+    stub.add_argument("--naver-rate", type=float, default=100.0, help="수집기 초당 호출 제한")
+
+    scenario = parser.add_argument_group("시나리오 설정")
+    scenario.add_argument("--fetch-max-results", type=int, default=1000)
+    scenario.add_argument("--save-batch-size", type=int, default=500)
+    scenario.add_argument("--sentiment-batch-sizes", default="100,1000,5000",
+                          type=lambda value: [int(item) for item in value.split(",") if item])
+    scenario.add_argument("--search-corpus", type=int, default=10000, help="검색 대상 기사 수")
+    scenario.add_argument("--search-requests", type=int, default=200, help="검색 종류별 요청 수")
+    scenario.add_argument("--search-concurrency", type=int, default=10)
+
+    args = parser.parse_args(argv)
+    unknown = [scenario for scenario in args.scenarios if scenario not in SCENARIOS]
+    if unknown:
+        parser.error(f"알 수 없는 시나리오: {', '.join(unknown)}")
+    return args
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    results = asyncio.run(run_benchmarks(args))
+
+    output = args.output or os.path.join(RESULTS_DIR, f"bench_{datetime.now().strftime('%Y%m%d%H%M%S')}.json")
+    os.makedirs(os.path.dirname(output) or ".", exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(results, f, ensure_ascii=False, indent=2)
+
+    for name, result in results["scenarios"].items():
+        print(f"{name:40s} p50 {result['p50_ms']:>10.2f}ms  p95 {result['p95_ms']:>10.2f}ms  "
+              f"p99 {result['p99_ms']:>10.2f}ms  {result['throughput']:>10.1f} {result['throughput_unit']}")
+    print(f"결과 저장: {output}")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            regressions = compare(results, json.load(f), args.regression_threshold)
+        if regressions:
+            print(f"성능 회귀: {', '.join(regressions)}")
+            sys.exit(1)
@@ -0,0 +1,2 @@
+# 저장소 루트의 모듈(pagination, search_index 등)을 tests/에서 바로 import할 수 있도록
+# 루트에 두는 pytest 설정 파일입니다.
@@ -0,0 +1,86 @@
+import json
+import os
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Union
+from dotenv import load_dotenv
+
+load_dotenv()
+
+COUNT_CACHE_TTL = float(os.getenv("COUNT_CACHE_TTL", "60"))
+COUNT_CACHE_SIZE = int(os.getenv("COUNT_CACHE_SIZE", "1000"))
+COUNT_ESTIMATE_CAP = int(os.getenv("COUNT_ESTIMATE_CAP", "1000"))
+
+# 검색 결과 수 계산 방식
+COUNT_MODES = ("exact", "cached", "estimated")
+
+
+class CountCache:
+    """
+    검색 결과 총 개수(total_count) 계산기입니다.
+
+    - exact: 매번 count_documents를 실행합니다.
+    - cached: 정규화한 쿼리별로 TTL 동안 결과를 재사용하고, 새 기사가 저장되면 비웁니다.
+    - estimated: cap개까지만 세고 넘으면 "1000+"처럼 반환합니다.
+    """
+
+    def __init__(self, ttl: float = COUNT_CACHE_TTL, max_size: int = COUNT_CACHE_SIZE,
+                 estimate_cap: int = COUNT_ESTIMATE_CAP):
+        self.ttl = ttl
+        self.max_size = max_size
+        self.estimate_cap = estimate_cap
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+
+    def _key(self, query: Dict[str, Any]) -> str:
+        return json.dumps(query, sort_keys=True, ensure_ascii=False, default=str)
+
+    async def count(self, collection, query: Dict[str, Any], mode: str = "exact") -> Union[int, str]:
+        if mode == "estimated":
+            return await self._estimate(collection, query)
+        if mode != "cached":
+            return await collection.count_documents(query)
+
+        key = self._key(query)
+        entry = self._entries.get(key)
+        if entry is not None and entry[1] > time.monotonic():
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return entry[0]
+
+        self.misses += 1
+        total = await collection.count_documents(query)
+        self._entries[key] = (total, time.monotonic() + self.ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+        return total
+
+    async def _estimate(self, collection, query: Dict[str, Any]) -> Union[int, str]:
+        if not query:
+            # 조건이 없으면 컬렉션 메타데이터로 추정
+            return await collection.estimated_document_count()
+        total = await collection.count_documents(query, limit=self.estimate_cap + 1)
+        return f"{self.estimate_cap}+" if total > self.estimate_cap else total
+
+    def invalidate(self):
+        self._entries.clear()
+
+    def on_articles_saved(self, docs: List[Dict[str, Any]]):
+        """
+        새 기사가 저장되면 캐시된 개수를 모두 버립니다.
+        """
+        if docs:
+            self.invalidate()
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "ttl_seconds": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0
+        }
@@ -1,8 +1,10 @@
 import os
 from motor.motor_asyncio import AsyncIOMotorClient
-from pymongo import MongoClient
+from pymongo import MongoClient, monitoring
+from pymongo.errors import OperationFailure
 from dotenv import load_dotenv
 import logging
+from metrics import histogram
 
 load_dotenv()
 
@@ -15,6 +17,64 @@ MONGO_URL = os.getenv("MONGO_URL", "mongodb://localhost:27017")
 DATABASE_NAME = os.getenv("MONGO_DATABASE", "news_collector")
 COLLECTION_NAME = os.getenv("MONGO_COLLECTION", "articles")
 
+# 보조 컬렉션 이름
+WATERMARK_COLLECTION_NAME = os.getenv("MONGO_WATERMARK_COLLECTION", "crawl_watermarks")
+# 네이버 API 일일 호출 수 (한국 날짜별 문서, 여러 프로세스가 함께 사용)
+API_QUOTA_COLLECTION_NAME = os.getenv("MONGO_API_QUOTA_COLLECTION", "api_quota")
+STATS_COLLECTION_NAME = os.getenv("MONGO_STATS_COLLECTION", "news_stats")
+TRENDS_COLLECTION_NAME = os.getenv("MONGO_TRENDS_COLLECTION", "sentiment_trends")
+SLOW_QUERY_COLLECTION_NAME = os.getenv("MONGO_SLOW_QUERY_COLLECTION", "slow_queries")
+# 여러 워커 중 한 곳에서만 주기 작업을 실행하기 위한 임대
+JOB_LEASE_COLLECTION_NAME = os.getenv("MONGO_JOB_LEASE_COLLECTION", "job_leases")
+
+# 느린 쿼리 기록 보관 기간 (마지막으로 관측된 뒤 이 일수가 지나면 삭제)
+SLOW_QUERY_RETENTION_DAYS = int(os.getenv("SLOW_QUERY_RETENTION_DAYS", "30"))
+
+# 제목·내용 텍스트 인덱스 (제목 일치에 가중치)
+TEXT_INDEX_NAME = "title_content_text"
+TEXT_INDEX_WEIGHTS = {
+    "title": int(os.getenv("MONGO_TEXT_WEIGHT_TITLE", "5")),
+    "content": int(os.getenv("MONGO_TEXT_WEIGHT_CONTENT", "1"))
+}
+
+# MongoDB 명령 실행 시간 (드라이버가 잰 서버 왕복 시간)
+MONGO_COMMAND_DURATION = histogram(
+    "mongo_command_duration_seconds", "MongoDB 명령 실행 시간", ("command", "collection", "status")
+)
+
+
+class CommandMetricsListener(monitoring.CommandListener):
+    """
+    드라이버의 명령 모니터링 이벤트로 MongoDB 명령별 실행 시간을 기록합니다.
+    동기·비동기 클라이언트 모두에 등록하므로 개별 쿼리 코드를 바꾸지 않아도 모든 명령이 집계됩니다.
+    """
+
+    def __init__(self):
+        self._collections = {}
+
+    def started(self, event):
+        target = event.command.get(event.command_name)
+        if event.command_name == "getMore":
+            target = event.command.get("collection")
+        self._collections[event.request_id] = target if isinstance(target, str) else ""
+
+    def _record(self, event, status: str):
+        MONGO_COMMAND_DURATION.observe(
+            event.duration_micros / 1e6,
+            command=event.command_name,
+            collection=self._collections.pop(event.request_id, ""),
+            status=status
+        )
+
+    def succeeded(self, event):
+        self._record(event, "ok")
+
+    def failed(self, event):
+        self._record(event, "error")
+
+
+command_metrics_listener = CommandMetricsListener()
+
 # MongoDB 클라이언트 (동기)
 mongo_client = None
 database = None
@@ -24,13 +84,14 @@ collection = None
 async_mongo_client = None
 async_database = None
 async_collection = None
+async_named_collections = {}
 
 def get_mongo_client():
     """동기 MongoDB 클라이언트를 반환합니다."""
     global mongo_client
     if mongo_client is None:
         try:
-            mongo_client = MongoClient(MONGO_URL)
+            mongo_client = MongoClient(MONGO_URL, event_listeners=[command_metrics_listener])
             logger.info(f"MongoDB 연결 성공: {MONGO_URL}")
         except Exception as e:
             logger.error(f"MongoDB 연결 실패: {e}")
@@ -58,7 +119,7 @@ async def get_async_mongo_client():
     global async_mongo_client
     if async_mongo_client is None:
         try:
-            async_mongo_client = AsyncIOMotorClient(MONGO_URL)
+            async_mongo_client = AsyncIOMotorClient(MONGO_URL, event_listeners=[command_metrics_listener])
             logger.info(f"비동기 MongoDB 연결 성공: {MONGO_URL}")
         except Exception as e:
             logger.error(f"비동기 MongoDB 연결 실패: {e}")
@@ -81,6 +142,28 @@ async def get_async_collection():
         async_collection = db[COLLECTION_NAME]
     return async_collection
 
+async def get_async_collection_by_name(name: str):
+    """이름으로 비동기 보조 컬렉션을 반환합니다."""
+    if name not in async_named_collections:
+        db = await get_async_database()
+        async_named_collections[name] = db[name]
+    return async_named_collections[name]
+
+def _ensure_text_index(collection):
+    """
+    가중치가 적용된 텍스트 인덱스를 만듭니다.
+    텍스트 인덱스는 컬렉션당 하나만 허용되므로 설정이 다른 기존 인덱스는 교체합니다.
+    """
+    keys = [("title", "text"), ("content", "text")]
+    try:
+        collection.create_index(keys, name=TEXT_INDEX_NAME, weights=TEXT_INDEX_WEIGHTS, default_language="none")
+    except OperationFailure:
+        for index in collection.list_indexes():
+            if "textIndexVersion" in index:
+                logger.info(f"기존 텍스트 인덱스 교체: {index['name']}")
+                collection.drop_index(index["name"])
+        collection.create_index(keys, name=TEXT_INDEX_NAME, weights=TEXT_INDEX_WEIGHTS, default_language="none")
+
 def create_indexes():
     """컬렉션에 인덱스를 생성합니다."""
     try:
@@ -91,18 +174,40 @@ def create_indexes():
         
         # 날짜 기반 검색 인덱스
         collection.create_index("published_at")
+        # 커서 페이지네이션 정렬용 (published_at, _id)
+        collection.create_index([("published_at", -1), ("_id", -1)])
         collection.create_index("created_at")
         
         # 감정 분석 인덱스
         collection.create_index("sentiment")
+        # 감정 필터 + 최신순 정렬 (/news/db, /news/search의 sentiment 조건)
+        collection.create_index([("sentiment.sentiment", 1), ("published_at", -1), ("_id", -1)])
         
         # 텍스트 검색 인덱스 (제목과 내용)
-        collection.create_index([("title", "text"), ("content", "text")])
+        _ensure_text_index(collection)
         
+        # 제목·내용 n-gram 역색인 (search_index.SEARCH_GRAM_FIELD)
+        collection.create_index("search_grams")
+
+        # 거의 같은 기사 탐지용 SimHash LSH 구간 키와 묶음 (near_duplicate)
+        collection.create_index("simhash_bands")
+        collection.create_index("cluster_id")
+
         # 개별 필드 인덱스 (정규식 검색용)
         collection.create_index("title")
         collection.create_index("content")
         
+        # 감정 추이 구간 조회용 (단위, 범위, 구간 시작)
+        trends = get_database()[TRENDS_COLLECTION_NAME]
+        trends.create_index([("granularity", 1), ("scope", 1), ("bucket", 1)])
+        # 마지막 재생성 시각 확인과 이전 구간 문서 정리용
+        trends.create_index("rebuilt_at")
+        
+        # 느린 쿼리 모양별 기록 (오래 관측되지 않은 모양은 TTL로 삭제)
+        slow_queries = get_database()[SLOW_QUERY_COLLECTION_NAME]
+        slow_queries.create_index("last_seen_at", expireAfterSeconds=SLOW_QUERY_RETENTION_DAYS * 86400)
+        slow_queries.create_index([("max_ms", -1)])
+        
         logger.info("MongoDB 인덱스 생성 완료")
     except Exception as e:
         logger.error(f"인덱스 생성 실패: {e}")
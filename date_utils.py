@@ -0,0 +1,58 @@
+import os
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# 마이그레이션이 끝나기 전까지 문자열로 저장된 published_at도 날짜 조건에 포함
+PUBLISHED_AT_LEGACY_STRINGS = os.getenv("PUBLISHED_AT_LEGACY_STRINGS", "true").lower() == "true"
+
+# 문자열·날짜 어느 쪽으로 저장된 published_at이든 날짜로 변환하는 집계 식 (실패하면 null)
+PUBLISHED_AT_AS_DATE = {"$convert": {"input": "$published_at", "to": "date", "onError": None, "onNull": None}}
+
+
+def to_utc_datetime(value: Any) -> Optional[datetime]:
+    """
+    ISO 문자열 또는 datetime을 UTC 기준의 naive datetime으로 변환합니다.
+    MongoDB는 datetime을 UTC로 저장하고 naive로 돌려주므로 같은 형태로 맞춥니다.
+    시간대가 없는 값은 UTC로 간주하며, 변환할 수 없으면 None을 반환합니다.
+    """
+    if isinstance(value, str):
+        try:
+            value = datetime.fromisoformat(value.strip().replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    if not isinstance(value, datetime):
+        return None
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def utc_now() -> datetime:
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def published_at_filter(start: Optional[datetime] = None, end: Optional[datetime] = None) -> Dict[str, Any]:
+    """
+    published_at이 [start, end] 범위인 기사를 찾는 조건을 만듭니다. start, end는 UTC 기준입니다.
+    PUBLISHED_AT_LEGACY_STRINGS가 켜져 있으면 아직 문자열인 문서도 날짜로 변환해 같은 범위로 비교합니다.
+    """
+    date_range = {}
+    converted = [{"$eq": [{"$type": PUBLISHED_AT_AS_DATE}, "date"]}]
+    if start is not None:
+        date_range["$gte"] = start
+        converted.append({"$gte": [PUBLISHED_AT_AS_DATE, start]})
+    if end is not None:
+        date_range["$lte"] = end
+        converted.append({"$lte": [PUBLISHED_AT_AS_DATE, end]})
+
+    if not date_range:
+        return {}
+    if not PUBLISHED_AT_LEGACY_STRINGS:
+        return {"published_at": date_range}
+    # "+09:00"처럼 시간대가 붙은 문자열은 문자열 순서로 비교하면 시간대만큼 어긋나므로 변환한 시각으로 비교
+    # (문자열 문서만 $type 조건으로 먼저 골라 $expr 계산 대상을 줄임)
+    legacy = {"published_at": {"$type": "string"}, "$expr": {"$and": converted}}
+    return {"$or": [{"published_at": date_range}, legacy]}
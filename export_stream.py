@@ -0,0 +1,94 @@
+import csv
+import io
+import logging
+import os
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, Optional
+from dotenv import load_dotenv
+from pagination import PAGE_SORT
+from search_index import ARTICLE_PROJECTION
+from json_encoding import dumps_str
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+load_dotenv()
+
+# MongoDB 커서가 한 번에 가져오는 문서 수
+EXPORT_BATCH_SIZE = int(os.getenv("EXPORT_BATCH_SIZE", "1000"))
+# 응답으로 한 번에 내보내는 문서 수
+EXPORT_CHUNK_SIZE = int(os.getenv("EXPORT_CHUNK_SIZE", "200"))
+
+EXPORT_FORMATS = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8"
+}
+
+CSV_COLUMNS = [
+    "_id", "title", "content", "url", "published_at",
+    "sentiment", "confidence", "positive_score", "negative_score", "neutral_score",
+    "created_at", "updated_at"
+]
+
+
+def _csv_row(doc: Dict[str, Any]) -> list:
+    sentiment = doc.get("sentiment") or {}
+    row = {
+        **doc,
+        "sentiment": sentiment.get("sentiment"),
+        "confidence": sentiment.get("confidence"),
+        "positive_score": sentiment.get("positive_score"),
+        "negative_score": sentiment.get("negative_score"),
+        "neutral_score": sentiment.get("neutral_score")
+    }
+    values = []
+    for column in CSV_COLUMNS:
+        value = row.get(column)
+        if isinstance(value, datetime):
+            value = value.isoformat()
+        values.append("" if value is None else value)
+    return values
+
+
+async def stream_articles(collection, query: Dict[str, Any], export_format: str = "ndjson",
+                          limit: Optional[int] = None) -> AsyncIterator[str]:
+    """
+    조건에 맞는 기사를 최신순으로 읽으면서 NDJSON 또는 CSV 조각을 차례로 내보냅니다.
+    커서에서 batch_size개씩 받아 EXPORT_CHUNK_SIZE개마다 내보내므로 결과 크기와 관계없이 메모리 사용량이 일정합니다.
+    """
+    cursor = collection.find(query, ARTICLE_PROJECTION).sort(PAGE_SORT).batch_size(EXPORT_BATCH_SIZE)
+    if limit:
+        cursor = cursor.limit(limit)
+
+    buffer = io.StringIO()
+    writer = None
+    if export_format == "csv":
+        writer = csv.writer(buffer)
+        writer.writerow(CSV_COLUMNS)
+
+    exported = 0
+    pending = 0
+    try:
+        async for doc in cursor:
+            if writer is not None:
+                writer.writerow(_csv_row(doc))
+            else:
+                buffer.write(dumps_str(doc))
+                buffer.write("\n")
+            exported += 1
+            pending += 1
+            if pending >= EXPORT_CHUNK_SIZE:
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate()
+                pending = 0
+        if buffer.tell():
+            yield buffer.getvalue()
+    except Exception as e:
+        # 응답이 이미 시작되어 상태 코드를 바꿀 수 없으므로 기록만 남김
+        logger.error(f"기사 내보내기 실패 ({exported}개 전송 후): {str(e)}")
+        raise
+    finally:
+        await cursor.close()
+    logger.info(f"기사 내보내기 완료: {exported}개 ({export_format})")
@@ -0,0 +1,227 @@
+import asyncio
+import json
+import logging
+import os
+import uuid
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from dotenv import load_dotenv
+from stats_rollup import acquire_lease
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+load_dotenv()
+
+# 워커마다 스케줄러가 돌지만 예약 실행은 그룹별 작업 임대를 가진 한 워커에서만 수집함
+INGEST_SCHEDULER_ENABLED = os.getenv("INGEST_SCHEDULER_ENABLED", "true").lower() == "true"
+INGEST_JOB_HISTORY = int(os.getenv("INGEST_JOB_HISTORY", "100"))
+
+# 키워드 그룹별 수집 주기. INGEST_SCHEDULES에 같은 형식의 JSON 목록을 넣어 바꿀 수 있습니다.
+DEFAULT_SCHEDULES = [
+    {
+        "name": "kwater",
+        "queries": ["kwater OR 한국수자원공사", "한국수자원공사", "K-water", "수자원공사"],
+        "interval_minutes": 30,
+        "jitter_seconds": 120,
+        "max_results": 200
+    },
+    {
+        "name": "water-industry",
+        "queries": ["물관리", "댐", "수도", "상수도", "하수도", "물산업"],
+        "interval_minutes": 180,
+        "jitter_seconds": 600,
+        "max_results": 300
+    }
+]
+
+
+def load_schedules() -> List[Dict[str, Any]]:
+    raw = os.getenv("INGEST_SCHEDULES")
+    return json.loads(raw) if raw else DEFAULT_SCHEDULES
+
+
+class IngestionScheduler:
+    """
+    collect_and_save_news를 키워드 그룹별 주기로 실행하고, 수동 수집 요청을 작업으로 받아 백그라운드에서 실행합니다.
+
+    - 네이버 API 한도를 함께 쓰므로 수집은 한 번에 하나씩만 실행합니다.
+    - 예약 실행은 그룹별 작업 임대(수집 주기 동안 유효)를 얻은 워커에서만 실행되어 여러 워커가 같은 그룹을 중복 수집하지 않습니다.
+    - 같은 그룹이 이미 대기 중이거나 실행 중이면 예약 실행과 수동 그룹 실행은 건너뜁니다.
+    - 최근 작업 INGEST_JOB_HISTORY개의 상태(queued, running, success, error, skipped)를 보관합니다.
+    """
+
+    def __init__(self, news_collector, sentiment_analyzer=None, schedules: List[Dict[str, Any]] = None):
+        self.news_collector = news_collector
+        self.sentiment_analyzer = sentiment_analyzer
+        self.schedules = {schedule["name"]: schedule for schedule in (schedules or load_schedules())}
+        self.scheduler = AsyncIOScheduler(timezone="UTC")
+        self._run_lock = asyncio.Lock()
+        # 그룹별 대기 중이거나 실행 중인 작업 ID
+        self._active_groups: Dict[str, str] = {}
+        self._jobs: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._tasks = set()
+
+    def start(self):
+        for name, schedule in self.schedules.items():
+            self.scheduler.add_job(
+                self._run_scheduled,
+                "interval",
+                args=[name],
+                id=name,
+                minutes=schedule.get("interval_minutes", 60),
+                jitter=schedule.get("jitter_seconds", 0),
+                max_instances=1,
+                coalesce=True
+            )
+        self.scheduler.start()
+        logger.info(f"수집 스케줄러 시작: {', '.join(self.schedules)}")
+
+    async def stop(self):
+        if self.scheduler.running:
+            self.scheduler.shutdown(wait=False)
+        # 실행 중인 수집 작업이 취소를 처리하고 끝날 때까지 기다림
+        tasks = list(self._tasks)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _new_job(self, kind: str, group: Optional[str], params: Dict[str, Any]) -> Dict[str, Any]:
+        job = {
+            "job_id": uuid.uuid4().hex,
+            "kind": kind,
+            "group": group,
+            "params": params,
+            "status": "queued",
+            "created_at": datetime.now(),
+            "started_at": None,
+            "finished_at": None,
+            "result": None
+        }
+        self._jobs[job["job_id"]] = job
+        while len(self._jobs) > INGEST_JOB_HISTORY:
+            self._jobs.popitem(last=False)
+        return job
+
+    async def _execute(self, job: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        실행 잠금을 얻은 뒤 수집을 실행하고 작업 상태를 갱신합니다.
+        """
+        # 예약 실행도 stop()에서 취소하고 기다릴 수 있도록 실행 중인 태스크를 등록
+        task = asyncio.current_task()
+        self._tasks.add(task)
+        try:
+            async with self._run_lock:
+                job["status"] = "running"
+                job["started_at"] = datetime.now()
+                result = await self.news_collector.collect_and_save_news(
+                    sentiment_analyzer=self.sentiment_analyzer,
+                    **job["params"]
+                )
+            job["result"] = result
+            job["status"] = "success" if result.get("status") == "success" else "error"
+        except asyncio.CancelledError:
+            job["status"] = "cancelled"
+            raise
+        except Exception as e:
+            logger.error(f"수집 작업 실패 ({job['job_id']}): {str(e)}")
+            job["result"] = {"status": "error", "message": str(e)}
+            job["status"] = "error"
+        finally:
+            job["finished_at"] = datetime.now()
+            self._tasks.discard(task)
+            # 같은 그룹의 다른 작업이 등록되어 있으면 그대로 둠
+            if job["group"] and self._active_groups.get(job["group"]) == job["job_id"]:
+                del self._active_groups[job["group"]]
+        return job
+
+    def _group_params(self, name: str) -> Dict[str, Any]:
+        schedule = self.schedules[name]
+        return {
+            "queries": schedule["queries"],
+            "max_results": schedule.get("max_results", 100),
+            "concurrent": schedule.get("concurrent", True),
+            "incremental": schedule.get("incremental", True),
+            "bulk": schedule.get("bulk", True)
+        }
+
+    def _skipped_job(self, kind: str, name: str) -> Dict[str, Any]:
+        """
+        그룹이 이미 대기 중이거나 실행 중이라 건너뛴 실행을 기록합니다.
+        """
+        job = self._new_job(kind, name, self._group_params(name))
+        job["status"] = "skipped"
+        job["finished_at"] = datetime.now()
+        job["result"] = {"status": "skipped", "active_job_id": self._active_groups[name]}
+        logger.info(f"수집 그룹 {name}이(가) 아직 실행 중이라 이번 {kind} 실행을 건너뜁니다.")
+        return job
+
+    async def _run_scheduled(self, name: str):
+        if name in self._active_groups:
+            self._skipped_job("scheduled", name)
+            return
+        try:
+            if not await acquire_lease(f"ingest:{name}", self.schedules[name].get("interval_minutes", 60) * 60):
+                logger.debug(f"수집 그룹 {name}은(는) 다른 워커가 수집하므로 건너뜁니다.")
+                return
+        except Exception as e:
+            logger.error(f"수집 그룹 {name}의 작업 임대 확인 실패: {str(e)}")
+            return
+        job = self._new_job("scheduled", name, self._group_params(name))
+        self._active_groups[name] = job["job_id"]
+        await self._execute(job)
+
+    def enqueue(self, params: Dict[str, Any], group: Optional[str] = None) -> Dict[str, Any]:
+        """
+        수집 작업을 백그라운드에 넣고 바로 작업 정보를 반환합니다.
+        """
+        job = self._new_job("manual", group, params)
+        if group:
+            self._active_groups[group] = job["job_id"]
+        task = asyncio.create_task(self._execute(job))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return job
+
+    def enqueue_group(self, name: str) -> Dict[str, Any]:
+        """
+        그룹 수집 작업을 등록합니다. 같은 그룹이 대기 중이거나 실행 중이면 건너뛴 작업을 반환합니다.
+        """
+        if name not in self.schedules:
+            raise KeyError(name)
+        if name in self._active_groups:
+            return self._skipped_job("manual", name)
+        return self.enqueue(self._group_params(name), group=name)
+
+    async def run_now(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        수집 작업을 등록하고 끝날 때까지 기다립니다.
+        """
+        return await self._execute(self._new_job("manual", None, params))
+
+    def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        return self._jobs.get(job_id)
+
+    def list_jobs(self, limit: int = 20) -> List[Dict[str, Any]]:
+        return list(reversed(self._jobs.values()))[:limit]
+
+    def status(self) -> Dict[str, Any]:
+        groups = []
+        for name, schedule in self.schedules.items():
+            scheduled_job = self.scheduler.get_job(name) if self.scheduler.running else None
+            groups.append({
+                "name": name,
+                "queries": schedule["queries"],
+                "interval_minutes": schedule.get("interval_minutes", 60),
+                "jitter_seconds": schedule.get("jitter_seconds", 0),
+                "active": name in self._active_groups,
+                "next_run_time": scheduled_job.next_run_time if scheduled_job else None
+            })
+        return {
+            "running": self.scheduler.running,
+            "busy": self._run_lock.locked(),
+            "groups": groups
+        }
@@ -0,0 +1,43 @@
+from datetime import date, datetime
+from typing import Any
+import orjson
+from bson import ObjectId
+from fastapi.responses import JSONResponse
+
+# orjson은 datetime·date·numpy 값을 직접 직렬화하고, ObjectId 같은 BSON 타입만 json_default로 넘김
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+def json_default(value: Any):
+    """
+    MongoDB 문서의 ObjectId와 날짜를 JSON 값으로 바꿉니다. orjson과 표준 json 모듈 모두의 default로 쓸 수 있습니다.
+    """
+    if isinstance(value, ObjectId):
+        return str(value)
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    raise TypeError(f"JSON으로 변환할 수 없는 값입니다: {type(value).__name__}")
+
+
+def dumps(content: Any) -> bytes:
+    """
+    MongoDB 문서를 그대로 UTF-8 JSON 바이트로 직렬화합니다. 날짜는 isoformat()과 같은 형식이 됩니다.
+    """
+    return orjson.dumps(content, default=json_default, option=ORJSON_OPTIONS)
+
+
+def dumps_str(content: Any) -> str:
+    return dumps(content).decode("utf-8")
+
+
+class MongoJSONResponse(JSONResponse):
+    """
+    orjson으로 직렬화하는 JSON 응답입니다.
+
+    엔드포인트가 이 응답을 직접 반환하면 FastAPI의 jsonable_encoder를 거치지 않으므로
+    조회한 문서를 _id 문자열 변환이나 날짜 변환 없이 그대로 넘기면 됩니다.
+    """
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
@@ -0,0 +1,97 @@
+from collections import deque
+from typing import Dict, Iterable, List, Set
+
+
+class KeywordAutomaton:
+    """
+    여러 키워드를 텍스트 한 번 순회로 찾는 Aho-Corasick 오토마톤입니다.
+    탐색 비용은 키워드 수와 무관하게 텍스트 길이에 비례합니다.
+    """
+
+    def __init__(self, keywords: Iterable[str]):
+        # 중복 키워드는 하나로 합치고 처음 등장한 순서를 유지
+        self.keywords: List[str] = list(dict.fromkeys(keywords))
+
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[tuple] = [()]
+        # 빈 문자열 키워드는 모든 텍스트에 포함된 것으로 취급 ('' in text)
+        self._always: Set[int] = set()
+
+        for keyword_id, keyword in enumerate(self.keywords):
+            if not keyword:
+                self._always.add(keyword_id)
+                continue
+            self._insert(keyword, keyword_id)
+
+        self._build_failure_links()
+        self._build_transitions()
+
+    def _insert(self, keyword: str, keyword_id: int):
+        state = 0
+        for char in keyword:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append(())
+            state = next_state
+        self._output[state] = self._output[state] + (keyword_id,)
+
+    def _build_failure_links(self):
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[next_state] = target if target != next_state else 0
+                # 실패 링크가 가리키는 상태의 출력도 함께 보고
+                self._output[next_state] = self._output[next_state] + self._output[self._fail[next_state]]
+
+    def _build_transitions(self):
+        """
+        실패 링크를 미리 따라가 상태별 전이표를 만듭니다.
+        루트의 전이는 모든 상태가 공유하므로 각 상태의 표에는 넣지 않습니다.
+        """
+        self._transitions: List[Dict[str, int]] = [{} for _ in self._goto]
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            queue.extend(self._goto[state].values())
+            fallback = self._fail[state]
+            if fallback:
+                inherited = dict(self._transitions[fallback])
+                inherited.update(self._goto[state])
+                self._transitions[state] = inherited
+            else:
+                self._transitions[state] = dict(self._goto[state])
+
+    def find_ids(self, text: str) -> Set[int]:
+        """
+        텍스트에 포함된 키워드의 인덱스(self.keywords 기준) 집합을 반환합니다.
+        """
+        found = set(self._always)
+        transitions = self._transitions
+        root = self._goto[0]
+        output = self._output
+        state = 0
+        for char in text:
+            next_state = transitions[state].get(char)
+            if next_state is None:
+                next_state = root.get(char, 0)
+            state = next_state
+            if output[state]:
+                found.update(output[state])
+        return found
+
+    def find(self, text: str) -> Set[str]:
+        """
+        텍스트에 포함된 키워드 집합을 반환합니다.
+        """
+        return {self.keywords[keyword_id] for keyword_id in self.find_ids(text)}
@@ -0,0 +1,143 @@
+import asyncio
+import logging
+import os
+from typing import Any, AsyncIterator, Dict, List, Optional
+from dotenv import load_dotenv
+from database_mongo import get_async_collection
+from json_encoding import dumps_str
+from search_index import ARTICLE_PROJECTION
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+load_dotenv()
+
+# local: 이 프로세스의 저장 알림으로 방송, change_stream: MongoDB 변경 스트림으로 방송 (여러 워커가 같은 피드를 공유)
+LIVE_FEED_SOURCE = os.getenv("LIVE_FEED_SOURCE", "local")
+LIVE_FEED_QUEUE_SIZE = int(os.getenv("LIVE_FEED_QUEUE_SIZE", "100"))
+LIVE_FEED_HEARTBEAT = float(os.getenv("LIVE_FEED_HEARTBEAT", "15"))
+LIVE_FEED_RETRY_DELAY = float(os.getenv("LIVE_FEED_RETRY_DELAY", "5"))
+
+LIVE_FEED_SOURCES = ("local", "change_stream")
+
+
+def _event_payload(doc: Dict[str, Any]) -> Dict[str, Any]:
+    return {key: value for key, value in doc.items() if key not in ARTICLE_PROJECTION}
+
+
+class _Subscriber:
+    def __init__(self, keyword: Optional[str], sentiment: Optional[str]):
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=LIVE_FEED_QUEUE_SIZE)
+        self.keyword = keyword.lower() if keyword else None
+        self.sentiment = sentiment
+        self.dropped = 0
+
+    def accepts(self, doc: Dict[str, Any]) -> bool:
+        if self.sentiment and (doc.get("sentiment") or {}).get("sentiment") != self.sentiment:
+            return False
+        if self.keyword:
+            text = f"{doc.get('title') or ''}\n{doc.get('content') or ''}".lower()
+            return self.keyword in text
+        return True
+
+    def offer(self, event: str):
+        """
+        큐가 가득 찬 느린 클라이언트는 가장 오래된 이벤트를 버리고 새 이벤트를 받습니다.
+        """
+        if self.queue.full():
+            self.queue.get_nowait()
+            self.dropped += 1
+        self.queue.put_nowait(event)
+
+
+class LiveFeed:
+    """
+    새로 저장된 기사를 구독자들에게 server-sent events로 방송합니다.
+
+    기사는 한 번만 직렬화해 모든 구독자 큐에 넣으므로 구독자가 늘어도 API 호출이나 컬렉션 조회가 늘지 않습니다.
+    """
+
+    def __init__(self, source: str = LIVE_FEED_SOURCE):
+        if source not in LIVE_FEED_SOURCES:
+            raise ValueError(f"LIVE_FEED_SOURCE는 {', '.join(LIVE_FEED_SOURCES)} 중 하나여야 합니다: {source}")
+        self.source = source
+        self._subscribers: List[_Subscriber] = []
+        self._task = None
+        self.published = 0
+
+    def publish(self, doc: Dict[str, Any]):
+        payload = _event_payload(doc)
+        event = f"id: {payload.get('_id', '')}\nevent: article\ndata: {dumps_str(payload)}\n\n"
+        for subscriber in self._subscribers:
+            if subscriber.accepts(payload):
+                subscriber.offer(event)
+        self.published += 1
+
+    def on_articles_saved(self, docs: List[Dict[str, Any]]):
+        """
+        저장 알림으로 받은 기사를 방송합니다. 변경 스트림을 쓰는 경우에는 중복되지 않도록 무시합니다.
+        """
+        if self.source != "local":
+            return
+        for doc in docs:
+            self.publish(doc)
+
+    async def _watch_change_stream(self):
+        """
+        기사 컬렉션의 insert 이벤트를 따라가며 방송합니다. 연결이 끊기면 resume token으로 이어서 받습니다.
+        """
+        pipeline = [
+            {"$match": {"operationType": "insert"}},
+            {"$project": {f"fullDocument.{field}": 0 for field in ARTICLE_PROJECTION}}
+        ]
+        resume_token = None
+        while True:
+            try:
+                collection = await get_async_collection()
+                async with collection.watch(pipeline, resume_after=resume_token) as stream:
+                    async for change in stream:
+                        resume_token = stream.resume_token
+                        self.publish(change["fullDocument"])
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"변경 스트림 오류, {LIVE_FEED_RETRY_DELAY}초 후 재연결: {str(e)}")
+                await asyncio.sleep(LIVE_FEED_RETRY_DELAY)
+
+    def start(self):
+        if self.source == "change_stream" and self._task is None:
+            self._task = asyncio.create_task(self._watch_change_stream())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def subscribe(self, keyword: Optional[str] = None, sentiment: Optional[str] = None) -> AsyncIterator[str]:
+        """
+        SSE 형식의 이벤트를 차례로 내보냅니다. 이벤트가 없으면 주기적으로 heartbeat 주석을 보내 연결을 유지합니다.
+        """
+        subscriber = _Subscriber(keyword, sentiment)
+        self._subscribers.append(subscriber)
+        try:
+            yield f"retry: {int(LIVE_FEED_RETRY_DELAY * 1000)}\n\n"
+            while True:
+                try:
+                    yield await asyncio.wait_for(subscriber.queue.get(), timeout=LIVE_FEED_HEARTBEAT)
+                except asyncio.TimeoutError:
+                    yield ": heartbeat\n\n"
+        finally:
+            self._subscribers.remove(subscriber)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "source": self.source,
+            "subscribers": len(self._subscribers),
+            "published": self.published,
+            "dropped": sum(subscriber.dropped for subscriber in self._subscribers)
+        }
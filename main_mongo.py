@@ -1,22 +1,44 @@
 from fastapi import FastAPI, HTTPException, Depends
+from fastapi.responses import StreamingResponse, Response
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 import asyncio
 from news_collector_mongo import NewsCollectorMongo
 from simple_sentiment_analyzer import SimpleSentimentAnalyzer
+from sentiment_cache import SentimentCache
 from database_mongo import get_async_collection, get_collection, create_indexes
+from pagination import find_page, decode_cursor
+from date_utils import to_utc_datetime, utc_now, published_at_filter
+from count_cache import CountCache, COUNT_MODES
+from stats_rollup import StatsRollup
+from trend_rollup import TrendRollup, TREND_GRANULARITIES
+from export_stream import stream_articles, EXPORT_FORMATS
+from live_feed import LiveFeed
+from ingestion_scheduler import IngestionScheduler, INGEST_SCHEDULER_ENABLED
+from near_duplicate import CANONICAL_FILTER
+from metrics import REGISTRY, CONTENT_TYPE, MetricsMiddleware, register_callback
+from json_encoding import MongoJSONResponse
+from query_profiler import StageTimer, SlowQueryLog, explain_query, query_shape, SLOW_QUERY_SORTS, EXPLAIN_STAGE
+from search_index import (keyword_filter, text_search_filter, find_ranked_page, find_text_page,
+                          parse_fields, article_projection, RESPONSE_VIEWS, SEARCH_MODES, SEARCH_SORTS)
 from typing import List, Dict, Any
 import uvicorn
 from datetime import datetime, timedelta
 from bson import ObjectId
 import json
 
+# 일괄 감정분석 프로세스 풀(spawn)의 작업자는 sentiment_worker 모듈만 필요하지만,
+# python main_mongo.py로 실행하면 spawn이 실행 스크립트인 이 파일을 __mp_main__으로 다시 불러옴.
+# 그 경우 MongoDB에 접속하는 인덱스 생성은 건너뜀 (uvicorn main_mongo:app으로 실행하면 불러오지 않음)
+IS_POOL_WORKER = __name__ == "__mp_main__"
+
 # MongoDB 인덱스 생성
-try:
-    create_indexes()
-    print("MongoDB 인덱스 생성 완료!")
-except Exception as e:
-    print(f"MongoDB 인덱스 생성 실패: {e}")
+if not IS_POOL_WORKER:
+    try:
+        create_indexes()
+        print("MongoDB 인덱스 생성 완료!")
+    except Exception as e:
+        print(f"MongoDB 인덱스 생성 실패: {e}")
 
 # Pydantic 모델 정의
 class SentimentRequest(BaseModel):
@@ -28,8 +50,13 @@ class SentimentBatchRequest(BaseModel):
 class NewsCollectionRequest(BaseModel):
     query: str = "kwater OR 한국수자원공사"
     max_results: int = 100
+    concurrent: bool = False
+    incremental: bool = False
+    bulk: bool = False
+    wait: bool = False
 
-app = FastAPI(title="News Collector API (MongoDB)", description="MongoDB 기반 네이버 뉴스 수집 API")
+app = FastAPI(title="News Collector API (MongoDB)", description="MongoDB 기반 네이버 뉴스 수집 API",
+              default_response_class=MongoJSONResponse)
 
 # CORS 설정
 app.add_middleware(
@@ -40,25 +67,234 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# NewsCollector 인스턴스 생성
-news_collector = NewsCollectorMongo()
+# 라우트별 요청 처리 시간 (/metrics)
+app.add_middleware(MetricsMiddleware)
+
+# NewsCollector 인스턴스 생성 (인덱스는 위에서 생성)
+news_collector = NewsCollectorMongo(ensure_indexes=False)
+
+# 검색 결과 수 캐시 (새 기사가 저장되면 무효화)
+count_cache = CountCache()
+news_collector.add_save_listener(count_cache.on_articles_saved)
+
+# 통계 집계 (저장 시 증분 갱신, 주기적으로 재계산)
+stats_rollup = StatsRollup()
+news_collector.add_save_listener(stats_rollup.on_articles_saved)
+
+# 감정 추이 시간 구간 집계
+trend_rollup = TrendRollup()
+news_collector.add_save_listener(trend_rollup.on_articles_saved)
+
+# 새로 저장된 기사 실시간 방송 (SSE)
+live_feed = LiveFeed()
+news_collector.add_save_listener(live_feed.on_articles_saved)
 
 # SentimentAnalyzer 인스턴스 생성
 sentiment_analyzer = None
+sentiment_cache = None
 sentiment_available = False
 
 # 간단한 규칙 기반 감정분석 모델 로딩
 try:
     print("감정분석 모델을 로딩 중입니다...")
     sentiment_analyzer = SimpleSentimentAnalyzer()
+    # 같은 기사를 반복해서 분석하지 않도록 결과 캐시를 앞에 둠
+    sentiment_cache = SentimentCache(sentiment_analyzer)
     sentiment_available = True
     print("감정분석 모델 로딩 완료!")
 except Exception as e:
     print(f"감정분석 모델 로딩 실패: {e}")
     print("감정분석 기능 없이 서버를 시작합니다.")
     sentiment_analyzer = None
+    sentiment_cache = None
     sentiment_available = False
 
+# 뉴스 수집 스케줄러 (키워드 그룹별 주기 수집, 수동 수집 작업 관리)
+ingestion_scheduler = IngestionScheduler(news_collector, sentiment_cache)
+
+# 느린 검색 쿼리 모양별 기록
+slow_query_log = SlowQueryLog()
+
+def cache_lookup_counts() -> Dict[tuple, int]:
+    """
+    캐시별 적중·실패 수를 /metrics에 노출합니다. 값은 각 캐시가 이미 세고 있는 카운터를 조회 시점에 읽습니다.
+    """
+    counts = {("count", "hit"): count_cache.hits, ("count", "miss"): count_cache.misses}
+    if sentiment_cache:
+        counts.update({
+            ("sentiment", "hit"): sentiment_cache.hits,
+            ("sentiment", "miss"): sentiment_cache.misses,
+            ("sentiment", "stored_hit"): sentiment_cache.stored_hits
+        })
+    return counts
+
+def rate_limiter_counts() -> Dict[tuple, int]:
+    limiter = news_collector.rate_limiter
+    return {("throttled",): limiter.throttled_count, ("backoff",): limiter.backoff_count}
+
+register_callback("cache_lookups_total", "캐시 조회 수", "counter", ("cache", "result"), cache_lookup_counts)
+register_callback("naver_rate_limiter_events_total", "네이버 API 호출 제한기 대기·일시정지 수", "counter",
+                  ("event",), rate_limiter_counts)
+register_callback("live_feed_subscribers", "실시간 피드 구독자 수", "gauge", (),
+                  lambda: {(): live_feed.stats()["subscribers"]})
+
+def validate_cursor(cursor: str):
+    """
+    페이지 커서 형식을 검사하고 잘못되었으면 400 오류를 발생시킵니다.
+    """
+    if cursor:
+        try:
+            decode_cursor(cursor)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+def parse_date_param(name: str, value: str):
+    """
+    날짜 쿼리 파라미터를 UTC datetime으로 변환하고 잘못되었으면 400 오류를 발생시킵니다.
+    """
+    if not value:
+        return None
+    parsed = to_utc_datetime(value)
+    if parsed is None:
+        raise HTTPException(status_code=400, detail=f"{name}은(는) ISO 8601 날짜 형식이어야 합니다: {value}")
+    return parsed
+
+def add_condition(query: Dict[str, Any], condition: Dict[str, Any]):
+    """
+    최상위 $or 등이 겹치지 않도록 조건을 $and로 덧붙입니다.
+    """
+    if condition:
+        query.setdefault("$and", []).append(condition)
+
+def validate_count_mode(count_mode: str):
+    if count_mode not in COUNT_MODES:
+        raise HTTPException(status_code=400, detail=f"count_mode는 {', '.join(COUNT_MODES)} 중 하나여야 합니다.")
+
+def resolve_search_options(mode: str, sort: str, cursor: str) -> str:
+    """
+    검색 방식과 정렬 방식을 검사하고 실제로 사용할 정렬 방식을 반환합니다.
+    sort를 지정하지 않으면 fulltext는 관련도순, substring은 최신순입니다.
+    """
+    if mode not in SEARCH_MODES:
+        raise HTTPException(status_code=400, detail=f"mode는 {', '.join(SEARCH_MODES)} 중 하나여야 합니다.")
+    if sort is None:
+        sort = "relevance" if mode == "fulltext" else "recent"
+    if sort not in SEARCH_SORTS:
+        raise HTTPException(status_code=400, detail=f"sort는 {', '.join(SEARCH_SORTS)} 중 하나여야 합니다.")
+    if sort == "relevance" and cursor:
+        raise HTTPException(status_code=400, detail="관련도 정렬에서는 cursor 대신 offset을 사용하세요.")
+    return sort
+
+def resolve_projection(view: str, fields: str) -> Dict[str, Any]:
+    """
+    view와 fields 파라미터를 검사하고 목록 조회에 쓸 MongoDB 프로젝션을 반환합니다.
+    """
+    if view not in RESPONSE_VIEWS:
+        raise HTTPException(status_code=400, detail=f"view는 {', '.join(RESPONSE_VIEWS)} 중 하나여야 합니다.")
+    try:
+        return article_projection(view, parse_fields(fields))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+async def find_search_page(collection, query, terms, mode: str, sort: str, limit: int, offset: int, cursor: str,
+                           recency_boost: float = 0.0, projection: Dict[str, Any] = None):
+    """
+    정렬 방식에 따라 관련도 순 또는 최신순으로 한 페이지를 조회합니다.
+    관련도 순은 offset으로만 이어서 조회하므로 next_cursor는 None입니다.
+    """
+    projection = projection or article_projection()
+    if sort == "relevance" and terms:
+        if mode == "fulltext":
+            return await find_text_page(collection, query, limit, offset, recency_boost, projection), None
+        return await find_ranked_page(collection, query, terms, limit, offset, projection), None
+    return await find_page(collection, query, limit, offset, cursor, projection)
+
+async def search_debug_info(timer: StageTimer, collection, query: Dict[str, Any], options: Dict[str, Any],
+                            limit: int) -> Dict[str, Any]:
+    """
+    단계별 시간과 explain() 요약(사용한 인덱스, 검사한 문서 수 대비 반환 수)을 반환합니다.
+    """
+    try:
+        with timer.stage(EXPLAIN_STAGE):
+            explain = await explain_query(collection, query, limit)
+    except Exception as e:
+        explain = {"error": str(e)}
+    return {
+        "timings": timer.summary(),
+        "query_shape": query_shape(query),
+        "options": options,
+        "explain": explain
+    }
+
+def search_response(endpoint: str, result: Dict[str, Any], timer: StageTimer, query: Dict[str, Any],
+                    options: Dict[str, Any], params: Dict[str, Any], profile: bool, debug: bool) -> MongoJSONResponse:
+    """
+    검색 결과를 직렬화해 응답을 만듭니다. profile이면 Server-Timing 헤더를 붙이고,
+    기준보다 느린 검색은 느린 쿼리 기록에 남깁니다.
+    """
+    with timer.stage("serialize"):
+        response = MongoJSONResponse(result)
+    if profile or debug:
+        response.headers["Server-Timing"] = timer.server_timing()
+    slow_query_log.maybe_record(endpoint, query, options, timer, params)
+    return response
+
+def days_ago(days: int) -> datetime:
+    """
+    최근 days일 조건의 시작 시각을 분 단위로 내려 반환합니다.
+    같은 검색은 1분 동안 같은 쿼리가 되므로 count_mode=cached의 캐시 키도 같아집니다.
+    """
+    return utc_now().replace(second=0, microsecond=0) - timedelta(days=days)
+
+def build_search_query(keyword: str = "", sentiment: str = None, days: int = None,
+                       mode: str = "substring", collapse_duplicates: bool = False) -> Dict[str, Any]:
+    """
+    /news/search와 /news/export가 함께 쓰는 검색 조건을 만듭니다.
+    """
+    query = {}
+    
+    # 키워드 검색 (제목과 내용에서 검색)
+    if keyword:
+        if mode == "fulltext":
+            query.update(text_search_filter([keyword]))
+        else:
+            # n-gram 색인으로 후보를 좁힌 뒤 부분 문자열 확인
+            add_condition(query, keyword_filter(keyword, ("title", "content")))
+    
+    # 감정 필터
+    if sentiment:
+        query["sentiment.sentiment"] = sentiment
+    
+    # 날짜 필터
+    if days:
+        add_condition(query, published_at_filter(start=days_ago(days)))
+    
+    # 재게재 기사는 대표 기사 하나만 남김
+    if collapse_duplicates:
+        add_condition(query, CANONICAL_FILTER)
+    
+    return query
+
+@app.on_event("startup")
+async def startup_event():
+    # 네이버 API 커넥션 풀을 서버 수명 동안 유지
+    await news_collector.open_session()
+    stats_rollup.start()
+    trend_rollup.start()
+    live_feed.start()
+    if INGEST_SCHEDULER_ENABLED:
+        ingestion_scheduler.start()
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    await stats_rollup.stop()
+    await trend_rollup.stop()
+    await live_feed.stop()
+    await ingestion_scheduler.stop()
+    await news_collector.close_session()
+    if sentiment_analyzer:
+        sentiment_analyzer.shutdown()
+
 @app.get("/")
 async def root():
     return {"message": "News Collector API (MongoDB) is running!"}
@@ -78,65 +314,88 @@ async def get_news(query: str = "kwater OR 한국수자원공사", max_results:
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.get("/news/quota")
+async def get_api_quota():
+    """
+    네이버 API 남은 호출 한도를 조회합니다.
+    """
+    return {
+        "status": "success",
+        "quota": news_collector.rate_limiter.status()
+    }
+
 @app.get("/news/search")
 async def search_news_in_db(
     keyword: str = "",
     limit: int = 50,
     offset: int = 0,
     sentiment: str = None,
-    days: int = None
+    days: int = None,
+    cursor: str = None,
+    count_mode: str = "exact",
+    mode: str = "substring",
+    sort: str = None,
+    recency_boost: float = 0.0,
+    collapse_duplicates: bool = False,
+    profile: bool = False,
+    debug: bool = False,
+    fields: str = None,
+    view: str = "full"
 ):
     """
     MongoDB에 저장된 뉴스에서 제목과 내용으로 검색합니다.
+    cursor를 주면 offset 대신 이전 응답의 next_cursor 다음부터 조회합니다.
+    count_mode: exact(정확), cached(캐시 사용), estimated(상한까지만 계산, 예: "1000+")
+    mode: substring(부분 문자열 일치), fulltext(텍스트 인덱스 전문 검색)
+    sort: recent(최신순), relevance(관련도순, 제목 일치 우대). 기본값은 fulltext면 relevance, 아니면 recent
+    recency_boost: fulltext 관련도순에서 최근 기사 점수를 높이는 정도 (0이면 사용 안 함)
+    collapse_duplicates: 거의 같은 기사(통신사 기사 재게재 등)는 대표 기사 하나만 반환
+    profile: 단계별 처리 시간(build, find, count, serialize)을 Server-Timing 헤더로 반환
+    debug: 단계별 시간과 MongoDB explain() 요약을 응답의 debug에 포함
+    fields: 반환할 필드 (쉼표 구분, 예: title,url,published_at,sentiment.sentiment). _id와 published_at은 항상 포함
+    view: full(전체 문서), summary(제목·URL·발행일·감정 라벨과 앞부분만 자른 본문)
     """
+    validate_cursor(cursor)
+    validate_count_mode(count_mode)
+    sort = resolve_search_options(mode, sort, cursor)
+    projection = resolve_projection(view, fields)
+    timer = StageTimer()
     try:
         collection = await get_async_collection()
         
         # 검색 조건 구성
-        query = {}
-        
-        # 키워드 검색 (제목과 내용에서 검색)
-        if keyword:
-            query["$or"] = [
-                {"title": {"$regex": keyword, "$options": "i"}},
-                {"content": {"$regex": keyword, "$options": "i"}}
-            ]
-        
-        # 감정 필터
-        if sentiment:
-            query["sentiment.sentiment"] = sentiment
-        
-        # 날짜 필터
-        if days:
-            cutoff_date = datetime.now() - timedelta(days=days)
-            query["published_at"] = {"$gte": cutoff_date.isoformat()}
-        
-        # 검색 실행
-        cursor = collection.find(query).sort("published_at", -1).skip(offset).limit(limit)
-        articles = await cursor.to_list(length=limit)
-        
-        # 총 검색 결과 수 계산
-        total_count = await collection.count_documents(query)
-        
-        # 결과 포맷팅
-        result_articles = []
-        for article in articles:
-            article["_id"] = str(article["_id"])
-            if "created_at" in article:
-                article["created_at"] = article["created_at"].isoformat()
-            if "updated_at" in article:
-                article["updated_at"] = article["updated_at"].isoformat()
-            result_articles.append(article)
+        with timer.stage("build"):
+            query = build_search_query(keyword, sentiment, days, mode, collapse_duplicates)
+            terms = [("title", keyword), ("content", keyword)] if keyword else []
+        
+        # 검색 실행과 총 검색 결과 수 계산을 동시에 진행
+        (articles, next_cursor), total_count = await asyncio.gather(
+            timer.measure("find", find_search_page(collection, query, terms, mode, sort, limit, offset, cursor,
+                                                   recency_boost, projection)),
+            timer.measure("count", count_cache.count(collection, query, count_mode))
+        )
         
-        return {
+        result = {
             "status": "success",
             "keyword": keyword,
+            "mode": mode,
+            "sort": sort,
+            "collapse_duplicates": collapse_duplicates,
             "total_count": total_count,
-            "count": len(result_articles),
+            "count": len(articles),
             "offset": offset,
             "limit": limit,
-            "articles": result_articles
+            "next_cursor": next_cursor,
+            "articles": articles
         }
+        
+        # 단계별 시간 헤더, 느린 쿼리 기록, 디버그 정보
+        options = {"mode": mode, "sort": sort, "count_mode": count_mode, "paging": "cursor" if cursor else "offset",
+                   "view": "fields" if fields else view}
+        params = {"keyword": keyword, "sentiment": sentiment, "days": days, "offset": offset, "limit": limit}
+        if debug:
+            result["debug"] = await search_debug_info(timer, collection, query, options, limit)
+        return search_response("/news/search", result, timer, query, options, params, profile, debug)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -148,79 +407,197 @@ async def advanced_search_news(
     start_date: str = None,
     end_date: str = None,
     limit: int = 50,
-    offset: int = 0
+    offset: int = 0,
+    cursor: str = None,
+    count_mode: str = "exact",
+    mode: str = "substring",
+    sort: str = None,
+    recency_boost: float = 0.0,
+    collapse_duplicates: bool = False,
+    profile: bool = False,
+    debug: bool = False,
+    fields: str = None,
+    view: str = "full"
 ):
     """
     고급 검색 기능 - 제목과 내용을 별도로 검색할 수 있습니다.
+    cursor를 주면 offset 대신 이전 응답의 next_cursor 다음부터 조회합니다.
+    count_mode: exact(정확), cached(캐시 사용), estimated(상한까지만 계산, 예: "1000+")
+    mode: substring(부분 문자열 일치), fulltext(텍스트 인덱스 전문 검색, 제목·내용 키워드는 모두 만족해야 함)
+    sort: recent(최신순), relevance(관련도순, 제목 일치 우대). 기본값은 fulltext면 relevance, 아니면 recent
+    recency_boost: fulltext 관련도순에서 최근 기사 점수를 높이는 정도 (0이면 사용 안 함)
+    collapse_duplicates: 거의 같은 기사(통신사 기사 재게재 등)는 대표 기사 하나만 반환
+    profile: 단계별 처리 시간(build, find, count, serialize)을 Server-Timing 헤더로 반환
+    debug: 단계별 시간과 MongoDB explain() 요약을 응답의 debug에 포함
+    fields: 반환할 필드 (쉼표 구분, 예: title,url,published_at,sentiment.sentiment). _id와 published_at은 항상 포함
+    view: full(전체 문서), summary(제목·URL·발행일·감정 라벨과 앞부분만 자른 본문)
     """
+    validate_cursor(cursor)
+    validate_count_mode(count_mode)
+    sort = resolve_search_options(mode, sort, cursor)
+    projection = resolve_projection(view, fields)
+    start_at = parse_date_param("start_date", start_date)
+    end_at = parse_date_param("end_date", end_date)
+    timer = StageTimer()
     try:
         collection = await get_async_collection()
         
         # 검색 조건 구성
-        query = {}
-        
-        # 제목 검색
-        if title_keyword:
-            query["title"] = {"$regex": title_keyword, "$options": "i"}
-        
-        # 내용 검색
-        if content_keyword:
-            query["content"] = {"$regex": content_keyword, "$options": "i"}
-        
-        # 감정 필터
-        if sentiment:
-            query["sentiment.sentiment"] = sentiment
-        
-        # 날짜 범위 필터
-        if start_date or end_date:
-            date_query = {}
-            if start_date:
-                date_query["$gte"] = start_date
-            if end_date:
-                date_query["$lte"] = end_date
-            query["published_at"] = date_query
-        
-        # 검색 실행
-        cursor = collection.find(query).sort("published_at", -1).skip(offset).limit(limit)
-        articles = await cursor.to_list(length=limit)
-        
-        # 총 검색 결과 수 계산
-        total_count = await collection.count_documents(query)
-        
-        # 결과 포맷팅
-        result_articles = []
-        for article in articles:
-            article["_id"] = str(article["_id"])
-            if "created_at" in article:
-                article["created_at"] = article["created_at"].isoformat()
-            if "updated_at" in article:
-                article["updated_at"] = article["updated_at"].isoformat()
-            result_articles.append(article)
+        with timer.stage("build"):
+            query = {}
+        
+            keyword_conditions = []
+            terms = []
+        
+            # 제목 검색
+            if title_keyword:
+                keyword_conditions.append(keyword_filter(title_keyword, ("title",)))
+                terms.append(("title", title_keyword))
+        
+            # 내용 검색
+            if content_keyword:
+                keyword_conditions.append(keyword_filter(content_keyword, ("content",)))
+                terms.append(("content", content_keyword))
+        
+            if mode == "fulltext" and terms:
+                # 텍스트 인덱스는 필드를 구분하지 않고 검색어를 OR로 찾으므로 후보 선택과 점수 계산에만 쓰고,
+                # 필드별 키워드 조건은 substring 방식과 같이 모두 만족해야 함
+                query.update(text_search_filter([title_keyword, content_keyword]))
+            for condition in keyword_conditions:
+                add_condition(query, condition)
+        
+            # 감정 필터
+            if sentiment:
+                query["sentiment.sentiment"] = sentiment
+        
+            # 날짜 범위 필터
+            add_condition(query, published_at_filter(start=start_at, end=end_at))
+        
+            # 재게재 기사는 대표 기사 하나만 남김
+            if collapse_duplicates:
+                add_condition(query, CANONICAL_FILTER)
+        
+        # 검색 실행과 총 검색 결과 수 계산을 동시에 진행
+        (articles, next_cursor), total_count = await asyncio.gather(
+            timer.measure("find", find_search_page(collection, query, terms, mode, sort, limit, offset, cursor,
+                                                   recency_boost, projection)),
+            timer.measure("count", count_cache.count(collection, query, count_mode))
+        )
         
-        return {
+        result = {
             "status": "success",
             "title_keyword": title_keyword,
             "content_keyword": content_keyword,
+            "mode": mode,
+            "sort": sort,
+            "collapse_duplicates": collapse_duplicates,
             "total_count": total_count,
-            "count": len(result_articles),
+            "count": len(articles),
             "offset": offset,
             "limit": limit,
-            "articles": result_articles
+            "next_cursor": next_cursor,
+            "articles": articles
         }
+        
+        # 단계별 시간 헤더, 느린 쿼리 기록, 디버그 정보
+        options = {"mode": mode, "sort": sort, "count_mode": count_mode, "paging": "cursor" if cursor else "offset",
+                   "view": "fields" if fields else view}
+        params = {"title_keyword": title_keyword, "content_keyword": content_keyword, "sentiment": sentiment,
+                  "start_date": start_date, "end_date": end_date, "offset": offset, "limit": limit}
+        if debug:
+            result["debug"] = await search_debug_info(timer, collection, query, options, limit)
+        return search_response("/news/search/advanced", result, timer, query, options, params, profile, debug)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.get("/news/slow-queries")
+async def get_slow_queries(limit: int = 20, sort_by: str = "count", endpoint: str = None):
+    """
+    기준(SLOW_QUERY_THRESHOLD_MS)보다 느렸던 검색을 쿼리 모양별로 조회합니다.
+    sort_by: count(관측 횟수), max_ms(최대 시간), total_ms(누적 시간), last_seen_at(최근 관측)
+    """
+    if sort_by not in SLOW_QUERY_SORTS:
+        raise HTTPException(status_code=400, detail=f"sort_by는 {', '.join(SLOW_QUERY_SORTS)} 중 하나여야 합니다.")
+    try:
+        return {
+            "status": "success",
+            "threshold_ms": slow_query_log.threshold_ms,
+            "enabled": slow_query_log.enabled,
+            "slow_queries": await slow_query_log.top(limit, sort_by, endpoint)
+        }
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.get("/news/export")
+async def export_news(
+    keyword: str = "",
+    sentiment: str = None,
+    days: int = None,
+    mode: str = "substring",
+    format: str = "ndjson",
+    limit: int = None,
+    collapse_duplicates: bool = False
+):
+    """
+    /news/search와 같은 조건으로 저장된 기사를 최신순으로 내보냅니다.
+    format: ndjson(한 줄에 기사 하나), csv(감정 점수를 열로 펼침)
+    collapse_duplicates: 거의 같은 기사는 대표 기사 하나만 내보냄
+    결과를 한꺼번에 모으지 않고 MongoDB 커서에서 읽는 대로 스트리밍하므로 전체 기사도 한 번에 받을 수 있습니다.
+    """
+    if mode not in SEARCH_MODES:
+        raise HTTPException(status_code=400, detail=f"mode는 {', '.join(SEARCH_MODES)} 중 하나여야 합니다.")
+    if format not in EXPORT_FORMATS:
+        raise HTTPException(status_code=400, detail=f"format은 {', '.join(EXPORT_FORMATS)} 중 하나여야 합니다.")
+    try:
+        collection = await get_async_collection()
+        query = build_search_query(keyword, sentiment, days, mode, collapse_duplicates)
+        filename = f"articles_{utc_now().strftime('%Y%m%d%H%M%S')}.{format}"
+        return StreamingResponse(
+            stream_articles(collection, query, format, limit),
+            media_type=EXPORT_FORMATS[format],
+            headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.get("/news/live")
+async def live_news_feed(keyword: str = "", sentiment: str = None):
+    """
+    새로 저장되는 기사를 감정분석 결과와 함께 server-sent events로 받습니다.
+    keyword(제목·내용 포함)나 sentiment로 받을 기사를 거를 수 있습니다.
+    """
+    return StreamingResponse(
+        live_feed.subscribe(keyword or None, sentiment),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+@app.get("/news/live/status")
+async def live_news_feed_status():
+    """
+    실시간 피드 구독자 수와 방송 현황을 조회합니다.
+    """
+    return {
+        "status": "success",
+        "live_feed": live_feed.stats()
+    }
+
 @app.get("/news/extensive")
-async def get_news_extensive(max_results: int = 500):
+async def get_news_extensive(max_results: int = 500, concurrent: bool = False, max_concurrency: int = None):
     """
     방대한 양의 뉴스를 수집합니다.
     """
     try:
-        articles = await news_collector.fetch_news_extensive(max_results=max_results)
+        articles, query_timings = await news_collector.fetch_news_extensive_with_timings(
+            max_results=max_results,
+            concurrent=concurrent,
+            max_concurrency=max_concurrency
+        )
         return {
             "status": "success",
             "count": len(articles),
             "articles": articles,
+            "query_timings": query_timings,
             "message": f"총 {len(articles)}개의 기사를 수집했습니다."
         }
     except Exception as e:
@@ -236,12 +613,13 @@ async def get_news_extensive_with_sentiment(max_results: int = 200):
     
     try:
         articles = await news_collector.fetch_news_extensive(max_results=max_results)
+        await sentiment_cache.preload(articles)
         
         articles_with_sentiment = []
         for i, article in enumerate(articles):
             try:
                 text_for_analysis = f"{article['title']} {article['content']}"
-                sentiment = sentiment_analyzer.analyze(text_for_analysis)
+                sentiment = sentiment_cache.analyze(text_for_analysis)
                 
                 article_with_sentiment = {
                     **article,
@@ -272,28 +650,98 @@ async def get_news_extensive_with_sentiment(max_results: int = 200):
 @app.post("/news/collect-and-save")
 async def collect_and_save_news(request: NewsCollectionRequest):
     """
-    뉴스를 수집하고 MongoDB에 저장합니다.
+    뉴스 수집·저장 작업을 백그라운드에 등록하고 바로 작업 ID를 반환합니다.
+    진행 상황은 /news/jobs/{job_id}로 확인합니다. wait=true이면 끝날 때까지 기다려 결과를 반환합니다.
     """
+    params = {
+        "query": request.query,
+        "max_results": request.max_results,
+        "concurrent": request.concurrent,
+        "incremental": request.incremental,
+        "bulk": request.bulk
+    }
     try:
-        result = await news_collector.collect_and_save_news(
-            query=request.query,
-            max_results=request.max_results,
-            sentiment_analyzer=sentiment_analyzer
-        )
-        return result
+        if request.wait:
+            job = await ingestion_scheduler.run_now(params)
+            return job["result"]
+        job = ingestion_scheduler.enqueue(params)
+        return {
+            "status": "queued",
+            "job_id": job["job_id"],
+            "message": "뉴스 수집 작업이 등록되었습니다."
+        }
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.get("/news/jobs")
+async def list_collection_jobs(limit: int = 20):
+    """
+    최근 뉴스 수집 작업 목록을 조회합니다.
+    """
+    return {
+        "status": "success",
+        "jobs": ingestion_scheduler.list_jobs(limit)
+    }
+
+@app.get("/news/jobs/{job_id}")
+async def get_collection_job(job_id: str):
+    """
+    뉴스 수집 작업의 상태와 결과를 조회합니다.
+    """
+    job = ingestion_scheduler.get_job(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"작업을 찾을 수 없습니다: {job_id}")
+    return {
+        "status": "success",
+        "job": job
+    }
+
+@app.get("/scheduler/status")
+async def get_scheduler_status():
+    """
+    수집 스케줄러와 키워드 그룹별 다음 실행 시각을 조회합니다.
+    """
+    return {
+        "status": "success",
+        "scheduler": ingestion_scheduler.status()
+    }
+
+@app.post("/scheduler/trigger")
+async def trigger_scheduler(group: str = None):
+    """
+    키워드 그룹 수집을 즉시 실행합니다. group을 주지 않으면 모든 그룹을 실행합니다.
+    같은 그룹이 이미 대기 중이거나 실행 중이면 새로 실행하지 않습니다.
+    """
+    names = [group] if group else list(ingestion_scheduler.schedules)
+    try:
+        jobs = [ingestion_scheduler.enqueue_group(name) for name in names]
+    except KeyError:
+        raise HTTPException(status_code=404, detail=f"수집 그룹을 찾을 수 없습니다: {group}")
+    return {
+        "status": "queued",
+        "job_ids": [job["job_id"] for job in jobs],
+        # 이미 대기 중이거나 실행 중인 그룹은 skipped (result.active_job_id가 진행 중인 작업)
+        "jobs": [{"group": job["group"], "job_id": job["job_id"], "status": job["status"]} for job in jobs]
+    }
+
 @app.get("/news/db")
 async def get_news_from_db(
     limit: int = 50,
     offset: int = 0,
     sentiment: str = None,
-    days: int = None
+    days: int = None,
+    cursor: str = None,
+    fields: str = None,
+    view: str = "full"
 ):
     """
     MongoDB에서 저장된 뉴스를 조회합니다.
+    cursor를 주면 offset 대신 이전 응답의 next_cursor 다음부터 조회합니다.
+    fields: 반환할 필드 (쉼표 구분, 예: title,url,published_at,sentiment.sentiment). _id와 published_at은 항상 포함
+    view: full(전체 문서), summary(제목·URL·발행일·감정 라벨과 앞부분만 자른 본문)
     """
+    validate_cursor(cursor)
+    projection = resolve_projection(view, fields)
     try:
         collection = await get_async_collection()
         
@@ -304,28 +752,18 @@ async def get_news_from_db(
             query["sentiment.sentiment"] = sentiment
         
         if days:
-            cutoff_date = datetime.now() - timedelta(days=days)
-            query["published_at"] = {"$gte": cutoff_date.isoformat()}
+            add_condition(query, published_at_filter(start=days_ago(days)))
         
         # MongoDB에서 조회
-        cursor = collection.find(query).sort("published_at", -1).skip(offset).limit(limit)
-        articles = await cursor.to_list(length=limit)
+        articles, next_cursor = await find_page(collection, query, limit, offset, cursor, projection)
         
-        # ObjectId를 문자열로 변환
-        result_articles = []
-        for article in articles:
-            article["_id"] = str(article["_id"])
-            if "created_at" in article:
-                article["created_at"] = article["created_at"].isoformat()
-            if "updated_at" in article:
-                article["updated_at"] = article["updated_at"].isoformat()
-            result_articles.append(article)
-        
-        return {
+        # ObjectId와 날짜는 응답 직렬화에서 변환
+        return MongoJSONResponse({
             "status": "success",
-            "count": len(result_articles),
-            "articles": result_articles
-        }
+            "count": len(articles),
+            "next_cursor": next_cursor,
+            "articles": articles
+        })
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -333,39 +771,57 @@ async def get_news_from_db(
 async def get_news_stats():
     """
     MongoDB에 저장된 뉴스 통계를 조회합니다.
+    저장 시 갱신되는 통계 집계 컬렉션에서 읽으므로 전체 기사를 다시 집계하지 않습니다.
     """
     try:
-        collection = await get_async_collection()
-        
-        # 총 기사 수
-        total_articles = await collection.count_documents({})
-        
-        # 감정별 통계
-        pipeline = [
-            {"$group": {"_id": "$sentiment.sentiment", "count": {"$sum": 1}}}
-        ]
-        sentiment_stats = await collection.aggregate(pipeline).to_list(length=None)
-        sentiment_counts = {stat["_id"] or "Unknown": stat["count"] for stat in sentiment_stats}
-        
-        # 최근 7일간 통계
-        week_ago = datetime.now() - timedelta(days=7)
-        recent_articles = await collection.count_documents({
-            "published_at": {"$gte": week_ago.isoformat()}
-        })
-        
-        # 가장 오래된 기사와 최신 기사
-        oldest_article = await collection.find_one({}, sort=[("published_at", 1)])
-        newest_article = await collection.find_one({}, sort=[("published_at", -1)])
-        
         return {
             "status": "success",
-            "stats": {
-                "total_articles": total_articles,
-                "recent_articles_7days": recent_articles,
-                "sentiment_distribution": sentiment_counts,
-                "oldest_article_date": oldest_article["published_at"] if oldest_article else None,
-                "newest_article_date": newest_article["published_at"] if newest_article else None
-            }
+            "stats": await stats_rollup.read_stats()
+        }
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.post("/news/db/stats/reconcile")
+async def reconcile_news_stats():
+    """
+    원본 기사 컬렉션에서 통계를 다시 계산합니다.
+    """
+    try:
+        return {
+            "status": "success",
+            "result": await stats_rollup.reconcile()
+        }
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.get("/news/trends")
+async def get_news_trends(
+    granularity: str = "day",
+    keyword: str = "",
+    days: int = 30,
+    start_date: str = None,
+    end_date: str = None
+):
+    """
+    시간 구간(hour/day/week, UTC)별 감정 분포와 평균 감정 점수를 조회합니다.
+    start_date를 주지 않으면 최근 days일을 조회합니다.
+    관련 키워드(수집 필터 키워드)와 전체 추이는 구간 집계에서 읽습니다.
+    """
+    if granularity not in TREND_GRANULARITIES:
+        raise HTTPException(status_code=400, detail=f"granularity는 {', '.join(TREND_GRANULARITIES)} 중 하나여야 합니다.")
+    end_at = parse_date_param("end_date", end_date) or utc_now()
+    start_at = parse_date_param("start_date", start_date) or end_at - timedelta(days=days)
+    try:
+        result = await trend_rollup.query(granularity, start_at, end_at, keyword or None)
+        return {
+            "status": "success",
+            "granularity": granularity,
+            "keyword": keyword,
+            "start": start_at,
+            "end": end_at,
+            "source": result["source"],
+            "count": len(result["buckets"]),
+            "buckets": result["buckets"]
         }
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -396,10 +852,12 @@ async def get_news_with_sentiment(query: str = "kwater OR 한국수자원공사"
     try:
         articles = await news_collector.fetch_news(query, max_results)
         
+        await sentiment_cache.preload(articles)
+        
         articles_with_sentiment = []
         for article in articles:
             text_for_analysis = f"{article['title']} {article['content']}"
-            sentiment = sentiment_analyzer.analyze(text_for_analysis)
+            sentiment = sentiment_cache.analyze(text_for_analysis)
             
             article_with_sentiment = {
                 **article,
@@ -426,10 +884,12 @@ async def get_kwater_news_with_sentiment(max_results: int = 30):
     try:
         articles = await news_collector.fetch_news("kwater OR 한국수자원공사", max_results)
         
+        await sentiment_cache.preload(articles)
+        
         articles_with_sentiment = []
         for article in articles:
             text_for_analysis = f"{article['title']} {article['content']}"
-            sentiment = sentiment_analyzer.analyze(text_for_analysis)
+            sentiment = sentiment_cache.analyze(text_for_analysis)
             
             article_with_sentiment = {
                 **article,
@@ -454,7 +914,7 @@ async def analyze_sentiment(sentiment_request: SentimentRequest):
         raise HTTPException(status_code=503, detail="감정분석 모델이 로딩되지 않았습니다.")
     
     try:
-        sentiment = sentiment_analyzer.analyze(sentiment_request.text)
+        sentiment = sentiment_cache.analyze(sentiment_request.text)
         return {
             "status": "success",
             "text": sentiment_request.text,
@@ -472,7 +932,7 @@ async def analyze_sentiment_batch(sentiment_batch_request: SentimentBatchRequest
         raise HTTPException(status_code=503, detail="감정분석 모델이 로딩되지 않았습니다.")
     
     try:
-        results = sentiment_analyzer.analyze_batch(sentiment_batch_request.texts)
+        results = await sentiment_analyzer.analyze_batch_async(sentiment_batch_request.texts)
         return {
             "status": "success",
             "results": [
@@ -490,9 +950,17 @@ async def get_sentiment_status():
     """
     return {
         "available": sentiment_available,
-        "model_name": sentiment_analyzer.model_name if sentiment_available else None
+        "model_name": sentiment_analyzer.model_name if sentiment_available else None,
+        "cache": sentiment_cache.stats() if sentiment_available else None
     }
 
+@app.get("/metrics", include_in_schema=False)
+async def get_metrics():
+    """
+    Prometheus 텍스트 형식으로 요청 처리 시간, 네이버 API 호출, MongoDB 명령, 감정분석, 캐시 지표를 반환합니다.
+    """
+    return Response(REGISTRY.render(), media_type=CONTENT_TYPE)
+
 @app.get("/health")
 async def health_check():
     """
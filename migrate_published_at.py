@@ -0,0 +1,72 @@
+import argparse
+import logging
+import time
+from pymongo import UpdateOne
+from database_mongo import get_collection, create_indexes
+from date_utils import to_utc_datetime
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def migrate_published_at(batch_size: int = 500, pause: float = 0.0, dry_run: bool = False) -> dict:
+    """
+    문자열로 저장된 published_at을 UTC datetime으로 바꿉니다.
+
+    _id 순서로 batch_size개씩 읽고 unordered bulk_write로 갱신하므로 서버를 멈추지 않고 실행할 수 있습니다.
+    각 갱신은 값이 여전히 같은 문자열일 때만 적용되어 실행 중 다른 쓰기와 충돌하지 않고,
+    중단되면 다시 실행해 남은 문서만 이어서 처리합니다. pause초만큼 배치 사이에 쉬어 부하를 조절합니다.
+    """
+    collection = get_collection()
+    converted = 0
+    unparsable = 0
+    last_id = None
+
+    while True:
+        query = {"published_at": {"$type": "string"}}
+        if last_id is not None:
+            query["_id"] = {"$gt": last_id}
+        batch = list(collection.find(query, {"published_at": 1}).sort("_id", 1).limit(batch_size))
+        if not batch:
+            break
+        last_id = batch[-1]["_id"]
+
+        operations = []
+        for doc in batch:
+            published_at = to_utc_datetime(doc["published_at"])
+            if published_at is None:
+                unparsable += 1
+                logger.warning(f"published_at 변환 실패: {doc['_id']} {doc['published_at']!r}")
+                continue
+            operations.append(UpdateOne(
+                {"_id": doc["_id"], "published_at": doc["published_at"]},
+                {"$set": {"published_at": published_at}}
+            ))
+
+        if operations and not dry_run:
+            result = collection.bulk_write(operations, ordered=False)
+            converted += result.modified_count
+        else:
+            converted += len(operations)
+        logger.info(f"published_at 변환 진행: {converted}개")
+
+        if pause:
+            time.sleep(pause)
+
+    return {"converted": converted, "unparsable": unparsable, "dry_run": dry_run}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="published_at 문자열을 BSON datetime(UTC)으로 변환합니다.")
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--pause", type=float, default=0.0, help="배치 사이 대기 시간(초)")
+    parser.add_argument("--dry-run", action="store_true", help="변환 대상만 세고 저장하지 않음")
+    args = parser.parse_args()
+
+    # 새 복합 인덱스를 먼저 만들어 둠
+    create_indexes()
+    result = migrate_published_at(args.batch_size, args.pause, args.dry_run)
+    print(f"변환 완료: {result['converted']}개, 변환 실패: {result['unparsable']}개")
+    if not args.dry_run and not result["unparsable"]:
+        print("모든 문서가 변환되었습니다. PUBLISHED_AT_LEGACY_STRINGS=false로 설정할 수 있습니다.")
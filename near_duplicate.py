@@ -0,0 +1,135 @@
+import hashlib
+import os
+from typing import Any, Dict, List, Optional
+from bson import ObjectId
+from dotenv import load_dotenv
+
+load_dotenv()
+
+NEAR_DUPLICATE_ENABLED = os.getenv("NEAR_DUPLICATE_ENABLED", "true").lower() == "true"
+# 이 비트 수 이하로 다른 SimHash는 같은 기사로 봄
+NEAR_DUPLICATE_DISTANCE = int(os.getenv("NEAR_DUPLICATE_DISTANCE", "3"))
+
+SIMHASH_BITS = 64
+SHINGLE_SIZE = 3
+
+# 기사 문서에 저장되는 필드
+SIMHASH_FIELD = "simhash"
+SIMHASH_BAND_FIELD = "simhash_bands"
+CLUSTER_FIELD = "cluster_id"
+DUPLICATE_FIELD = "is_duplicate"
+
+# 대표 기사만 남기는 조건 (필드가 없는 기존 문서는 대표로 취급)
+CANONICAL_FILTER = {DUPLICATE_FIELD: {"$ne": True}}
+
+_MASK = (1 << SIMHASH_BITS) - 1
+
+
+def simhash(text: str) -> int:
+    """
+    정규화한 텍스트의 글자 shingle로 64비트 SimHash를 계산합니다.
+    """
+    normalized = " ".join((text or "").lower().split())
+    shingles = {normalized[i:i + SHINGLE_SIZE] for i in range(max(len(normalized) - SHINGLE_SIZE + 1, 1))}
+    weights = [0] * SIMHASH_BITS
+    for shingle in shingles:
+        value = int.from_bytes(hashlib.blake2b(shingle.encode("utf-8"), digest_size=8).digest(), "big")
+        for bit in range(SIMHASH_BITS):
+            weights[bit] += 1 if value >> bit & 1 else -1
+    return sum(1 << bit for bit in range(SIMHASH_BITS) if weights[bit] > 0)
+
+
+def band_keys(value: int, bands: int = None) -> List[str]:
+    """
+    SimHash를 bands개의 구간으로 나눈 LSH 키를 반환합니다.
+    해밍 거리가 bands 미만이면 비둘기집 원리로 적어도 한 구간은 같으므로 후보에서 빠지지 않습니다.
+    """
+    bands = bands or NEAR_DUPLICATE_DISTANCE + 1
+    width = SIMHASH_BITS // bands
+    keys = []
+    for band in range(bands):
+        start = band * width
+        end = SIMHASH_BITS if band == bands - 1 else start + width
+        chunk = (value >> start) & ((1 << (end - start)) - 1)
+        keys.append(f"{band}:{chunk:x}")
+    return keys
+
+
+def hamming_distance(a: int, b: int) -> int:
+    return bin((a ^ b) & _MASK).count("1")
+
+
+def to_int64(value: int) -> int:
+    """
+    MongoDB int64 범위에 맞도록 부호 있는 정수로 바꿉니다.
+    """
+    return value - (1 << SIMHASH_BITS) if value >= 1 << (SIMHASH_BITS - 1) else value
+
+
+def from_int64(value: int) -> int:
+    return value & _MASK
+
+
+class NearDuplicateDetector:
+    """
+    SimHash와 LSH 구간 인덱스로 거의 같은 기사(통신사 기사 재게재 등)를 묶습니다.
+
+    새 기사마다 구간 키가 겹치는 대표 기사만 후보로 불러와 해밍 거리를 비교하므로
+    전체 기사와 짝지어 비교하지 않습니다. 묶인 기사는 대표 기사의 cluster_id를 받고 is_duplicate=True가 됩니다.
+    """
+
+    def __init__(self, max_distance: int = NEAR_DUPLICATE_DISTANCE):
+        self.max_distance = max_distance
+
+    @staticmethod
+    def _text(article: Dict[str, Any]) -> str:
+        return f"{article.get('title', '')} {article.get('content', '')}"
+
+    async def assign(self, collection, articles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        기사별로 저장할 클러스터 정보를 반환합니다. 같은 묶음 안의 기사끼리도 비교합니다.
+        """
+        signatures = [simhash(self._text(article)) for article in articles]
+        bands_per_article = [band_keys(signature, self.max_distance + 1) for signature in signatures]
+
+        # 구간 키별 후보 대표 기사
+        candidates: Dict[str, List[Dict[str, Any]]] = {}
+        all_bands = sorted({band for bands in bands_per_article for band in bands})
+        if all_bands:
+            cursor = collection.find(
+                {SIMHASH_BAND_FIELD: {"$in": all_bands}, **CANONICAL_FILTER},
+                {SIMHASH_FIELD: 1, SIMHASH_BAND_FIELD: 1, CLUSTER_FIELD: 1}
+            )
+            async for doc in cursor:
+                doc[SIMHASH_FIELD] = from_int64(doc[SIMHASH_FIELD])
+                for band in doc.get(SIMHASH_BAND_FIELD, []):
+                    candidates.setdefault(band, []).append(doc)
+
+        clusters = []
+        for article, signature, bands in zip(articles, signatures, bands_per_article):
+            canonical = self._closest(signature, bands, candidates)
+            object_id = ObjectId()
+            cluster = {
+                "_id": object_id,
+                SIMHASH_FIELD: to_int64(signature),
+                SIMHASH_BAND_FIELD: bands,
+                CLUSTER_FIELD: canonical[CLUSTER_FIELD] if canonical else object_id,
+                DUPLICATE_FIELD: canonical is not None
+            }
+            if canonical is None:
+                # 같은 묶음의 뒤쪽 기사가 이 기사를 대표로 찾을 수 있도록 등록
+                entry = {SIMHASH_FIELD: signature, CLUSTER_FIELD: object_id}
+                for band in bands:
+                    candidates.setdefault(band, []).append(entry)
+            clusters.append(cluster)
+        return clusters
+
+    def _closest(self, signature: int, bands: List[str], candidates: Dict[str, List[Dict[str, Any]]]) -> Optional[Dict[str, Any]]:
+        best = None
+        best_distance = self.max_distance + 1
+        for band in bands:
+            for candidate in candidates.get(band, []):
+                distance = hamming_distance(signature, candidate[SIMHASH_FIELD])
+                if distance < best_distance:
+                    best, best_distance = candidate, distance
+        return best
@@ -1,14 +1,25 @@
 import aiohttp
 import os
-from datetime import datetime, timedelta
-from typing import List, Dict, Any
+from datetime import datetime, timedelta, timezone
+from typing import List, Dict, Any, Callable
 from dotenv import load_dotenv
 import logging
 import html
 import re
 import asyncio
-from database_mongo import get_async_collection, create_indexes
+import inspect
+import random
+import time
+from database_mongo import get_async_collection, get_async_collection_by_name, create_indexes, WATERMARK_COLLECTION_NAME
+from rate_limiter import naver_rate_limiter, NaverRateLimiter, QuotaExceededError
+from sentiment_cache import sentiment_key, SENTIMENT_KEY_FIELD
+from search_index import SEARCH_GRAM_FIELD, document_grams
+from date_utils import to_utc_datetime, utc_now
+from near_duplicate import NearDuplicateDetector, NEAR_DUPLICATE_ENABLED, CLUSTER_FIELD, DUPLICATE_FIELD
+from metrics import counter, histogram
 from bson import ObjectId
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
@@ -16,21 +27,97 @@ logger = logging.getLogger(__name__)
 
 load_dotenv()
 
+NAVER_PAGE_SIZE = 100  # 최대 표시 개수
+NAVER_MAX_PAGES = 10  # 최대 페이지 수 제한
+
+# 다양한 검색 키워드 조합
+EXTENSIVE_SEARCH_QUERIES = [
+    "kwater OR 한국수자원공사",
+    "한국수자원공사",
+    "K-water",
+    "수자원공사",
+    "물관리",
+    "댐",
+    "수도",
+    "상수도",
+    "하수도",
+    "물산업"
+]
+
+# 수집 기사로 인정하는 관련 키워드 (제목 또는 내용에 포함)
+ARTICLE_KEYWORDS = ["kwater", "한국수자원공사", "수자원", "물관리", "댐", "수도", "상수도", "하수도"]
+
+# 재시도할 HTTP 상태 코드 (요청 한도 초과, 서버 오류)
+RETRYABLE_STATUSES = {429, 500, 502, 503, 504}
+
+# 네이버 API 호출 지표 (status는 HTTP 상태 코드, 연결 오류는 error)
+NAVER_REQUESTS = counter("naver_api_requests_total", "네이버 API 호출 수", ("status",))
+NAVER_REQUEST_DURATION = histogram("naver_api_request_duration_seconds", "네이버 API 호출 시간", ("status",))
+
 class NewsCollectorMongo:
-    def __init__(self):
+    def __init__(self, rate_limiter: NaverRateLimiter = None, ensure_indexes: bool = True):
         self.client_id = os.getenv("NAVER_CLIENT_ID", "5vs7W5qwlVVfQxqf1vUY")
         self.client_secret = os.getenv("NAVER_CLIENT_SECRET", "L2CB2x88s4")
-        self.base_url = "https://openapi.naver.com/v1/search/news.json"
+        # 벤치마크 등에서 로컬 스텁 서버로 바꿀 수 있음
+        self.base_url = os.getenv("NAVER_API_URL", "https://openapi.naver.com/v1/search/news.json")
         self.headers = {
             "X-Naver-Client-Id": self.client_id,
             "X-Naver-Client-Secret": self.client_secret
         }
         
-        # MongoDB 인덱스 생성
-        try:
-            create_indexes()
-        except Exception as e:
-            logger.warning(f"MongoDB 인덱스 생성 실패: {e}")
+        # API 호출 한도 관리 (기본값은 프로세스 공유 제한기)
+        self.rate_limiter = rate_limiter or naver_rate_limiter
+        self.max_retries = int(os.getenv("NAVER_MAX_RETRIES", "4"))
+        self.backoff_base = float(os.getenv("NAVER_BACKOFF_BASE", "0.5"))
+        self.backoff_max = float(os.getenv("NAVER_BACKOFF_MAX", "30"))
+        
+        # 새로 저장된 기사를 받아 볼 리스너 (캐시 무효화, 통계 갱신 등)
+        self._save_listeners: List[Callable[[List[Dict[str, Any]]], Any]] = []
+        
+        # bulk 저장 모드의 배치 크기
+        self.bulk_batch_size = int(os.getenv("MONGO_BULK_BATCH_SIZE", "500"))
+        
+        # 거의 같은 기사(재게재 기사) 묶음 탐지
+        self.near_duplicates = NearDuplicateDetector() if NEAR_DUPLICATE_ENABLED else None
+        
+        # 동시 수집 모드에서 한 번에 진행할 최대 API 요청 수
+        self.max_concurrency = int(os.getenv("NAVER_MAX_CONCURRENCY", "5"))
+        
+        # 수집기 수명 동안 재사용하는 HTTP 세션 (커넥션 풀)
+        self.connection_limit = int(os.getenv("NAVER_CONNECTION_LIMIT", "20"))
+        self.connection_limit_per_host = int(os.getenv("NAVER_CONNECTION_LIMIT_PER_HOST", "10"))
+        self._session: aiohttp.ClientSession = None
+        
+        # MongoDB 인덱스 생성 (이미 만든 곳에서는 ensure_indexes=False로 건너뜀)
+        if ensure_indexes:
+            try:
+                create_indexes()
+            except Exception as e:
+                logger.warning(f"MongoDB 인덱스 생성 실패: {e}")
+
+    async def open_session(self) -> aiohttp.ClientSession:
+        """
+        네이버 API 호출에 사용할 공유 세션을 엽니다. 이미 열려 있으면 그대로 반환합니다.
+        """
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.connection_limit,
+                limit_per_host=self.connection_limit_per_host,
+                ttl_dns_cache=300,  # DNS 조회 결과 캐시 (초)
+                keepalive_timeout=30  # 유휴 커넥션 유지 시간 (초)
+            )
+            self._session = aiohttp.ClientSession(connector=connector, headers=self.headers)
+            logger.info("네이버 API 세션 생성")
+        return self._session
+
+    async def close_session(self):
+        """
+        공유 세션과 커넥션 풀을 닫습니다.
+        """
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+            logger.info("네이버 API 세션 종료")
+        self._session = None
 
     def _clean_text(self, text: str) -> str:
         """
@@ -60,16 +147,88 @@ class NewsCollectorMongo:
         
         return text
 
-    async def save_articles_to_mongo(self, articles: List[Dict[str, Any]], sentiment_analyzer=None) -> Dict[str, Any]:
+    def add_save_listener(self, listener: Callable[[List[Dict[str, Any]]], Any]):
+        """
+        기사가 새로 저장될 때마다 호출할 함수를 등록합니다.
+        저장된 MongoDB 문서 목록을 인자로 받으며, 코루틴 함수도 등록할 수 있습니다.
+        """
+        self._save_listeners.append(listener)
+
+    async def _notify_saved(self, docs: List[Dict[str, Any]]):
+        if not docs:
+            return
+        for listener in self._save_listeners:
+            try:
+                result = listener(docs)
+                if inspect.isawaitable(result):
+                    await result
+            except Exception as e:
+                logger.error(f"저장 알림 처리 실패: {str(e)}")
+
+    async def _assign_clusters(self, collection, articles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        저장할 기사들의 거의 같은 기사 묶음 정보를 구합니다. 탐지를 끈 경우 None 목록을 반환합니다.
+        """
+        if not self.near_duplicates or not articles:
+            return [None] * len(articles)
+        return await self.near_duplicates.assign(collection, articles)
+
+    def _build_mongo_doc(self, article: Dict[str, Any], sentiment_analyzer=None,
+                         cluster: Dict[str, Any] = None) -> Dict[str, Any]:
+        """
+        감정분석을 수행하고 기사를 MongoDB 문서 형식으로 변환합니다.
+        재게재 기사도 대표 기사와 부정어·키워드 하나로 감정이 달라질 수 있으므로 자기 텍스트로 분석합니다
+        (같은 텍스트면 sentiment_analyzer로 넘긴 SentimentCache가 결과를 재사용).
+        """
+        mongo_doc = {}
+        
+        # 감정분석 수행
+        if sentiment_analyzer:
+            text_for_analysis = f"{article['title']} {article['content']}"
+            sentiment = sentiment_analyzer.analyze(text_for_analysis)
+            article["sentiment"] = sentiment
+            # 같은 텍스트·같은 사전 버전이면 저장된 결과를 재사용할 수 있도록 키를 함께 저장
+            mongo_doc[SENTIMENT_KEY_FIELD] = sentiment_key(text_for_analysis, sentiment_analyzer.lexicon_version)
+        else:
+            article["sentiment"] = None
+        
+        # MongoDB 문서 형식으로 변환
+        mongo_doc.update({
+            "title": article["title"],
+            "content": article["content"],
+            "url": article["url"],
+            # 날짜 조건과 정렬이 시간대와 무관하도록 UTC datetime으로 저장
+            "published_at": to_utc_datetime(article["published_at"]),
+            "sentiment": article["sentiment"],
+            # published_at과 같은 UTC 기준으로 저장 (스냅샷 워터마크 등이 UTC 시각으로 비교함)
+            "created_at": utc_now(),
+            "updated_at": utc_now()
+        })
+        # 검색용 n-gram 역색인
+        mongo_doc[SEARCH_GRAM_FIELD] = document_grams(mongo_doc)
+        # 거의 같은 기사 묶음 (_id, simhash, cluster_id, is_duplicate)
+        if cluster:
+            mongo_doc.update(cluster)
+        return mongo_doc
+
+    async def save_articles_to_mongo(self, articles: List[Dict[str, Any]], sentiment_analyzer=None,
+                                     bulk: bool = False, batch_size: int = None) -> Dict[str, Any]:
         """
         수집된 기사들을 MongoDB에 저장합니다.
+        
+        bulk=True이면 batch_size개씩 묶어 unordered bulk_write upsert로 저장합니다.
         """
         try:
             collection = await get_async_collection()
             
+            if bulk:
+                return await self._bulk_save_articles(collection, articles, sentiment_analyzer,
+                                                      batch_size or self.bulk_batch_size)
+            
             saved_count = 0
             duplicate_count = 0
             error_count = 0
+            saved_docs = []
             
             for article in articles:
                 try:
@@ -79,34 +238,21 @@ class NewsCollectorMongo:
                         duplicate_count += 1
                         continue
                     
-                    # 감정분석 수행
-                    if sentiment_analyzer:
-                        text_for_analysis = f"{article['title']} {article['content']}"
-                        sentiment = sentiment_analyzer.analyze(text_for_analysis)
-                        article["sentiment"] = sentiment
-                    else:
-                        article["sentiment"] = None
-                    
-                    # MongoDB 문서 형식으로 변환
-                    mongo_doc = {
-                        "title": article["title"],
-                        "content": article["content"],
-                        "url": article["url"],
-                        "published_at": article["published_at"],
-                        "sentiment": article["sentiment"],
-                        "created_at": datetime.now(),
-                        "updated_at": datetime.now()
-                    }
+                    cluster = (await self._assign_clusters(collection, [article]))[0]
+                    mongo_doc = self._build_mongo_doc(article, sentiment_analyzer, cluster)
                     
                     # MongoDB에 저장
                     result = await collection.insert_one(mongo_doc)
                     saved_count += 1
+                    saved_docs.append(mongo_doc)
                     
                 except Exception as e:
                     logger.error(f"기사 저장 실패: {str(e)}")
                     error_count += 1
                     continue
             
+            await self._notify_saved(saved_docs)
+            
             return {
                 "status": "success",
                 "saved_count": saved_count,
@@ -122,93 +268,448 @@ class NewsCollectorMongo:
                 "message": str(e)
             }
 
-    async def fetch_news_extensive(self, query: str = "kwater OR 한국수자원공사", max_results: int = 1000) -> List[Dict[str, Any]]:
+    async def _bulk_save_articles(self, collection, articles: List[Dict[str, Any]], sentiment_analyzer,
+                                  batch_size: int) -> Dict[str, Any]:
+        """
+        url 유니크 인덱스를 기준으로 기사를 묶음 upsert합니다.
+        이미 저장된 URL은 배치당 한 번의 조회로 걸러내어 감정분석을 건너뜁니다.
+        """
+        saved_count = 0
+        duplicate_count = 0
+        error_count = 0
+        
+        for batch_start in range(0, len(articles), batch_size):
+            batch = articles[batch_start:batch_start + batch_size]
+            
+            urls = [article["url"] for article in batch]
+            existing_urls = set()
+            async for doc in collection.find({"url": {"$in": urls}}, {"url": 1}):
+                existing_urls.add(doc["url"])
+            
+            fresh_articles = [article for article in batch if article["url"] not in existing_urls]
+            duplicate_count += len(batch) - len(fresh_articles)
+            clusters = await self._assign_clusters(collection, fresh_articles)
+            
+            operations = []
+            mongo_docs = []
+            for article, cluster in zip(fresh_articles, clusters):
+                mongo_doc = self._build_mongo_doc(article, sentiment_analyzer, cluster)
+                mongo_docs.append(mongo_doc)
+                operations.append(UpdateOne({"url": mongo_doc["url"]}, {"$setOnInsert": mongo_doc}, upsert=True))
+            
+            if not operations:
+                continue
+            
+            try:
+                result = await collection.bulk_write(operations, ordered=False)
+                saved_count += result.upserted_count
+                duplicate_count += result.matched_count
+                upserted_ids = result.upserted_ids
+            except BulkWriteError as e:
+                details = e.details
+                saved_count += details.get("nUpserted", 0)
+                duplicate_count += details.get("nMatched", 0)
+                upserted_ids = {upserted["index"]: upserted["_id"] for upserted in details.get("upserted", [])}
+                for write_error in details.get("writeErrors", []):
+                    # 동시에 저장된 같은 URL은 중복으로 집계
+                    if write_error.get("code") == 11000:
+                        duplicate_count += 1
+                    else:
+                        logger.error(f"기사 저장 실패: {write_error.get('errmsg')}")
+                        error_count += 1
+            
+            # 실제로 새로 저장된 문서만 알림
+            saved_docs = []
+            for index, object_id in upserted_ids.items():
+                mongo_docs[index]["_id"] = object_id
+                saved_docs.append(mongo_docs[index])
+            await self._promote_orphan_duplicates(collection, mongo_docs, saved_docs)
+            await self._notify_saved(saved_docs)
+        
+        return {
+            "status": "success",
+            "saved_count": saved_count,
+            "duplicate_count": duplicate_count,
+            "error_count": error_count,
+            "total_processed": len(articles)
+        }
+
+    async def _promote_orphan_duplicates(self, collection, mongo_docs: List[Dict[str, Any]],
+                                         saved_docs: List[Dict[str, Any]]):
+        """
+        같은 배치의 대표 기사가 저장되지 않았으면(동시에 저장된 같은 URL, 쓰기 오류)
+        그 기사를 가리키는 중복 기사는 대표 없이 collapse_duplicates에서 모두 숨겨집니다.
+        이런 묶음마다 저장된 첫 기사를 대표로 올리고 나머지는 그 기사를 가리키게 합니다.
+        """
+        saved_ids = {doc["_id"] for doc in saved_docs}
+        batch_canonical_ids = {doc["_id"] for doc in mongo_docs if "_id" in doc and doc.get(DUPLICATE_FIELD) is False}
+        orphans: Dict[ObjectId, List[Dict[str, Any]]] = {}
+        for doc in saved_docs:
+            cluster_id = doc.get(CLUSTER_FIELD)
+            if doc.get(DUPLICATE_FIELD) and cluster_id in batch_canonical_ids and cluster_id not in saved_ids:
+                orphans.setdefault(cluster_id, []).append(doc)
+        if not orphans:
+            return
+
+        operations = []
+        for docs in orphans.values():
+            canonical, duplicates = docs[0], docs[1:]
+            canonical.update({CLUSTER_FIELD: canonical["_id"], DUPLICATE_FIELD: False})
+            operations.append(UpdateOne({"_id": canonical["_id"]},
+                                        {"$set": {CLUSTER_FIELD: canonical["_id"], DUPLICATE_FIELD: False}}))
+            for doc in duplicates:
+                doc[CLUSTER_FIELD] = canonical["_id"]
+                operations.append(UpdateOne({"_id": doc["_id"]}, {"$set": {CLUSTER_FIELD: canonical["_id"]}}))
+        await collection.bulk_write(operations, ordered=False)
+        logger.info(f"대표 기사가 저장되지 않은 중복 기사 묶음 {len(orphans)}개의 대표를 다시 지정했습니다.")
+
+    async def fetch_news_extensive(self, query: str = "kwater OR 한국수자원공사", max_results: int = 1000,
+                                   concurrent: bool = False, max_concurrency: int = None) -> List[Dict[str, Any]]:
         """
         방대한 양의 뉴스를 수집합니다. 여러 키워드와 기간을 조합하여 수집합니다.
+        
+        concurrent=True이면 키워드와 페이지를 max_concurrency 범위 안에서 동시에 요청합니다.
+        결과는 순차 수집과 동일합니다.
+        """
+        articles, _ = await self._fetch_extensive(max_results, concurrent, max_concurrency)
+        return articles
+
+    async def fetch_news_extensive_with_timings(self, max_results: int = 1000, concurrent: bool = False,
+                                                max_concurrency: int = None):
         """
+        fetch_news_extensive와 같이 수집하고 (기사 목록, 키워드별 수집 개수와 소요 시간)을 반환합니다.
+        """
+        articles, per_query = await self._fetch_extensive(max_results, concurrent, max_concurrency)
+        return articles, self._query_timings(per_query)
+
+    @staticmethod
+    def _query_timings(per_query: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        return {
+            search_query: {
+                "count": len(result["articles"]),
+                "elapsed_seconds": round(result["elapsed"], 3)
+            }
+            for search_query, result in per_query.items()
+        }
+
+    async def _fetch_extensive(self, max_results: int, concurrent: bool = False, max_concurrency: int = None,
+                               watermarks: Dict[str, Dict[str, Any]] = None, queries: List[str] = None):
+        """
+        대량 수집을 수행하고 (중복 제거된 기사 목록, 키워드별 수집 결과)를 반환합니다.
+        queries를 주지 않으면 EXTENSIVE_SEARCH_QUERIES를 사용합니다.
+        증분 수집(watermarks)이면 워터마크까지 모은 기사를 max_results로 자르지 않습니다.
+        """
+        queries = queries or EXTENSIVE_SEARCH_QUERIES
+        per_query = await self._collect_by_queries(
+            queries,
+            max_results // len(queries),
+            concurrent=concurrent,
+            max_concurrency=max_concurrency,
+            watermarks=watermarks
+        )
+        
+        # 키워드 순서대로 병합하여 순차 수집과 같은 결과를 유지
         all_articles = []
+        for search_query in queries:
+            all_articles.extend(per_query[search_query]["articles"])
         
-        # 다양한 검색 키워드 조합
-        search_queries = [
-            "kwater OR 한국수자원공사",
-            "한국수자원공사",
-            "K-water",
-            "수자원공사",
-            "물관리",
-            "댐",
-            "수도",
-            "상수도",
-            "하수도",
-            "물산업"
-        ]
+        # 중복 제거 (URL 기준)
+        unique_articles = self._remove_duplicates(all_articles)
+        logger.info(f"총 {len(all_articles)}개 기사 수집, 중복 제거 후 {len(unique_articles)}개")
         
-        # 각 키워드별로 수집
-        for search_query in search_queries:
+        if watermarks is None:
+            unique_articles = unique_articles[:max_results]
+        return unique_articles, per_query
+
+    def _advanced_watermarks(self, per_query: Dict[str, Dict[str, Any]], watermarks: Dict[str, Dict[str, Any]],
+                             saved_articles: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """
+        저장까지 끝난 키워드에 대해서만 새 워터마크를 계산합니다.
+        이전 워터마크까지 이어서 수집하지 못했거나 일부 기사가 잘려 저장되지 않은 키워드는
+        다음 수집에서 빈 구간을 다시 가져오도록 워터마크를 옮기지 않습니다.
+        """
+        saved_urls = {article["url"] for article in saved_articles}
+        marks = {}
+        for search_query, result in per_query.items():
+            crawl_state = result["crawl_state"]
+            newest = crawl_state.get("newest")
+            if not newest:
+                continue
+            if search_query in watermarks and not crawl_state.get("complete"):
+                continue
+            if any(article["url"] not in saved_urls for article in result["articles"]):
+                continue
+            previous = watermarks.get(search_query)
+            if previous and newest["published_at"] < previous["published_at"]:
+                continue
+            marks[search_query] = newest
+        return marks
+
+    async def _collect_by_queries(self, queries: List[str], max_results_per_query: int,
+                                  concurrent: bool = False, max_concurrency: int = None,
+                                  watermarks: Dict[str, Dict[str, Any]] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        여러 키워드로 뉴스를 수집하고 키워드별 기사, 소요 시간, 수집 상태를 반환합니다.
+        """
+        watermarks = watermarks or {}
+        semaphore = None
+        if concurrent:
+            semaphore = asyncio.Semaphore(max_concurrency or self.max_concurrency)
+        
+        async def collect(search_query: str) -> Dict[str, Any]:
+            started = time.perf_counter()
+            crawl_state = {}
             try:
                 logger.info(f"키워드 '{search_query}'로 뉴스 수집 중...")
-                articles = await self._fetch_news_by_query(search_query, max_results // len(search_queries))
-                all_articles.extend(articles)
+                articles = await self._fetch_news_by_query(
+                    search_query, max_results_per_query, semaphore,
+                    watermark=watermarks.get(search_query), crawl_state=crawl_state
+                )
                 logger.info(f"키워드 '{search_query}'에서 {len(articles)}개 기사 수집 완료")
-                
-                # API 호출 제한을 위한 대기
-                await asyncio.sleep(0.1)
-                
             except Exception as e:
                 logger.error(f"키워드 '{search_query}' 수집 중 오류: {str(e)}")
-                continue
+                articles = []
+                crawl_state["complete"] = False
+            return {"articles": articles, "elapsed": time.perf_counter() - started, "crawl_state": crawl_state}
         
-        # 중복 제거 (URL 기준)
-        unique_articles = self._remove_duplicates(all_articles)
-        logger.info(f"총 {len(all_articles)}개 기사 수집, 중복 제거 후 {len(unique_articles)}개")
+        if concurrent:
+            results = await asyncio.gather(*(collect(search_query) for search_query in queries))
+            return dict(zip(queries, results))
         
-        return unique_articles[:max_results]
+        # 각 키워드별로 순차 수집 (호출 간격은 rate_limiter가 조절)
+        per_query = {}
+        for search_query in queries:
+            if self._quota_exceeded(per_query):
+                # 일일 한도를 다 썼으면 남은 키워드는 요청하지 않음
+                per_query[search_query] = {"articles": [], "elapsed": 0.0,
+                                           "crawl_state": {"complete": False, "quota_exceeded": True}}
+                continue
+            per_query[search_query] = await collect(search_query)
+        
+        return per_query
+
+    @staticmethod
+    def _quota_exceeded(per_query: Dict[str, Dict[str, Any]]) -> bool:
+        return any(result["crawl_state"].get("quota_exceeded") for result in per_query.values())
+
+    async def _fetch_page(self, query: str, start: int, display: int = NAVER_PAGE_SIZE):
+        """
+        검색 결과 한 페이지를 요청합니다. 실패하면 None을 반환합니다.
+        """
+        params = {
+            "query": query,
+            "display": display,
+            "start": start,
+            "sort": "date"
+        }
+
+        for attempt in range(self.max_retries + 1):
+            requested = None
+            try:
+                await self.rate_limiter.acquire()
+                session = await self.open_session()
+                requested = time.perf_counter()
+                async with session.get(self.base_url, params=params) as response:
+                    status = response.status
+                    if status == 200:
+                        data = await response.json()
+                        self._record_request(status, requested)
+                        return data.get("items", [])
+                    retry_after = response.headers.get("Retry-After")
+                self._record_request(status, requested)
+                    
+            except QuotaExceededError:
+                # 일일 한도 소진은 페이지 실패가 아니므로 수집 전체를 멈추도록 전달
+                raise
+            except Exception as e:
+                if requested is not None:
+                    self._record_request("error", requested)
+                logger.error(f"페이지 {(start - 1) // display} 수집 중 오류: {str(e)}")
+                return None
+            
+            if status not in RETRYABLE_STATUSES or attempt >= self.max_retries:
+                logger.warning(f"API 호출 실패: {status}")
+                return None
+            
+            delay = self._backoff_delay(attempt, retry_after)
+            logger.warning(f"API 호출 실패: {status}, {delay:.2f}초 후 재시도 ({attempt + 1}/{self.max_retries})")
+            if status == 429:
+                # 다른 요청도 함께 쉬도록 공유 제한기를 멈춤
+                self.rate_limiter.pause(delay)
+            await asyncio.sleep(delay)
+
+        return None
 
-    async def _fetch_news_by_query(self, query: str, max_results: int) -> List[Dict[str, Any]]:
+    @staticmethod
+    def _record_request(status, requested: float):
+        NAVER_REQUESTS.inc(status=status)
+        NAVER_REQUEST_DURATION.observe(time.perf_counter() - requested, status=status)
+
+    def _backoff_delay(self, attempt: int, retry_after: str = None) -> float:
+        """
+        지수 백오프에 지터를 더한 대기 시간을 계산합니다. Retry-After 헤더가 있으면 우선합니다.
+        """
+        if retry_after:
+            try:
+                return min(self.backoff_max, float(retry_after))
+            except ValueError:
+                pass
+        delay = min(self.backoff_max, self.backoff_base * (2 ** attempt))
+        return random.uniform(delay / 2, delay)
+
+    async def _fetch_news_by_query(self, query: str, max_results: int, semaphore: asyncio.Semaphore = None,
+                                   watermark: Dict[str, Any] = None, crawl_state: Dict[str, Any] = None) -> List[Dict[str, Any]]:
         """
         특정 쿼리로 뉴스를 수집합니다.
+        
+        semaphore가 주어지면 필요한 페이지를 한꺼번에 요청하되,
+        결과는 페이지 순서대로 처리하여 순차 수집과 같은 지점에서 멈춥니다.
+        watermark가 주어지면 이미 수집한 기사에 도달하는 즉시 페이지 요청을 멈추고,
+        그 전까지는 max_results를 넘더라도 다음 페이지를 이어서 요청합니다.
+        crawl_state에는 이번에 본 가장 최신 기사와 끝까지 수집했는지 여부가 기록됩니다.
+        일일 호출 한도를 다 쓰면 그때까지 모은 기사를 반환하고 crawl_state의 quota_exceeded를 켭니다.
         """
         all_articles = []
         start = 1
-        display = 100  # 최대 표시 개수
-        max_pages = 10  # 최대 페이지 수 제한
+        display = NAVER_PAGE_SIZE
+        max_pages = NAVER_MAX_PAGES
+        if crawl_state is None:
+            crawl_state = {}
+        crawl_state["complete"] = False
 
         page_count = 0
-        while len(all_articles) < max_results and page_count < max_pages:
-            params = {
-                "query": query,
-                "display": display,
-                "start": start,
-                "sort": "date"
-            }
-
+        # 워터마크가 있으면 빈 구간이 남지 않도록 max_results와 관계없이 워터마크에 닿을 때까지 수집
+        while (watermark or len(all_articles) < max_results) and page_count < max_pages:
             try:
-                async with aiohttp.ClientSession() as session:
-                    async with session.get(self.base_url, headers=self.headers, params=params) as response:
-                        if response.status != 200:
-                            logger.warning(f"API 호출 실패: {response.status}")
-                            break
-                        
-                        data = await response.json()
-                        items = data.get("items", [])
-                        
-                        if not items:  # 더 이상 결과가 없으면 종료
-                            break
-                        
-                        filtered_items = self._filter_articles(items)
-                        all_articles.extend(filtered_items)
-                        
-                        if len(items) < display:  # 마지막 페이지면 종료
-                            break
-                        
-                        start += display  # 다음 페이지로 이동
-                        page_count += 1
-                        
-            except Exception as e:
-                logger.error(f"페이지 {page_count} 수집 중 오류: {str(e)}")
-                break
+                if semaphore is None:
+                    pages = [await self._fetch_page(query, start, display)]
+                else:
+                    # 남은 개수를 채우는 데 필요한 페이지만큼 동시에 요청
+                    remaining = max_results - len(all_articles)
+                    wave_size = min(max_pages - page_count, max(1, -(-remaining // display)))
+                    if watermark and page_count == 0:
+                        # 증분 수집은 대개 첫 페이지에서 끝나므로 먼저 한 페이지만 확인
+                        wave_size = 1
+                    # 한도 소진은 페이지별로 받아 그 앞 페이지까지는 그대로 사용
+                    pages = await asyncio.gather(*(
+                        self._fetch_page_limited(semaphore, query, start + i * display, display)
+                        for i in range(wave_size)
+                    ), return_exceptions=True)
+            except QuotaExceededError as e:
+                pages = [e]
+            
+            for items in pages:
+                if isinstance(items, QuotaExceededError):
+                    logger.warning(f"키워드 '{query}' 수집 중단: {str(items)}")
+                    crawl_state["quota_exceeded"] = True
+                    return all_articles
+                if isinstance(items, BaseException):
+                    raise items
+                
+                if not items:  # 실패했거나 더 이상 결과가 없으면 종료
+                    crawl_state["complete"] = items is not None
+                    return all_articles
+                
+                if "newest" not in crawl_state:
+                    crawl_state["newest"] = self._newest_item_mark(items)
+                
+                if watermark:
+                    fresh_items = self._take_until_watermark(items, watermark)
+                    if len(fresh_items) < len(items):  # 이미 수집한 기사에 도달
+                        all_articles.extend(self._filter_articles(fresh_items))
+                        crawl_state["complete"] = True
+                        return all_articles
+                
+                filtered_items = self._filter_articles(items)
+                all_articles.extend(filtered_items)
+                
+                if len(items) < display:  # 마지막 페이지면 종료
+                    crawl_state["complete"] = True
+                    return all_articles
+                
+                start += display  # 다음 페이지로 이동
+                page_count += 1
+                
+                if not watermark and len(all_articles) >= max_results:
+                    break
+
+        if watermark and page_count >= max_pages:
+            # 검색 API는 앞쪽 max_pages 페이지까지만 제공하므로 그보다 오래된 구간은 더 가져올 수 없음
+            logger.warning(f"키워드 '{query}': 마지막 페이지까지 워터마크에 닿지 못해 남은 구간은 건너뜁니다.")
+            crawl_state["complete"] = True
 
         return all_articles
 
+    def _parse_pub_date(self, pub_date: str):
+        """
+        네이버 API의 pubDate를 UTC datetime으로 변환합니다. 실패하면 None을 반환합니다.
+        """
+        try:
+            return datetime.strptime(pub_date, "%a, %d %b %Y %H:%M:%S %z").astimezone(timezone.utc)
+        except (TypeError, ValueError):
+            return None
+
+    def _newest_item_mark(self, items: List[Dict[str, Any]]):
+        """
+        날짜순으로 정렬된 페이지에서 가장 최신 기사의 발행일시와 URL을 반환합니다.
+        """
+        for item in items:
+            published_at = self._parse_pub_date(item.get("pubDate", ""))
+            if published_at is not None:
+                return {"published_at": published_at, "url": item.get("link", "")}
+        return None
+
+    def _take_until_watermark(self, items: List[Dict[str, Any]], watermark: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        워터마크 기사 또는 그보다 오래된 기사가 나오기 전까지의 항목만 반환합니다.
+        """
+        fresh_items = []
+        for item in items:
+            if item.get("link", "") == watermark["url"]:
+                break
+            published_at = self._parse_pub_date(item.get("pubDate", ""))
+            if published_at is not None and published_at < watermark["published_at"]:
+                break
+            fresh_items.append(item)
+        return fresh_items
+
+    async def load_watermarks(self, queries: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        키워드별로 마지막으로 수집한 최신 기사(워터마크)를 불러옵니다.
+        """
+        collection = await get_async_collection_by_name(WATERMARK_COLLECTION_NAME)
+        watermarks = {}
+        async for doc in collection.find({"_id": {"$in": list(queries)}}):
+            watermarks[doc["_id"]] = {
+                # MongoDB는 UTC 기준 naive datetime을 반환
+                "published_at": doc["published_at"].replace(tzinfo=timezone.utc),
+                "url": doc["url"]
+            }
+        return watermarks
+
+    async def save_watermarks(self, marks: Dict[str, Dict[str, Any]]):
+        """
+        키워드별 워터마크를 저장합니다.
+        """
+        collection = await get_async_collection_by_name(WATERMARK_COLLECTION_NAME)
+        for query, mark in marks.items():
+            await collection.update_one(
+                {"_id": query},
+                {"$set": {
+                    "published_at": mark["published_at"],
+                    "url": mark["url"],
+                    "updated_at": datetime.now()
+                }},
+                upsert=True
+            )
+
+    async def _fetch_page_limited(self, semaphore: asyncio.Semaphore, query: str, start: int, display: int):
+        """
+        동시 요청 수 제한 안에서 한 페이지를 요청합니다.
+        """
+        async with semaphore:
+            return await self._fetch_page(query, start, display)
+
     def _remove_duplicates(self, articles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
         URL 기준으로 중복을 제거합니다.
@@ -231,7 +732,7 @@ class NewsCollectorMongo:
         return await self._fetch_news_by_query(query, max_results)
 
     def _filter_articles(self, articles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        keywords = ["kwater", "한국수자원공사", "수자원", "물관리", "댐", "수도", "상수도", "하수도"]
+        keywords = ARTICLE_KEYWORDS
         filtered_articles = []
 
         for article in articles:
@@ -243,7 +744,8 @@ class NewsCollectorMongo:
                 try:
                     published_at = datetime.strptime(article.get("pubDate", ""), "%a, %d %b %Y %H:%M:%S %z")
                 except:
-                    published_at = datetime.now()
+                    # 시간대가 없는 값은 UTC로 간주되므로 현재 시각도 UTC로
+                    published_at = utc_now()
                 
                 # 텍스트 정리
                 clean_title = self._clean_text(article.get("title", ""))
@@ -258,22 +760,44 @@ class NewsCollectorMongo:
 
         return filtered_articles
 
-    async def collect_and_save_news(self, query: str = "kwater OR 한국수자원공사", max_results: int = 100, sentiment_analyzer=None) -> Dict[str, Any]:
+    async def collect_and_save_news(self, query: str = "kwater OR 한국수자원공사", max_results: int = 100, sentiment_analyzer=None,
+                                    concurrent: bool = False, incremental: bool = False,
+                                    bulk: bool = False, queries: List[str] = None) -> Dict[str, Any]:
         """
         뉴스를 수집하고 MongoDB에 저장합니다.
+        
+        incremental=True이면 키워드별 워터마크 이후의 새 기사만 수집하고,
+        저장에 성공하면 워터마크를 갱신합니다. 워터마크가 있는 키워드는 max_results보다 새 기사가 많아도
+        워터마크까지 이어서 수집합니다.
+        queries를 주면 EXTENSIVE_SEARCH_QUERIES 대신 해당 키워드들만 수집합니다.
         """
         try:
+            queries = queries or EXTENSIVE_SEARCH_QUERIES
+            watermarks = await self.load_watermarks(queries) if incremental else None
+            
             # 뉴스 수집
-            articles = await self.fetch_news_extensive(query, max_results)
+            articles, per_query = await self._fetch_extensive(max_results, concurrent, watermarks=watermarks,
+                                                              queries=queries)
             
             # MongoDB에 저장
-            save_result = await self.save_articles_to_mongo(articles, sentiment_analyzer)
+            save_result = await self.save_articles_to_mongo(articles, sentiment_analyzer, bulk=bulk)
             
-            return {
+            result = {
                 "status": "success",
                 "collected_count": len(articles),
                 "save_result": save_result
             }
+            if self._quota_exceeded(per_query):
+                # 한도 소진 전까지 모은 기사는 저장하고, 수집이 중간에 멈췄음을 알림
+                result["quota_exceeded"] = True
+                result["message"] = "네이버 API 일일 호출 한도를 모두 사용해 수집을 중단했습니다."
+            
+            if incremental and save_result.get("status") == "success":
+                marks = self._advanced_watermarks(per_query, watermarks, articles)
+                await self.save_watermarks(marks)
+                result["watermarks_updated"] = len(marks)
+            
+            return result
             
         except Exception as e:
             logger.error(f"뉴스 수집 및 저장 실패: {str(e)}")
@@ -0,0 +1,73 @@
+import base64
+import json
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+from bson import ObjectId
+from bson.errors import InvalidId
+from date_utils import PUBLISHED_AT_LEGACY_STRINGS
+
+# 목록 조회의 기본 정렬 (발행일 최신순, 같은 발행일은 _id 역순)
+PAGE_SORT = [("published_at", -1), ("_id", -1)]
+
+
+def encode_cursor(article: Dict[str, Any]) -> str:
+    """
+    마지막 기사의 (published_at, _id)를 불투명한 커서 문자열로 만듭니다.
+    """
+    published_at = article.get("published_at")
+    if isinstance(published_at, datetime):
+        published_at = {"$date": published_at.isoformat()}
+    payload = {"p": published_at, "i": str(article["_id"])}
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[Any, ObjectId]:
+    """
+    커서 문자열을 (published_at, _id)로 되돌립니다. 잘못된 커서면 ValueError를 발생시킵니다.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(raw)
+        published_at = payload["p"]
+        if isinstance(published_at, dict):
+            published_at = datetime.fromisoformat(published_at["$date"])
+        return published_at, ObjectId(payload["i"])
+    except (ValueError, KeyError, TypeError, InvalidId) as e:
+        raise ValueError(f"잘못된 커서입니다: {cursor}") from e
+
+
+def keyset_filter(cursor: str) -> Dict[str, Any]:
+    """
+    커서 이후(더 오래된) 기사만 고르는 조건을 반환합니다.
+    """
+    published_at, object_id = decode_cursor(cursor)
+    conditions = [
+        {"published_at": {"$lt": published_at}},
+        {"published_at": published_at, "_id": {"$lt": object_id}}
+    ]
+    if PUBLISHED_AT_LEGACY_STRINGS and isinstance(published_at, datetime):
+        # 내림차순에서 문자열 값은 모든 datetime 뒤에 오므로 마이그레이션 전 문서도 이어서 조회
+        conditions.append({"published_at": {"$type": "string"}})
+    return {"$or": conditions}
+
+
+async def find_page(collection, query: Dict[str, Any], limit: int, offset: int = 0,
+                    cursor: Optional[str] = None,
+                    projection: Optional[Dict[str, Any]] = None) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """
+    한 페이지를 조회하고 (기사 목록, 다음 페이지 커서)를 반환합니다.
+    cursor가 주어지면 offset 대신 인덱스 범위 조건으로 이어서 조회하므로
+    페이지 깊이와 관계없이 비용이 일정합니다.
+    """
+    if cursor:
+        query = {"$and": [query, keyset_filter(cursor)]} if query else keyset_filter(cursor)
+        offset = 0
+
+    find_cursor = collection.find(query, projection).sort(PAGE_SORT)
+    if offset:
+        find_cursor = find_cursor.skip(offset)
+    articles = await find_cursor.limit(limit).to_list(length=limit)
+
+    next_cursor = encode_cursor(articles[-1]) if limit and len(articles) == limit else None
+    return articles, next_cursor
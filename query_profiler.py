@@ -0,0 +1,201 @@
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import time
+from contextlib import contextmanager
+from typing import Any, Awaitable, Dict, List
+from dotenv import load_dotenv
+from database_mongo import get_async_collection_by_name, SLOW_QUERY_COLLECTION_NAME
+from date_utils import utc_now
+from json_encoding import dumps_str
+from pagination import PAGE_SORT
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+load_dotenv()
+
+SLOW_QUERY_LOG_ENABLED = os.getenv("SLOW_QUERY_LOG_ENABLED", "true").lower() == "true"
+# 전체 처리 시간이 이 값(ms) 이상인 검색을 기록
+SLOW_QUERY_THRESHOLD_MS = float(os.getenv("SLOW_QUERY_THRESHOLD_MS", "500"))
+# 기록에 남기는 예시 쿼리의 최대 길이
+SLOW_QUERY_EXAMPLE_LENGTH = 2000
+
+SLOW_QUERY_SORTS = ("count", "max_ms", "total_ms", "last_seen_at")
+
+# explain() 실행 시간을 재는 단계 이름
+EXPLAIN_STAGE = "explain"
+
+
+class StageTimer:
+    """
+    요청 처리 단계별 소요 시간(ms)을 모읍니다. 동시에 실행되는 단계는 각자의 시간이 따로 기록됩니다.
+    """
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.stages: Dict[str, float] = {}
+
+    def _add(self, name: str, started: float):
+        self.stages[name] = self.stages.get(name, 0.0) + (time.perf_counter() - started) * 1000
+
+    @contextmanager
+    def stage(self, name: str):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._add(name, started)
+
+    async def measure(self, name: str, awaitable: Awaitable):
+        started = time.perf_counter()
+        try:
+            return await awaitable
+        finally:
+            self._add(name, started)
+
+    @property
+    def total_ms(self) -> float:
+        return (time.perf_counter() - self.started) * 1000
+
+    def server_timing(self) -> str:
+        """
+        Server-Timing 헤더 값을 만듭니다. 예: build;dur=0.12, find;dur=35.40, count;dur=80.02, total;dur=81.30
+        """
+        entries = [f"{name};dur={duration:.2f}" for name, duration in self.stages.items()]
+        entries.append(f"total;dur={self.total_ms:.2f}")
+        return ", ".join(entries)
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "stages_ms": {name: round(duration, 3) for name, duration in self.stages.items()},
+            "total_ms": round(self.total_ms, 3)
+        }
+
+
+def query_shape(value: Any) -> Any:
+    """
+    쿼리에서 값은 "?"로 바꾸고 필드와 연산자 구조만 남깁니다.
+    키워드나 날짜만 다른 검색은 같은 모양이 되므로 모양별로 느린 쿼리를 모을 수 있습니다.
+    """
+    if isinstance(value, dict):
+        return {key: query_shape(item) for key, item in sorted(value.items())}
+    if isinstance(value, (list, tuple)):
+        if value and all(isinstance(item, dict) for item in value):
+            # $and, $or 절은 구조를 유지
+            return [query_shape(item) for item in value]
+        return ["?"]
+    return "?"
+
+
+def _plan_stages(plan: Dict[str, Any], stages: List[str], indexes: List[str]):
+    if not isinstance(plan, dict):
+        return
+    if plan.get("stage"):
+        stages.append(plan["stage"])
+    if plan.get("indexName"):
+        indexes.append(plan["indexName"])
+    _plan_stages(plan.get("inputStage"), stages, indexes)
+    for child in plan.get("inputStages", []):
+        _plan_stages(child, stages, indexes)
+
+
+def summarize_explain(explain: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    explain() 결과에서 사용한 인덱스, 단계, 검사한 문서·키 수와 반환 문서 수만 추립니다.
+    """
+    planner = explain.get("queryPlanner", {})
+    winning_plan = planner.get("winningPlan", {})
+    # 슬롯 기반 실행 엔진은 queryPlan 아래에 단계 트리를 둠
+    winning_plan = winning_plan.get("queryPlan", winning_plan)
+    stages, indexes = [], []
+    _plan_stages(winning_plan, stages, indexes)
+
+    execution = explain.get("executionStats", {})
+    return {
+        "stages": stages,
+        "indexes": indexes,
+        "collection_scan": "COLLSCAN" in stages,
+        "docs_examined": execution.get("totalDocsExamined"),
+        "keys_examined": execution.get("totalKeysExamined"),
+        "returned": execution.get("nReturned"),
+        "execution_ms": execution.get("executionTimeMillis"),
+        "rejected_plans": len(planner.get("rejectedPlans", []))
+    }
+
+
+async def explain_query(collection, query: Dict[str, Any], limit: int = None) -> Dict[str, Any]:
+    """
+    검색 조건을 최신순 정렬로 실행 계획 분석(explain)합니다.
+    관련도순 검색도 같은 조건으로 문서를 고르므로 인덱스 사용 여부는 이 결과로 확인할 수 있습니다.
+    """
+    cursor = collection.find(query).sort(PAGE_SORT)
+    if limit:
+        cursor = cursor.limit(limit)
+    return summarize_explain(await cursor.explain())
+
+
+class SlowQueryLog:
+    """
+    처리 시간이 기준을 넘은 검색을 쿼리 모양별로 모아 slow_queries 컬렉션에 기록합니다.
+
+    모양마다 관측 횟수, 최대·누적 시간, 마지막 단계별 시간과 예시 쿼리를 남기므로
+    자주 느린 모양부터 인덱스를 보강할 수 있습니다. 기록은 응답을 늦추지 않도록 백그라운드에서 저장합니다.
+    """
+
+    def __init__(self, threshold_ms: float = SLOW_QUERY_THRESHOLD_MS, enabled: bool = SLOW_QUERY_LOG_ENABLED):
+        self.threshold_ms = threshold_ms
+        self.enabled = enabled
+        self._tasks = set()
+
+    def maybe_record(self, endpoint: str, query: Dict[str, Any], options: Dict[str, Any],
+                     timer: StageTimer, params: Dict[str, Any]) -> bool:
+        """
+        기준을 넘었으면 기록을 예약하고 True를 반환합니다.
+        explain을 함께 실행한 요청(debug)은 그 시간만큼 느려 보이므로 기록하지 않습니다.
+        """
+        total_ms = timer.total_ms
+        if not self.enabled or total_ms < self.threshold_ms or EXPLAIN_STAGE in timer.stages:
+            return False
+        logger.warning(f"느린 검색 {endpoint} {total_ms:.1f}ms: {timer.server_timing()}")
+        task = asyncio.create_task(self._record(endpoint, query, options, timer.summary(), params))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return True
+
+    async def _record(self, endpoint: str, query: Dict[str, Any], options: Dict[str, Any],
+                      timings: Dict[str, Any], params: Dict[str, Any]):
+        # 쿼리 모양에는 $로 시작하는 키가 있으므로 JSON 문자열로 저장
+        shape = json.dumps({"endpoint": endpoint, "options": options, "query": query_shape(query)},
+                           sort_keys=True, ensure_ascii=False)
+        now = utc_now()
+        try:
+            collection = await get_async_collection_by_name(SLOW_QUERY_COLLECTION_NAME)
+            await collection.update_one(
+                {"_id": hashlib.sha1(shape.encode("utf-8")).hexdigest()},
+                {
+                    "$inc": {"count": 1, "total_ms": timings["total_ms"]},
+                    "$max": {"max_ms": timings["total_ms"]},
+                    "$set": {
+                        "last_seen_at": now,
+                        "last_stages_ms": timings["stages_ms"],
+                        "last_params": params,
+                        "example": dumps_str(query)[:SLOW_QUERY_EXAMPLE_LENGTH]
+                    },
+                    "$setOnInsert": {"endpoint": endpoint, "shape": shape, "first_seen_at": now}
+                },
+                upsert=True
+            )
+        except Exception as e:
+            logger.error(f"느린 쿼리 기록 실패: {str(e)}")
+
+    async def top(self, limit: int = 20, sort_by: str = "count", endpoint: str = None) -> List[Dict[str, Any]]:
+        collection = await get_async_collection_by_name(SLOW_QUERY_COLLECTION_NAME)
+        query = {"endpoint": endpoint} if endpoint else {}
+        entries = await collection.find(query).sort(sort_by, -1).limit(limit).to_list(length=limit)
+        for entry in entries:
+            entry["avg_ms"] = round(entry["total_ms"] / entry["count"], 3) if entry.get("count") else None
+        return entries
@@ -0,0 +1,147 @@
+import asyncio
+import os
+import time
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Any
+from dotenv import load_dotenv
+from pymongo import ReturnDocument
+from database_mongo import get_async_collection_by_name, API_QUOTA_COLLECTION_NAME
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+load_dotenv()
+
+# 네이버 검색 API 호출 한도 (일일 25,000회, 초당 10회)
+NAVER_DAILY_QUOTA = int(os.getenv("NAVER_DAILY_QUOTA", "25000"))
+NAVER_RATE_PER_SECOND = float(os.getenv("NAVER_RATE_PER_SECOND", "10"))
+
+# 일일 호출 수를 MongoDB에 모아 여러 워커·스케줄러 프로세스가 같은 한도를 나눠 쓰도록 함
+NAVER_QUOTA_SHARED = os.getenv("NAVER_QUOTA_SHARED", "true").lower() == "true"
+
+# 일일 한도는 한국 시간 자정에 초기화됩니다.
+KST = timezone(timedelta(hours=9))
+
+
+class QuotaExceededError(Exception):
+    """일일 API 호출 한도를 모두 사용했을 때 발생합니다."""
+
+
+class NaverRateLimiter:
+    """
+    네이버 API 호출용 토큰 버킷 제한기입니다.
+    초당 호출 수와 일일 호출 수를 함께 관리하며, 여러 수집기가 공유할 수 있습니다.
+    shared_quota이면 일일 호출 수를 한국 날짜별 MongoDB 문서에 모아 다른 프로세스와도 한도를 나눠 씁니다.
+    """
+
+    def __init__(self, rate_per_second: float = NAVER_RATE_PER_SECOND, daily_limit: int = NAVER_DAILY_QUOTA,
+                 burst: float = None, shared_quota: bool = NAVER_QUOTA_SHARED):
+        self.rate_per_second = rate_per_second
+        self.capacity = burst if burst is not None else rate_per_second
+        self.daily_limit = daily_limit
+        self.shared_quota = shared_quota
+
+        self._tokens = self.capacity
+        self._last_refill = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = asyncio.Lock()
+
+        self._day = datetime.now(KST).date()
+        self._daily_used = 0
+
+        # 모니터링용 카운터
+        self.throttled_count = 0
+        self.backoff_count = 0
+
+    def _refill(self, now: float):
+        elapsed = now - self._last_refill
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.rate_per_second)
+        self._last_refill = now
+
+    def _roll_day(self):
+        today = datetime.now(KST).date()
+        if today != self._day:
+            self._day = today
+            self._daily_used = 0
+
+    def _quota_error(self) -> QuotaExceededError:
+        return QuotaExceededError(f"일일 API 호출 한도({self.daily_limit}회)를 모두 사용했습니다.")
+
+    async def _count_daily_call(self):
+        """
+        일일 호출 수를 하나 늘립니다. shared_quota이면 MongoDB 문서에 $inc로 더한 뒤
+        모든 프로세스의 합계로 한도를 확인합니다. MongoDB를 쓸 수 없으면 프로세스 안에서만 셉니다.
+        """
+        self._daily_used += 1
+        if not self.shared_quota:
+            return
+        try:
+            collection = await get_async_collection_by_name(API_QUOTA_COLLECTION_NAME)
+            doc = await collection.find_one_and_update(
+                {"_id": f"naver:{self._day.isoformat()}"},
+                {"$inc": {"used": 1}},
+                upsert=True,
+                return_document=ReturnDocument.AFTER
+            )
+            self._daily_used = doc["used"]
+        except Exception as e:
+            logger.warning(f"공유 일일 호출 수 갱신 실패, 이 프로세스의 호출 수로 대신합니다: {e}")
+        if self._daily_used > self.daily_limit:
+            raise self._quota_error()
+
+    async def acquire(self):
+        """
+        호출 한 번에 해당하는 토큰을 얻을 때까지 대기합니다.
+        일일 한도를 초과하면 QuotaExceededError를 발생시킵니다.
+        """
+        async with self._lock:
+            while True:
+                self._roll_day()
+                if self._daily_used >= self.daily_limit:
+                    raise self._quota_error()
+
+                now = time.monotonic()
+                if now < self._paused_until:
+                    await asyncio.sleep(self._paused_until - now)
+                    continue
+
+                self._refill(now)
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    await self._count_daily_call()
+                    return
+
+                self.throttled_count += 1
+                await asyncio.sleep((1 - self._tokens) / self.rate_per_second)
+
+    def pause(self, seconds: float):
+        """
+        서버가 호출을 거부했을 때 모든 호출자를 잠시 멈춥니다.
+        """
+        self.backoff_count += 1
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+    def status(self) -> Dict[str, Any]:
+        """
+        남은 호출 한도와 제한 현황을 반환합니다.
+        """
+        self._roll_day()
+        self._refill(time.monotonic())
+        return {
+            "daily_limit": self.daily_limit,
+            "daily_used": self._daily_used,
+            "daily_remaining": max(0, self.daily_limit - self._daily_used),
+            "quota_date": self._day.isoformat(),
+            "shared_quota": self.shared_quota,
+            "rate_per_second": self.rate_per_second,
+            "tokens_available": round(self._tokens, 3),
+            "paused_seconds": round(max(0.0, self._paused_until - time.monotonic()), 3),
+            "throttled_count": self.throttled_count,
+            "backoff_count": self.backoff_count
+        }
+
+
+# 프로세스 전체에서 공유하는 기본 제한기
+naver_rate_limiter = NaverRateLimiter()
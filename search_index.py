@@ -0,0 +1,288 @@
+import logging
+import os
+import re
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from pymongo import UpdateOne
+from dotenv import load_dotenv
+from database_mongo import get_collection
+from near_duplicate import SIMHASH_FIELD, SIMHASH_BAND_FIELD, CLUSTER_FIELD
+from sentiment_cache import SENTIMENT_KEY_FIELD
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+load_dotenv()
+
+# 기사 문서에 저장되는 n-gram 필드 (멀티키 인덱스로 역색인 역할을 함)
+SEARCH_GRAM_FIELD = "search_grams"
+NGRAM_SIZES = (2, 3)
+
+# 목록 응답에서 n-gram, SimHash, 감정분석 캐시 키 같은 내부용 필드를 제외하는 프로젝션
+# (cluster_id는 ObjectId라 기본 응답에서 빼고, 필요하면 fields=로 고름)
+ARTICLE_PROJECTION = {SEARCH_GRAM_FIELD: 0, SIMHASH_FIELD: 0, SIMHASH_BAND_FIELD: 0, CLUSTER_FIELD: 0,
+                      SENTIMENT_KEY_FIELD: 0}
+
+# 목록 응답 형태: full(색인용 필드를 뺀 전체 문서), summary(목록 화면용 요약)
+RESPONSE_VIEWS = ("full", "summary")
+
+# summary 응답에서 서버가 잘라 보내는 본문 길이(글자 수)
+SUMMARY_CONTENT_LENGTH = int(os.getenv("SUMMARY_CONTENT_LENGTH", "200"))
+
+# summary 응답 프로젝션 (감정은 라벨만, 본문은 앞부분만)
+SUMMARY_PROJECTION = {
+    "title": 1,
+    "url": 1,
+    "published_at": 1,
+    "sentiment": "$sentiment.sentiment",
+    "content": {"$substrCP": [{"$ifNull": ["$content", ""]}, 0, SUMMARY_CONTENT_LENGTH]}
+}
+
+# fields=로 고를 수 있는 필드 (sentiment.<점수>처럼 감정분석 하위 필드도 가능)
+SELECTABLE_FIELDS = ("_id", "title", "content", "url", "published_at", "sentiment",
+                     "created_at", "updated_at", "cluster_id", "is_duplicate")
+SENTIMENT_SUBFIELDS = ("sentiment", "confidence", "positive_score", "negative_score", "neutral_score")
+
+# 검색 방식: substring(부분 문자열, n-gram 색인), fulltext($text 전문 검색 인덱스)
+SEARCH_MODES = ("substring", "fulltext")
+
+# 검색 결과 정렬 방식
+SEARCH_SORTS = ("recent", "relevance")
+
+# 전문 검색 점수의 최신성 가중치가 절반으로 줄어드는 기간(일)
+RECENCY_HALF_LIFE_DAYS = float(os.getenv("SEARCH_RECENCY_HALF_LIFE_DAYS", "7"))
+
+# 관련도 점수에서 필드별 가중치 (제목 일치를 우대)
+RELEVANCE_WEIGHTS = {"title": 3, "content": 1}
+
+# 정규식 메타문자가 있는 키워드는 n-gram으로 후보를 좁힐 수 없음
+_REGEX_SPECIAL = re.compile(r"[.^$*+?{}\[\]\\|()]")
+
+
+def normalize_text(text: str) -> str:
+    """
+    소문자로 바꾸고 연속 공백을 하나로 합칩니다.
+    """
+    return " ".join((text or "").lower().split())
+
+
+def text_ngrams(text: str, sizes: Iterable[int] = NGRAM_SIZES) -> List[str]:
+    """
+    텍스트의 글자 n-gram을 중복 없이 반환합니다.
+    """
+    normalized = normalize_text(text)
+    grams = set()
+    for size in sizes:
+        for start in range(len(normalized) - size + 1):
+            gram = normalized[start:start + size]
+            if gram.strip():
+                grams.add(gram)
+    return sorted(grams)
+
+
+def document_grams(doc: Dict[str, Any]) -> List[str]:
+    """
+    기사의 제목과 내용에서 색인할 n-gram 목록을 만듭니다.
+    두 필드를 이어 붙이지 않으므로 경계를 걸친 n-gram은 생기지 않습니다.
+    """
+    grams = set(text_ngrams(doc.get("title", "")))
+    grams.update(text_ngrams(doc.get("content", "")))
+    return sorted(grams)
+
+
+def query_grams(keyword: str) -> List[str]:
+    """
+    키워드를 포함하는 문서가 반드시 가지고 있는 n-gram 목록을 반환합니다.
+    3글자 이상이면 선택도가 높은 trigram만, 2글자면 bigram을 사용합니다.
+    한 글자이거나 정규식 패턴이면 빈 목록을 반환합니다.
+    """
+    if not keyword or _REGEX_SPECIAL.search(keyword):
+        return []
+    normalized = normalize_text(keyword)
+    sizes = [size for size in NGRAM_SIZES if size <= len(normalized)]
+    if not sizes:
+        return []
+    return text_ngrams(normalized, (max(sizes),))
+
+
+def keyword_filter(keyword: str, fields: Tuple[str, ...]) -> Dict[str, Any]:
+    """
+    fields 중 하나에 keyword가 포함된 기사를 찾는 조건을 만듭니다.
+
+    n-gram 역색인으로 후보를 먼저 좁힌 뒤 기존 정규식으로 실제 포함 여부를 확인하므로
+    결과는 정규식 검색과 같습니다. 아직 n-gram이 없는 기존 문서도 함께 검사합니다.
+    """
+    regex = {"$regex": keyword, "$options": "i"}
+    if len(fields) == 1:
+        match = {fields[0]: regex}
+    else:
+        match = {"$or": [{field: regex} for field in fields]}
+
+    grams = query_grams(keyword)
+    if not grams:
+        return match
+    candidates = {
+        "$or": [
+            {SEARCH_GRAM_FIELD: {"$all": grams}},
+            {SEARCH_GRAM_FIELD: None}
+        ]
+    }
+    return {"$and": [candidates, match]}
+
+
+def parse_fields(fields: str) -> List[str]:
+    """
+    쉼표로 구분한 fields 파라미터를 검사해 필드 목록으로 반환합니다. 모르는 필드가 있으면 ValueError를 발생시킵니다.
+    """
+    selected = [field.strip() for field in (fields or "").split(",") if field.strip()]
+    unknown = [
+        field for field in selected
+        if field not in SELECTABLE_FIELDS
+        and not (field.startswith("sentiment.") and field.split(".", 1)[1] in SENTIMENT_SUBFIELDS)
+    ]
+    if unknown:
+        raise ValueError(f"선택할 수 없는 필드입니다: {', '.join(unknown)} "
+                         f"(가능한 필드: {', '.join(SELECTABLE_FIELDS)}, sentiment.<{'|'.join(SENTIMENT_SUBFIELDS)}>)")
+    return selected
+
+
+def article_projection(view: str = "full", fields: List[str] = None) -> Dict[str, Any]:
+    """
+    목록 응답에 쓸 MongoDB 프로젝션을 반환합니다. fields가 있으면 view보다 우선합니다.
+    커서 페이지네이션과 정렬에 필요한 _id, published_at은 항상 포함됩니다.
+    """
+    if fields:
+        projection = {field: 1 for field in fields if field != "_id"}
+        if "sentiment" in projection:
+            # 상위 필드를 고르면 하위 필드 지정은 필요 없고, 함께 지정하면 MongoDB가 경로 충돌로 거부함
+            projection = {field: 1 for field in projection if not field.startswith("sentiment.")}
+        projection["published_at"] = 1
+        return projection
+    if view == "summary":
+        return dict(SUMMARY_PROJECTION)
+    return ARTICLE_PROJECTION
+
+
+def _relevance_score(terms: List[Tuple[str, str]]) -> Dict[str, Any]:
+    """
+    (필드, 키워드)별 등장 횟수에 필드 가중치를 곱해 더하는 집계 식을 만듭니다.
+    """
+    parts = []
+    for field, keyword in terms:
+        occurrences = {"$size": {"$regexFindAll": {
+            "input": {"$ifNull": [f"${field}", ""]},
+            "regex": keyword,
+            "options": "i"
+        }}}
+        parts.append({"$multiply": [RELEVANCE_WEIGHTS.get(field, 1), occurrences]})
+    return {"$add": parts} if parts else {"$literal": 0}
+
+
+def _ranked_pipeline(query: Dict[str, Any], relevance: Dict[str, Any],
+                     projection: Optional[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    점수를 계산한 뒤 정렬 전에 필요한 필드만 남기는 파이프라인 앞부분을 만듭니다.
+    """
+    projection = projection or ARTICLE_PROJECTION
+    if all(value == 0 for value in projection.values()):
+        # 제외 프로젝션은 점수 계산 전에 적용해도 됨
+        return [
+            {"$match": query},
+            {"$project": projection},
+            {"$addFields": {"relevance": relevance}}
+        ]
+    # 점수 계산에 쓴 본문 등은 정렬 전에 버려 정렬 메모리와 응답 크기를 줄임
+    return [
+        {"$match": query},
+        {"$addFields": {"relevance": relevance}},
+        {"$project": {**projection, "relevance": 1}}
+    ]
+
+
+async def find_ranked_page(collection, query: Dict[str, Any], terms: List[Tuple[str, str]],
+                           limit: int, offset: int = 0,
+                           projection: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+    """
+    관련도 순으로 한 페이지를 조회합니다. 점수가 같으면 최신순으로 정렬합니다.
+    각 기사에는 relevance 필드로 점수가 담깁니다. projection은 article_projection()의 결과입니다.
+    """
+    pipeline = _ranked_pipeline(query, _relevance_score(terms), projection)
+    pipeline.append({"$sort": {"relevance": -1, "published_at": -1, "_id": -1}})
+    if offset:
+        pipeline.append({"$skip": offset})
+    pipeline.append({"$limit": limit})
+    return await collection.aggregate(pipeline).to_list(length=limit)
+
+
+def text_search_filter(keywords: List[str]) -> Dict[str, Any]:
+    """
+    제목·내용 텍스트 인덱스를 사용하는 $text 조건을 만듭니다.
+    텍스트 인덱스는 컬렉션당 하나이므로 필드를 나눠 검색할 수 없고, 제목 가중치로 순위에 반영됩니다.
+    """
+    return {"$text": {"$search": " ".join(keyword for keyword in keywords if keyword)}}
+
+
+def _recency_factor(recency_boost: float) -> Dict[str, Any]:
+    """
+    1 + recency_boost * 0.5^(경과일 / 반감기) 집계 식을 만듭니다.
+    published_at이 문자열이든 날짜든 변환해서 계산하며, 변환할 수 없으면 가중치를 주지 않습니다.
+    """
+    published = {"$convert": {"input": "$published_at", "to": "date", "onError": None, "onNull": None}}
+    age_days = {"$divide": [{"$subtract": ["$$NOW", published]}, 86400000]}
+    decay = {"$pow": [0.5, {"$divide": [{"$max": [age_days, 0]}, RECENCY_HALF_LIFE_DAYS]}]}
+    return {"$cond": [
+        {"$eq": [{"$type": published}, "date"]},
+        {"$add": [1, {"$multiply": [recency_boost, decay]}]},
+        1
+    ]}
+
+
+async def find_text_page(collection, query: Dict[str, Any], limit: int, offset: int = 0,
+                         recency_boost: float = 0.0,
+                         projection: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+    """
+    $text 조건이 들어 있는 query를 텍스트 점수 순으로 조회합니다.
+    recency_boost가 0보다 크면 최근 기사일수록 점수를 높입니다.
+    각 기사에는 relevance 필드로 점수가 담깁니다. projection은 article_projection()의 결과입니다.
+    """
+    score = {"$meta": "textScore"}
+    if recency_boost > 0:
+        score = {"$multiply": [score, _recency_factor(recency_boost)]}
+    pipeline = _ranked_pipeline(query, score, projection)
+    pipeline.append({"$sort": {"relevance": -1, "published_at": -1, "_id": -1}})
+    if offset:
+        pipeline.append({"$skip": offset})
+    pipeline.append({"$limit": limit})
+    return await collection.aggregate(pipeline).to_list(length=limit)
+
+
+def backfill_search_grams(batch_size: int = 500, limit: Optional[int] = None) -> int:
+    """
+    n-gram 필드가 없는 기존 기사에 색인을 채웁니다. 처리한 문서 수를 반환합니다.
+    """
+    collection = get_collection()
+    cursor = collection.find(
+        {SEARCH_GRAM_FIELD: {"$exists": False}},
+        {"title": 1, "content": 1}
+    ).batch_size(batch_size)
+    if limit:
+        cursor = cursor.limit(limit)
+
+    updated = 0
+    operations = []
+    for doc in cursor:
+        operations.append(UpdateOne({"_id": doc["_id"]}, {"$set": {SEARCH_GRAM_FIELD: document_grams(doc)}}))
+        if len(operations) >= batch_size:
+            collection.bulk_write(operations, ordered=False)
+            updated += len(operations)
+            operations = []
+            logger.info(f"n-gram 색인 진행: {updated}개")
+    if operations:
+        collection.bulk_write(operations, ordered=False)
+        updated += len(operations)
+    return updated
+
+
+if __name__ == "__main__":
+    total = backfill_search_grams()
+    print(f"n-gram 색인 완료: {total}개 문서")
@@ -0,0 +1,160 @@
+import hashlib
+import logging
+import os
+from collections import OrderedDict
+from typing import Dict, List, Any, Optional
+from dotenv import load_dotenv
+from pymongo import UpdateOne
+from database_mongo import get_async_collection, get_collection
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+load_dotenv()
+
+SENTIMENT_CACHE_SIZE = int(os.getenv("SENTIMENT_CACHE_SIZE", "10000"))
+
+# 기사 문서에 함께 저장하는 감정분석 결과 캐시 키 (내부용이라 응답에서는 제외)
+SENTIMENT_KEY_FIELD = "sentiment_key"
+
+
+def sentiment_key(text: str, lexicon_version: str) -> str:
+    """
+    정규화한 텍스트와 사전 버전으로 감정분석 결과 캐시 키를 만듭니다.
+    소문자 변환과 연속 공백 정리는 키워드 매칭 결과를 바꾸지 않습니다.
+    """
+    normalized = " ".join((text or "").lower().split())
+    return hashlib.sha1(f"{lexicon_version}\0{normalized}".encode("utf-8")).hexdigest()
+
+
+class SentimentCache:
+    """
+    텍스트 해시 기반 감정분석 결과 캐시입니다.
+    프로세스 내 LRU를 먼저 확인하고, 없으면 같은 URL로 저장된 기사의 감정분석 결과를 재사용합니다.
+    분석기와 같은 analyze() 인터페이스를 제공하므로 분석기 대신 넘겨줄 수 있습니다.
+    """
+
+    def __init__(self, analyzer, max_size: int = SENTIMENT_CACHE_SIZE):
+        self.analyzer = analyzer
+        self.max_size = max_size
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+        self.stored_hits = 0
+
+    @property
+    def lexicon_version(self) -> str:
+        return self.analyzer.lexicon_version
+
+    @property
+    def model_name(self) -> str:
+        return self.analyzer.model_name
+
+    def key(self, text: str) -> str:
+        return sentiment_key(text, self.lexicon_version)
+
+    def _put(self, key: str, sentiment: Dict[str, Any]):
+        self._entries[key] = sentiment
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def analyze(self, text: str) -> Dict[str, Any]:
+        """
+        캐시된 결과가 있으면 반환하고, 없으면 분석 후 캐시에 저장합니다.
+        """
+        key = self.key(text)
+        cached = self._entries.get(key)
+        if cached is not None:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return dict(cached)
+
+        self.misses += 1
+        sentiment = self.analyzer.analyze(text)
+        self._put(key, dict(sentiment))
+        return sentiment
+
+    async def preload(self, articles: List[Dict[str, Any]]):
+        """
+        캐시에 없는 기사 중 같은 URL·같은 텍스트로 이미 저장된 기사의 감정분석 결과를 불러옵니다.
+        키가 없는 기존 기사는 어느 사전으로 분석했는지 알 수 없어 backfill_sentiment_keys로 키를 채우기 전까지는 재사용하지 않습니다.
+        """
+        pending = {}
+        for article in articles:
+            key = self.key(f"{article['title']} {article['content']}")
+            if key not in self._entries and article.get("url"):
+                pending[article["url"]] = key
+
+        if not pending:
+            return
+
+        try:
+            collection = await get_async_collection()
+            cursor = collection.find(
+                {"url": {"$in": list(pending)}, SENTIMENT_KEY_FIELD: {"$exists": True}},
+                {"url": 1, SENTIMENT_KEY_FIELD: 1, "sentiment": 1}
+            )
+            async for doc in cursor:
+                # 저장 당시 텍스트와 사전 버전이 같을 때만 재사용
+                if doc.get("sentiment") and doc[SENTIMENT_KEY_FIELD] == pending.get(doc["url"]):
+                    self._put(doc[SENTIMENT_KEY_FIELD], doc["sentiment"])
+                    self.stored_hits += 1
+        except Exception as e:
+            logger.warning(f"저장된 감정분석 결과 조회 실패: {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "stored_hits": self.stored_hits,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            "lexicon_version": self.lexicon_version
+        }
+
+    def clear(self):
+        self._entries.clear()
+
+
+def backfill_sentiment_keys(analyzer, batch_size: int = 500, limit: Optional[int] = None) -> int:
+    """
+    감정분석 키가 없는 기존 기사에 현재 사전 버전의 키를 채웁니다.
+    다시 분석한 결과가 저장된 결과와 같은 문서에만 키를 붙이므로 저장된 감정분석 결과는 바뀌지 않습니다.
+    키를 붙인 문서 수를 반환합니다.
+    """
+    collection = get_collection()
+    cursor = collection.find(
+        {SENTIMENT_KEY_FIELD: {"$exists": False}, "sentiment": {"$ne": None}},
+        {"title": 1, "content": 1, "sentiment": 1}
+    ).batch_size(batch_size)
+    if limit:
+        cursor = cursor.limit(limit)
+
+    updated = 0
+    operations = []
+    for doc in cursor:
+        text = f"{doc.get('title', '')} {doc.get('content', '')}"
+        if analyzer.analyze(text) != doc["sentiment"]:
+            continue
+        operations.append(UpdateOne({"_id": doc["_id"]},
+                                    {"$set": {SENTIMENT_KEY_FIELD: sentiment_key(text, analyzer.lexicon_version)}}))
+        if len(operations) >= batch_size:
+            collection.bulk_write(operations, ordered=False)
+            updated += len(operations)
+            operations = []
+            logger.info(f"감정분석 키 채우기 진행: {updated}개")
+    if operations:
+        collection.bulk_write(operations, ordered=False)
+        updated += len(operations)
+    return updated
+
+
+if __name__ == "__main__":
+    from simple_sentiment_analyzer import SimpleSentimentAnalyzer
+    total = backfill_sentiment_keys(SimpleSentimentAnalyzer())
+    print(f"감정분석 키 채우기 완료: {total}개 문서")
@@ -0,0 +1,56 @@
+from typing import List, Sequence, Tuple
+import numpy as np
+from keyword_automaton import KeywordAutomaton
+
+# 일괄 감정분석 프로세스 풀의 작업자 함수입니다.
+# spawn 작업자는 이 모듈만 불러오도록 NumPy와 키워드 오토마톤 외에는 의존하지 않습니다.
+
+# 작업자 프로세스가 사용하는 (오토마톤, 키워드별 가중치). 작업자 초기화 시 한 번 만듭니다.
+_worker_lexicon = None
+
+
+def compile_lexicon(lexicons: Sequence[Sequence[str]]) -> Tuple[KeywordAutomaton, List[List[int]]]:
+    """
+    (긍정, 부정, 중립) 키워드 목록을 하나의 오토마톤과 키워드별 (긍정, 부정, 중립) 가중치로 컴파일합니다.
+    목록에 중복된 키워드는 중복 횟수만큼 집계합니다.
+    """
+    matcher = KeywordAutomaton(keyword for keywords in lexicons for keyword in keywords)
+    weights = [[0] * len(lexicons) for _ in matcher.keywords]
+    keyword_ids = {keyword: keyword_id for keyword_id, keyword in enumerate(matcher.keywords)}
+    for category, keywords in enumerate(lexicons):
+        for keyword in keywords:
+            weights[keyword_ids[keyword]][category] += 1
+    return matcher, weights
+
+
+def count_keywords(matcher: KeywordAutomaton, weights: List[List[int]], text: str) -> List[int]:
+    """
+    텍스트에 포함된 긍정/부정/중립 키워드 수를 한 번의 순회로 셉니다.
+    """
+    counts = [0, 0, 0]
+    for keyword_id in matcher.find_ids(text):
+        keyword_weights = weights[keyword_id]
+        counts[0] += keyword_weights[0]
+        counts[1] += keyword_weights[1]
+        counts[2] += keyword_weights[2]
+    return counts
+
+
+def count_matrix(matcher: KeywordAutomaton, weights: List[List[int]], texts: List[str]) -> np.ndarray:
+    """
+    텍스트별 (긍정, 부정, 중립) 키워드 수 행렬을 반환합니다.
+    """
+    counts = np.zeros((len(texts), 3), dtype=np.int64)
+    for row, text in enumerate(texts):
+        if text and isinstance(text, str):
+            counts[row] = count_keywords(matcher, weights, text.lower())
+    return counts
+
+
+def init_worker(lexicons: Sequence[Sequence[str]]):
+    global _worker_lexicon
+    _worker_lexicon = compile_lexicon(lexicons)
+
+
+def count_chunk(texts: List[str]) -> np.ndarray:
+    return count_matrix(*_worker_lexicon, texts)
@@ -1,10 +1,30 @@
 import re
+import os
+import json
+import hashlib
+import asyncio
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
 from typing import Dict, List, Any
+import numpy as np
+from metrics import counter, histogram
+from sentiment_worker import compile_lexicon, count_keywords, count_matrix, init_worker, count_chunk
+
+# 감정분석 처리량 지표 (method: single은 analyze, batch는 analyze_batch)
+SENTIMENT_TEXTS = counter("sentiment_texts_analyzed_total", "감정분석한 텍스트 수", ("method",))
+SENTIMENT_BATCH_DURATION = histogram("sentiment_batch_duration_seconds", "일괄 감정분석 시간")
 
 class SimpleSentimentAnalyzer:
     def __init__(self):
         self.model_name = "Simple Rule-based Sentiment Analyzer"
         
+        # 일괄 분석 설정: 이 개수 이상이면 프로세스 풀에서 청크 단위로 나눠 처리
+        self.batch_workers = int(os.getenv("SENTIMENT_BATCH_WORKERS", str(os.cpu_count() or 1)))
+        self.batch_chunk_size = int(os.getenv("SENTIMENT_BATCH_CHUNK_SIZE", "500"))
+        self.parallel_threshold = int(os.getenv("SENTIMENT_PARALLEL_THRESHOLD", "2000"))
+        self._process_pool = None
+        
         # 긍정 키워드
         self.positive_keywords = [
             '좋다', '훌륭하다', '우수하다', '성공', '발전', '증가', '향상', '개선',
@@ -27,6 +47,32 @@ class SimpleSentimentAnalyzer:
             '계획', '정책', '제도', '시스템', '프로그램', '프로젝트', '사업',
             '회의', '협의', '토론', '논의', '검토', '심의', '의결', '결정'
         ]
+        
+        self.compile_lexicon()
+
+    def compile_lexicon(self):
+        """
+        키워드 목록을 하나의 다중 패턴 오토마톤으로 컴파일합니다.
+        키워드 목록을 수정한 뒤에는 다시 호출해야 합니다.
+        """
+        lexicons = [self.positive_keywords, self.negative_keywords, self.neutral_keywords]
+        
+        # 사전이 바뀌면 버전도 바뀌어 이전 분석 결과 캐시를 재사용하지 않음
+        self.lexicon_version = hashlib.sha1(
+            json.dumps(lexicons, ensure_ascii=False).encode("utf-8")
+        ).hexdigest()[:12]
+        
+        self._lexicons = [list(keywords) for keywords in lexicons]
+        self._matcher, self._keyword_weights = compile_lexicon(self._lexicons)
+        
+        # 작업자는 풀을 만들 때의 사전을 쓰므로 사전이 바뀌면 다음 일괄 분석에서 풀을 새로 만듦
+        self.shutdown()
+
+    def _count_keywords(self, text: str) -> List[int]:
+        """
+        텍스트에 포함된 긍정/부정/중립 키워드 수를 한 번의 순회로 셉니다.
+        """
+        return count_keywords(self._matcher, self._keyword_weights, text)
 
     def analyze(self, text: str) -> Dict[str, Any]:
         """
@@ -38,6 +84,7 @@ class SimpleSentimentAnalyzer:
         Returns:
             감정 분석 결과
         """
+        SENTIMENT_TEXTS.inc(method="single")
         if not text or not isinstance(text, str):
             return {
                 "sentiment": "neutral",
@@ -51,9 +98,7 @@ class SimpleSentimentAnalyzer:
         text = text.lower()
         
         # 키워드 카운트
-        positive_count = sum(1 for keyword in self.positive_keywords if keyword in text)
-        negative_count = sum(1 for keyword in self.negative_keywords if keyword in text)
-        neutral_count = sum(1 for keyword in self.neutral_keywords if keyword in text)
+        positive_count, negative_count, neutral_count = self._count_keywords(text)
         
         # 총 키워드 수
         total_keywords = positive_count + negative_count + neutral_count
@@ -95,13 +140,89 @@ class SimpleSentimentAnalyzer:
         """
         여러 텍스트의 감정을 일괄 분석합니다.
         
+        키워드 수를 (텍스트 수 x 3) 행렬로 모은 뒤 점수를 NumPy로 한꺼번에 계산합니다.
+        텍스트가 parallel_threshold개 이상이면 청크로 나눠 프로세스 풀에서 셉니다.
+        결과는 텍스트마다 analyze()를 호출한 것과 같습니다.
+        
         Args:
             texts: 분석할 텍스트 리스트
             
         Returns:
             감정 분석 결과 리스트
         """
-        return [self.analyze(text) for text in texts]
+        if not texts:
+            return []
+        
+        started = time.perf_counter()
+        if len(texts) < self.parallel_threshold or self.batch_workers <= 1:
+            counts = self.count_matrix(texts)
+        else:
+            chunks = [texts[i:i + self.batch_chunk_size] for i in range(0, len(texts), self.batch_chunk_size)]
+            counts = np.vstack(list(self._get_process_pool().map(count_chunk, chunks)))
+        
+        results = self._results_from_counts(counts)
+        SENTIMENT_TEXTS.inc(len(texts), method="batch")
+        SENTIMENT_BATCH_DURATION.observe(time.perf_counter() - started)
+        return results
+
+    async def analyze_batch_async(self, texts: List[str]) -> List[Dict[str, Any]]:
+        """
+        이벤트 루프를 막지 않도록 일괄 분석을 별도 스레드에서 실행합니다.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.analyze_batch, texts)
+
+    def count_matrix(self, texts: List[str]) -> np.ndarray:
+        """
+        텍스트별 (긍정, 부정, 중립) 키워드 수 행렬을 반환합니다.
+        """
+        return count_matrix(self._matcher, self._keyword_weights, texts)
+
+    def _results_from_counts(self, counts: np.ndarray) -> List[Dict[str, Any]]:
+        """
+        키워드 수 행렬로부터 analyze()와 같은 형식의 결과 목록을 만듭니다.
+        """
+        totals = counts.sum(axis=1)
+        scores = counts / np.where(totals == 0, 1, totals)[:, None]
+        positive, negative, neutral = scores[:, 0], scores[:, 1], scores[:, 2]
+        
+        # 감정 결정 (analyze와 같은 비교 순서)
+        is_positive = (positive > negative) & (positive > neutral)
+        is_negative = ~is_positive & (negative > positive) & (negative > neutral)
+        labels = np.where(is_positive, "positive", np.where(is_negative, "negative", "neutral"))
+        confidences = np.where(is_positive, positive, np.where(is_negative, negative, neutral))
+        
+        # 반올림은 analyze와 같도록 파이썬 round를 사용
+        results = []
+        for label, confidence, (positive_score, negative_score, neutral_score) in zip(
+                labels.tolist(), confidences.tolist(), scores.tolist()):
+            results.append({
+                "sentiment": label,
+                "confidence": round(confidence, 3),
+                "positive_score": round(positive_score, 3),
+                "negative_score": round(negative_score, 3),
+                "neutral_score": round(neutral_score, 3)
+            })
+        return results
+
+    def _get_process_pool(self) -> ProcessPoolExecutor:
+        if self._process_pool is None:
+            self._process_pool = ProcessPoolExecutor(
+                max_workers=self.batch_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                # 작업자에는 분석기 대신 키워드 목록만 넘겨 sentiment_worker 모듈만 불러오게 함
+                initializer=init_worker,
+                initargs=(self._lexicons,)
+            )
+        return self._process_pool
+
+    def shutdown(self):
+        """
+        일괄 분석용 프로세스 풀을 종료합니다.
+        """
+        if self._process_pool is not None:
+            self._process_pool.shutdown()
+            self._process_pool = None
 
     def get_sentiment_label(self, sentiment_result: Dict[str, Any]) -> str:
         """
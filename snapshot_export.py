@@ -0,0 +1,210 @@
+import argparse
+import json
+import logging
+import os
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+from dotenv import load_dotenv
+from database_mongo import get_collection
+from date_utils import to_utc_datetime, utc_now, PUBLISHED_AT_AS_DATE
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+load_dotenv()
+
+SNAPSHOT_DIR = os.getenv("SNAPSHOT_DIR", "snapshots")
+SNAPSHOT_COMPRESSION = os.getenv("SNAPSHOT_COMPRESSION", "zstd")
+# 마지막 내보내기 직전에 저장되던 기사를 놓치지 않도록 워터마크를 이만큼(초) 앞당겨 다시 확인
+SNAPSHOT_WATERMARK_OVERLAP = float(os.getenv("SNAPSHOT_WATERMARK_OVERLAP", "300"))
+
+MANIFEST_NAME = "_manifest.json"
+PARTITION_KEY = "published_date"
+UNKNOWN_DAY = "unknown"
+
+SCORE_COLUMNS = ["positive_score", "negative_score", "neutral_score", "confidence"]
+
+
+def _load_pyarrow():
+    """
+    pyarrow는 스냅샷 내보내기에서만 필요하므로 사용할 때 불러옵니다.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise RuntimeError("스냅샷 내보내기에는 pyarrow가 필요합니다: pip install pyarrow") from e
+    return pa, pq
+
+
+def _schema(pa):
+    timestamp = pa.timestamp("ms", tz="UTC")
+    return pa.schema([
+        ("_id", pa.string()),
+        ("title", pa.string()),
+        ("content", pa.string()),
+        ("url", pa.string()),
+        ("published_at", timestamp),
+        ("sentiment", pa.string()),
+        *[(column, pa.float64()) for column in SCORE_COLUMNS],
+        ("created_at", timestamp),
+        ("updated_at", timestamp)
+    ])
+
+
+def _flatten(doc: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    기사 문서를 열 단위 행으로 펼칩니다. 감정분석 점수는 개별 열이 됩니다.
+    """
+    sentiment = doc.get("sentiment") or {}
+    row = {
+        "_id": str(doc["_id"]),
+        "title": doc.get("title"),
+        "content": doc.get("content"),
+        "url": doc.get("url"),
+        "published_at": to_utc_datetime(doc.get("published_at")),
+        "sentiment": sentiment.get("sentiment"),
+        "created_at": doc.get("created_at"),
+        "updated_at": doc.get("updated_at")
+    }
+    for column in SCORE_COLUMNS:
+        value = sentiment.get(column)
+        row[column] = float(value) if value is not None else None
+    return row
+
+
+class SnapshotExporter:
+    """
+    기사 컬렉션을 발행일(UTC)별 Parquet 파일로 내보냅니다.
+
+    output_dir/published_date=YYYY-MM-DD/articles.parquet 형태로 저장하며,
+    _manifest.json에 날짜별 기사 수와 마지막으로 내보낸 시점(워터마크)을 기록합니다.
+    증분 실행은 워터마크(UTC 기준 created_at/updated_at) 이후 생성·수정된 기사가 속한 날짜의 파일만 다시 씁니다.
+    증분 실행은 추가·수정만 반영하므로, 삭제된 기사는 그 날짜에 다른 변경이 없으면 파일에 남습니다.
+    기사를 삭제했거나 created_at이 로컬 시각으로 저장되던 때의 스냅샷을 이어 쓸 때는 full=True(--full)로 다시 내보내세요.
+    """
+
+    def __init__(self, output_dir: str = SNAPSHOT_DIR, compression: str = SNAPSHOT_COMPRESSION):
+        self.output_dir = output_dir
+        self.compression = compression
+        self.collection = get_collection()
+        self.pa, self.pq = _load_pyarrow()
+        self.schema = _schema(self.pa)
+
+    @property
+    def manifest_path(self) -> str:
+        return os.path.join(self.output_dir, MANIFEST_NAME)
+
+    def load_manifest(self) -> Dict[str, Any]:
+        if not os.path.exists(self.manifest_path):
+            return {"watermark": None, "partitions": {}}
+        with open(self.manifest_path, encoding="utf-8") as f:
+            return json.load(f)
+
+    def _save_manifest(self, manifest: Dict[str, Any]):
+        tmp_path = self.manifest_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.manifest_path)
+
+    def _changed_days(self, since: Optional[datetime]) -> List[str]:
+        """
+        since 이후 생성·수정된 기사의 발행일 목록을 반환합니다. since가 없으면 모든 날짜입니다.
+        """
+        match = {}
+        if since is not None:
+            match = {"$or": [{"updated_at": {"$gt": since}}, {"created_at": {"$gt": since}}]}
+        pipeline = [
+            {"$match": match},
+            {"$group": {"_id": {"$dateToString": {
+                "format": "%Y-%m-%d",
+                "date": PUBLISHED_AT_AS_DATE
+            }}}}
+        ]
+        return sorted(row["_id"] or UNKNOWN_DAY for row in self.collection.aggregate(pipeline))
+
+    def _day_query(self, day: str) -> Dict[str, Any]:
+        if day == UNKNOWN_DAY:
+            return {"$expr": {"$eq": [PUBLISHED_AT_AS_DATE, None]}}
+        start = datetime.strptime(day, "%Y-%m-%d")
+        end = start + timedelta(days=1)
+        # _changed_days와 같이 문자열 published_at은 변환한 UTC 시각으로 날짜를 정함
+        # ("+09:00" 문자열을 문자열 순서로 비교하면 다른 날짜 파티션에 들어감)
+        return {"$or": [
+            {"published_at": {"$gte": start, "$lt": end}},
+            {"published_at": {"$type": "string"},
+             "$expr": {"$and": [{"$gte": [PUBLISHED_AT_AS_DATE, start]}, {"$lt": [PUBLISHED_AT_AS_DATE, end]}]}}
+        ]}
+
+    def export_day(self, day: str) -> Dict[str, Any]:
+        """
+        하루치 기사를 읽어 해당 날짜 파일을 새로 씁니다. 임시 파일에 쓴 뒤 교체하므로 읽는 쪽은 항상 완전한 파일을 봅니다.
+        """
+        rows = []
+        watermark = None
+        projection = {"title": 1, "content": 1, "url": 1, "published_at": 1, "sentiment": 1,
+                      "created_at": 1, "updated_at": 1}
+        for doc in self.collection.find(self._day_query(day), projection).sort("_id", 1):
+            rows.append(_flatten(doc))
+            for field in ("created_at", "updated_at"):
+                if doc.get(field) and (watermark is None or doc[field] > watermark):
+                    watermark = doc[field]
+
+        partition_dir = os.path.join(self.output_dir, f"{PARTITION_KEY}={day}")
+        file_path = os.path.join(partition_dir, "articles.parquet")
+        if not rows:
+            if os.path.exists(file_path):
+                os.remove(file_path)
+            return {"rows": 0, "watermark": None}
+
+        os.makedirs(partition_dir, exist_ok=True)
+        columns = {field.name: [row[field.name] for row in rows] for field in self.schema}
+        table = self.pa.table(columns, schema=self.schema)
+        tmp_path = file_path + ".tmp"
+        self.pq.write_table(table, tmp_path, compression=self.compression)
+        os.replace(tmp_path, file_path)
+        return {"rows": len(rows), "watermark": watermark}
+
+    def run(self, full: bool = False) -> Dict[str, Any]:
+        """
+        스냅샷을 내보냅니다. full=False이면 변경된 날짜만 다시 씁니다.
+        """
+        os.makedirs(self.output_dir, exist_ok=True)
+        manifest = {"watermark": None, "partitions": {}} if full else self.load_manifest()
+        since = None
+        if manifest.get("watermark"):
+            since = datetime.fromisoformat(manifest["watermark"]) - timedelta(seconds=SNAPSHOT_WATERMARK_OVERLAP)
+
+        days = self._changed_days(since)
+        watermark = since
+        total_rows = 0
+        for day in days:
+            result = self.export_day(day)
+            total_rows += result["rows"]
+            if result["rows"]:
+                manifest["partitions"][day] = {"rows": result["rows"]}
+            else:
+                manifest["partitions"].pop(day, None)
+            if result["watermark"] and (watermark is None or result["watermark"] > watermark):
+                watermark = result["watermark"]
+            logger.info(f"스냅샷 {day}: {result['rows']}개")
+
+        previous = datetime.fromisoformat(manifest["watermark"]) if manifest.get("watermark") else None
+        if watermark is not None and (previous is None or watermark > previous):
+            manifest["watermark"] = watermark.isoformat()
+        manifest["exported_at"] = utc_now().isoformat()
+        self._save_manifest(manifest)
+        return {"days": len(days), "rows": total_rows, "watermark": manifest.get("watermark")}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="기사 컬렉션을 발행일별 Parquet 스냅샷으로 내보냅니다.")
+    parser.add_argument("--output", default=SNAPSHOT_DIR, help="스냅샷 디렉터리")
+    parser.add_argument("--full", action="store_true", help="변경 여부와 관계없이 모든 날짜를 다시 씀")
+    parser.add_argument("--compression", default=SNAPSHOT_COMPRESSION)
+    args = parser.parse_args()
+
+    exporter = SnapshotExporter(args.output, args.compression)
+    result = exporter.run(full=args.full)
+    print(f"스냅샷 완료: 날짜 {result['days']}개, 기사 {result['rows']}개 (워터마크 {result['watermark']})")
@@ -0,0 +1,326 @@
+import asyncio
+import logging
+import os
+import socket
+from datetime import timedelta
+from typing import Any, Dict, List
+from dotenv import load_dotenv
+from pymongo import UpdateOne, ReplaceOne
+from pymongo.errors import DuplicateKeyError
+from database_mongo import (get_async_collection, get_async_collection_by_name, STATS_COLLECTION_NAME,
+                            JOB_LEASE_COLLECTION_NAME)
+from date_utils import to_utc_datetime, utc_now
+from keyword_automaton import KeywordAutomaton
+from news_collector_mongo import ARTICLE_KEYWORDS
+from search_index import keyword_filter, query_grams
+from near_duplicate import CANONICAL_FILTER, DUPLICATE_FIELD
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+load_dotenv()
+
+STATS_RECONCILE_INTERVAL = float(os.getenv("STATS_RECONCILE_INTERVAL", "3600"))
+
+TOTALS_ID = "totals"
+STATS_RECONCILE_LEASE = "stats_reconcile"
+
+# 주기 작업 임대를 가진 프로세스 식별자 (uvicorn --workers로 띄운 워커마다 다름)
+WORKER_ID = f"{socket.gethostname()}:{os.getpid()}"
+
+
+def _sentiment_label(doc: Dict[str, Any]) -> str:
+    sentiment = doc.get("sentiment")
+    label = sentiment.get("sentiment") if isinstance(sentiment, dict) else None
+    return label or "Unknown"
+
+
+def matched_keywords(matcher: KeywordAutomaton, doc: Dict[str, Any]) -> set:
+    """
+    기사 제목이나 내용에 포함된 관련 키워드(소문자) 집합을 반환합니다.
+    """
+    found = matcher.find((doc.get("title") or "").lower())
+    found.update(matcher.find((doc.get("content") or "").lower()))
+    return found
+
+
+async def acquire_lease(name: str, ttl: float) -> bool:
+    """
+    ttl초 동안 유효한 작업 임대를 얻거나 연장합니다. 다른 프로세스의 임대가 아직 유효하면 False를 반환합니다.
+    임대를 가진 프로세스가 멈추면 ttl이 지난 뒤 다른 프로세스가 이어받습니다.
+    """
+    leases = await get_async_collection_by_name(JOB_LEASE_COLLECTION_NAME)
+    now = utc_now()
+    try:
+        # 다른 프로세스의 유효한 임대가 있으면 조건에 맞지 않아 upsert가 같은 _id로 삽입을 시도하다 실패함
+        await leases.update_one(
+            {"_id": name, "$or": [{"owner": WORKER_ID}, {"expires_at": {"$lte": now}}]},
+            {"$set": {"owner": WORKER_ID, "expires_at": now + timedelta(seconds=ttl)}},
+            upsert=True
+        )
+        return True
+    except DuplicateKeyError:
+        return False
+
+
+async def run_periodically(job, interval: float, name: str, lease: str = None, startup_job=None):
+    """
+    job을 interval초마다 실행합니다. 실패해도 다음 주기에 다시 실행합니다.
+
+    서버를 띄울 때마다 전체 재계산이 돌지 않도록 첫 실행은 interval초 뒤이며,
+    시작 시 필요한 확인은 startup_job으로 한 번 실행합니다.
+    lease를 주면 여러 워커 중 임대를 가진 한 프로세스에서만 실행합니다.
+    """
+    async def run(current_job):
+        try:
+            if lease is None or await acquire_lease(lease, interval * 2):
+                await current_job()
+        except Exception as e:
+            logger.error(f"{name} 실패: {str(e)}")
+
+    if startup_job is not None:
+        await run(startup_job)
+    while True:
+        await asyncio.sleep(interval)
+        await run(job)
+
+
+class StatsRollup:
+    """
+    /news/db/stats용 통계 집계 컬렉션을 관리합니다.
+
+    문서 종류:
+    - totals: 전체 기사 수, 재게재 기사를 묶은 고유 기사 수, 감정별 분포, 가장 오래된/최신 발행일
+    - day:YYYY-MM-DD: 발행일(UTC)별 기사 수와 감정별 분포
+    - keyword:<키워드>: 관련 키워드별 기사 수와 감정별 분포
+
+    저장 리스너로 새 기사만큼 카운터를 올리고, reconcile()이 주기적으로 원본에서 다시 계산해 어긋남을 바로잡습니다.
+    """
+
+    def __init__(self, keywords: List[str] = None):
+        self.keywords = list(keywords or ARTICLE_KEYWORDS)
+        self._matcher = KeywordAutomaton(keyword.lower() for keyword in self.keywords)
+        self._reconcile_lock = asyncio.Lock()
+        self._task = None
+        self._pending_reconcile = None
+
+    def _increments(self, docs: List[Dict[str, Any]]) -> List[UpdateOne]:
+        """
+        저장된 문서 묶음을 통계 문서별 $inc 갱신으로 합칩니다.
+        """
+        counters: Dict[str, Dict[str, Any]] = {}
+        oldest = newest = None
+        unique = sum(1 for doc in docs if not doc.get(DUPLICATE_FIELD))
+
+        def bump(stat_id: str, fields: Dict[str, Any], label: str):
+            entry = counters.setdefault(stat_id, {"fields": fields, "inc": {}})
+            entry["inc"]["total"] = entry["inc"].get("total", 0) + 1
+            entry["inc"][f"sentiment.{label}"] = entry["inc"].get(f"sentiment.{label}", 0) + 1
+
+        for doc in docs:
+            label = _sentiment_label(doc)
+            published_at = to_utc_datetime(doc.get("published_at"))
+            bump(TOTALS_ID, {"kind": "totals"}, label)
+            if published_at is not None:
+                day = published_at.date().isoformat()
+                bump(f"day:{day}", {"kind": "day", "day": day}, label)
+                oldest = published_at if oldest is None or published_at < oldest else oldest
+                newest = published_at if newest is None or published_at > newest else newest
+            for keyword in matched_keywords(self._matcher, doc):
+                bump(f"keyword:{keyword}", {"kind": "keyword", "keyword": keyword}, label)
+
+        operations = []
+        if TOTALS_ID in counters:
+            counters[TOTALS_ID]["inc"]["unique_total"] = unique
+        for stat_id, entry in counters.items():
+            update = {"$inc": entry["inc"], "$set": entry["fields"]}
+            if stat_id == TOTALS_ID and oldest is not None:
+                update["$min"] = {"oldest_published_at": oldest}
+                update["$max"] = {"newest_published_at": newest}
+            operations.append(UpdateOne({"_id": stat_id}, update, upsert=True))
+        return operations
+
+    async def on_articles_saved(self, docs: List[Dict[str, Any]]):
+        """
+        새로 저장된 기사만큼 통계 카운터를 올립니다.
+        """
+        operations = self._increments(docs)
+        if not operations:
+            return
+        stats_collection = await get_async_collection_by_name(STATS_COLLECTION_NAME)
+        await stats_collection.bulk_write(operations, ordered=False)
+
+    async def _keyword_counts(self, collection) -> Dict[str, Dict[str, int]]:
+        """
+        관련 키워드별 감정 분포를 셉니다.
+        n-gram 색인을 쓸 수 없는 한 글자 키워드("댐" 등)는 키워드마다 컬렉션 전체를 훑지 않도록
+        한 번의 스캔에서 $facet으로 함께 셉니다.
+        """
+        group = {"$group": {"_id": {"$ifNull": ["$sentiment.sentiment", "Unknown"]}, "count": {"$sum": 1}}}
+        counts = {keyword: {} for keyword in self.keywords}
+        scanned = []
+        for keyword in self.keywords:
+            if not query_grams(keyword):
+                scanned.append(keyword)
+                continue
+            async for row in collection.aggregate([{"$match": keyword_filter(keyword, ("title", "content"))}, group]):
+                counts[keyword][row["_id"]] = row["count"]
+
+        if scanned:
+            filters = [keyword_filter(keyword, ("title", "content")) for keyword in scanned]
+            pipeline = [
+                {"$match": {"$or": filters}},
+                {"$facet": {str(index): [{"$match": condition}, group] for index, condition in enumerate(filters)}}
+            ]
+            async for row in collection.aggregate(pipeline):
+                for index, keyword in enumerate(scanned):
+                    for facet_row in row[str(index)]:
+                        counts[keyword][facet_row["_id"]] = facet_row["count"]
+        return counts
+
+    async def reconcile_if_missing(self):
+        """
+        통계 문서가 아직 없을 때(처음 배포 등)만 재계산합니다.
+        """
+        stats_collection = await get_async_collection_by_name(STATS_COLLECTION_NAME)
+        if await stats_collection.find_one({"_id": TOTALS_ID}, {"_id": 1}) is None:
+            await self.reconcile()
+
+    def request_reconcile(self):
+        """
+        통계 문서가 없을 때의 재계산을 백그라운드로 예약합니다.
+        이미 예약돼 있거나 다른 프로세스가 재계산 임대를 가지고 있으면 새로 실행하지 않습니다.
+        """
+        if self._pending_reconcile is not None and not self._pending_reconcile.done():
+            return
+
+        async def run():
+            try:
+                if await acquire_lease(STATS_RECONCILE_LEASE, max(STATS_RECONCILE_INTERVAL, 60) * 2):
+                    await self.reconcile_if_missing()
+            except Exception as e:
+                logger.error(f"통계 재계산 실패: {str(e)}")
+
+        self._pending_reconcile = asyncio.create_task(run())
+
+    async def reconcile(self) -> Dict[str, Any]:
+        """
+        기사 컬렉션에서 통계를 다시 계산해 집계 컬렉션을 덮어씁니다.
+        계산 중 저장된 기사의 증분은 다음 reconcile에서 맞춰집니다.
+        """
+        async with self._reconcile_lock:
+            collection = await get_async_collection()
+            stats_collection = await get_async_collection_by_name(STATS_COLLECTION_NAME)
+            now = utc_now()
+
+            totals = {"_id": TOTALS_ID, "kind": "totals", "total": 0,
+                      "unique_total": await collection.count_documents(CANONICAL_FILTER), "sentiment": {},
+                      "oldest_published_at": None, "newest_published_at": None, "reconciled_at": now}
+            days: Dict[str, Dict[str, Any]] = {}
+
+            pipeline = [
+                {"$project": {
+                    "published_at": {"$convert": {"input": "$published_at", "to": "date",
+                                                  "onError": None, "onNull": None}},
+                    "label": {"$ifNull": ["$sentiment.sentiment", "Unknown"]}
+                }},
+                {"$group": {
+                    "_id": {
+                        "day": {"$dateToString": {"format": "%Y-%m-%d", "date": "$published_at"}},
+                        "label": "$label"
+                    },
+                    "count": {"$sum": 1},
+                    "oldest": {"$min": "$published_at"},
+                    "newest": {"$max": "$published_at"}
+                }}
+            ]
+            async for row in collection.aggregate(pipeline):
+                day, label, count = row["_id"].get("day"), row["_id"]["label"], row["count"]
+                totals["total"] += count
+                totals["sentiment"][label] = totals["sentiment"].get(label, 0) + count
+                if row["oldest"] is not None:
+                    if totals["oldest_published_at"] is None or row["oldest"] < totals["oldest_published_at"]:
+                        totals["oldest_published_at"] = row["oldest"]
+                    if totals["newest_published_at"] is None or row["newest"] > totals["newest_published_at"]:
+                        totals["newest_published_at"] = row["newest"]
+                if day:
+                    entry = days.setdefault(day, {"_id": f"day:{day}", "kind": "day", "day": day,
+                                                  "total": 0, "sentiment": {}})
+                    entry["total"] += count
+                    entry["sentiment"][label] = entry["sentiment"].get(label, 0) + count
+
+            keyword_counts = await self._keyword_counts(collection)
+            keyword_docs = [
+                {"_id": f"keyword:{keyword.lower()}", "kind": "keyword", "keyword": keyword.lower(),
+                 "total": sum(keyword_counts[keyword].values()), "sentiment": keyword_counts[keyword]}
+                for keyword in self.keywords
+            ]
+
+            replacements = [totals, *days.values(), *keyword_docs]
+            await stats_collection.bulk_write(
+                [ReplaceOne({"_id": doc["_id"]}, doc, upsert=True) for doc in replacements],
+                ordered=False
+            )
+            # 더 이상 기사가 없는 날짜·키워드 문서 정리
+            await stats_collection.delete_many({"_id": {"$nin": [doc["_id"] for doc in replacements]}})
+
+            logger.info(f"통계 재계산 완료: 기사 {totals['total']}개, 날짜 {len(days)}개")
+            return {"total_articles": totals["total"], "days": len(days), "reconciled_at": now}
+
+    async def read_stats(self) -> Dict[str, Any]:
+        """
+        집계 컬렉션의 작은 문서 몇 개만 읽어 통계를 만듭니다.
+        최근 7일은 오늘을 포함한 UTC 날짜 7일치 합계입니다.
+        통계 문서가 아직 없으면 요청 중에 전체를 집계하지 않고 재계산을 예약한 뒤 pending으로 표시한 빈 통계를 반환합니다.
+        """
+        stats_collection = await get_async_collection_by_name(STATS_COLLECTION_NAME)
+        totals = await stats_collection.find_one({"_id": TOTALS_ID})
+        pending = totals is None
+        if pending:
+            self.request_reconcile()
+            totals = {}
+
+        first_day = (utc_now() - timedelta(days=6)).date().isoformat()
+        recent_articles = 0
+        async for doc in stats_collection.find({"kind": "day", "day": {"$gte": first_day}}, {"total": 1}):
+            recent_articles += doc.get("total", 0)
+
+        keyword_counts = {}
+        async for doc in stats_collection.find({"kind": "keyword"}, {"keyword": 1, "total": 1}):
+            keyword_counts[doc["keyword"]] = doc.get("total", 0)
+
+        return {
+            "total_articles": totals.get("total", 0),
+            "unique_articles": totals.get("unique_total", totals.get("total", 0)),
+            "recent_articles_7days": recent_articles,
+            "sentiment_distribution": totals.get("sentiment", {}),
+            "keyword_distribution": keyword_counts,
+            "oldest_article_date": totals.get("oldest_published_at"),
+            "newest_article_date": totals.get("newest_published_at"),
+            "reconciled_at": totals.get("reconciled_at"),
+            "pending": pending
+        }
+
+    def start(self, interval: float = STATS_RECONCILE_INTERVAL):
+        """
+        주기적인 재계산 작업을 시작합니다. interval이 0 이하면 시작하지 않습니다.
+        시작할 때는 통계 문서가 없을 때만 재계산하며, 여러 워커 중 한 프로세스만 재계산합니다.
+        """
+        if interval > 0 and self._task is None:
+            self._task = asyncio.create_task(run_periodically(
+                self.reconcile, interval, "통계 재계산",
+                lease=STATS_RECONCILE_LEASE, startup_job=self.reconcile_if_missing
+            ))
+
+    async def stop(self):
+        if self._pending_reconcile is not None:
+            self._pending_reconcile.cancel()
+            self._pending_reconcile = None
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
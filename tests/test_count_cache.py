@@ -0,0 +1,78 @@
+import asyncio
+
+import count_cache
+from count_cache import CountCache
+
+
+class FakeCollection:
+    def __init__(self, total):
+        self.total = total
+        self.calls = []
+
+    async def count_documents(self, query, limit=None):
+        self.calls.append((query, limit))
+        return self.total if limit is None else min(self.total, limit)
+
+    async def estimated_document_count(self):
+        return self.total
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_cached_count_expires_after_ttl(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(count_cache.time, "monotonic", clock)
+    cache = CountCache(ttl=60)
+    collection = FakeCollection(5)
+
+    assert asyncio.run(cache.count(collection, {"a": 1, "b": 2}, "cached")) == 5
+    collection.total = 7
+    clock.now += 59
+    # 키 순서가 달라도 같은 쿼리로 취급
+    assert asyncio.run(cache.count(collection, {"b": 2, "a": 1}, "cached")) == 5
+    clock.now += 2
+    assert asyncio.run(cache.count(collection, {"a": 1, "b": 2}, "cached")) == 7
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_saved_articles_invalidate_cached_counts():
+    cache = CountCache(ttl=60)
+    collection = FakeCollection(5)
+    asyncio.run(cache.count(collection, {}, "cached"))
+
+    cache.on_articles_saved([])
+    assert cache.stats()["size"] == 1
+    cache.on_articles_saved([{"title": "새 기사"}])
+    collection.total = 6
+    assert asyncio.run(cache.count(collection, {}, "cached")) == 6
+    assert len(collection.calls) == 2
+
+
+def test_cache_evicts_least_recently_used_query():
+    cache = CountCache(ttl=60, max_size=2)
+    collection = FakeCollection(1)
+    for query in ({"q": 1}, {"q": 2}, {"q": 1}, {"q": 3}):
+        asyncio.run(cache.count(collection, query, "cached"))
+
+    asyncio.run(cache.count(collection, {"q": 2}, "cached"))
+    assert cache.misses == 4
+    assert cache.hits == 1
+
+
+def test_exact_mode_bypasses_cache_and_estimate_caps():
+    cache = CountCache(ttl=60, estimate_cap=10)
+    collection = FakeCollection(50)
+
+    assert asyncio.run(cache.count(collection, {"q": 1})) == 50
+    assert asyncio.run(cache.count(collection, {"q": 1})) == 50
+    assert asyncio.run(cache.count(collection, {"q": 1}, "estimated")) == "10+"
+    assert collection.calls[-1] == ({"q": 1}, 11)
+    collection.total = 10
+    assert asyncio.run(cache.count(collection, {"q": 1}, "estimated")) == 10
+    assert cache.stats()["size"] == 0
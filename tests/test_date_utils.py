@@ -0,0 +1,61 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+import date_utils
+from date_utils import PUBLISHED_AT_AS_DATE, published_at_filter, to_utc_datetime
+
+START = datetime(2024, 3, 1)
+END = datetime(2024, 3, 2)
+
+
+@pytest.mark.parametrize("value, expected", [
+    ("2024-03-01T09:30:00", datetime(2024, 3, 1, 9, 30)),
+    ("2024-03-01T09:30:00Z", datetime(2024, 3, 1, 9, 30)),
+    ("2024-03-01T09:30:00+09:00", datetime(2024, 3, 1, 0, 30)),
+    (" 2024-03-01 ", datetime(2024, 3, 1)),
+    (datetime(2024, 3, 1, 9, 30), datetime(2024, 3, 1, 9, 30)),
+    (datetime(2024, 3, 1, 9, 30, tzinfo=timezone(timedelta(hours=9))), datetime(2024, 3, 1, 0, 30)),
+    ("어제", None),
+    ("", None),
+    (None, None),
+    (1709251200, None),
+])
+def test_to_utc_datetime(value, expected):
+    assert to_utc_datetime(value) == expected
+
+
+def test_to_utc_datetime_returns_naive():
+    assert to_utc_datetime("2024-03-01T09:30:00+09:00").tzinfo is None
+
+
+def test_published_at_filter_without_bounds():
+    assert published_at_filter() == {}
+
+
+def test_published_at_filter_datetime_only(monkeypatch):
+    monkeypatch.setattr(date_utils, "PUBLISHED_AT_LEGACY_STRINGS", False)
+    assert published_at_filter(START, END) == {"published_at": {"$gte": START, "$lte": END}}
+    assert published_at_filter(start=START) == {"published_at": {"$gte": START}}
+    assert published_at_filter(end=END) == {"published_at": {"$lte": END}}
+
+
+def test_published_at_filter_converts_legacy_strings(monkeypatch):
+    monkeypatch.setattr(date_utils, "PUBLISHED_AT_LEGACY_STRINGS", True)
+    assert published_at_filter(START, END) == {"$or": [
+        {"published_at": {"$gte": START, "$lte": END}},
+        {
+            "published_at": {"$type": "string"},
+            "$expr": {"$and": [
+                {"$eq": [{"$type": PUBLISHED_AT_AS_DATE}, "date"]},
+                {"$gte": [PUBLISHED_AT_AS_DATE, START]},
+                {"$lte": [PUBLISHED_AT_AS_DATE, END]}
+            ]}
+        }
+    ]}
+
+
+def test_published_at_filter_legacy_start_only(monkeypatch):
+    monkeypatch.setattr(date_utils, "PUBLISHED_AT_LEGACY_STRINGS", True)
+    legacy = published_at_filter(start=START)["$or"][1]
+    assert legacy["$expr"]["$and"][1:] == [{"$gte": [PUBLISHED_AT_AS_DATE, START]}]
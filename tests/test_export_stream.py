@@ -0,0 +1,107 @@
+import asyncio
+import csv
+import io
+import json
+from datetime import datetime
+
+from bson import ObjectId
+
+import export_stream
+from export_stream import CSV_COLUMNS, _csv_row, stream_articles
+
+ARTICLE_ID = ObjectId("65e1a2b3c4d5e6f708192a3b")
+
+
+def article(index=0, sentiment=None):
+    return {
+        "_id": ARTICLE_ID,
+        "title": f"댐 점검, \"긴급\" {index}",
+        "content": "첫 줄\n둘째 줄",
+        "url": f"https://news.example.com/{index}",
+        "published_at": datetime(2024, 3, 1, 3, 0),
+        "sentiment": sentiment,
+        "created_at": datetime(2024, 3, 1, 3, 5)
+    }
+
+
+class FakeCursor:
+    def __init__(self, docs):
+        self.docs = docs
+        self.closed = False
+
+    def sort(self, sort):
+        return self
+
+    def batch_size(self, size):
+        return self
+
+    def limit(self, limit):
+        self.docs = self.docs[:limit]
+        return self
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        for doc in self.docs:
+            yield doc
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeCollection:
+    def __init__(self, docs):
+        self.cursor = FakeCursor(docs)
+
+    def find(self, query, projection):
+        return self.cursor
+
+
+def collect(chunks):
+    async def run():
+        return [chunk async for chunk in chunks]
+    return asyncio.run(run())
+
+
+def test_csv_row_flattens_sentiment_and_formats_values():
+    row = _csv_row(article(sentiment={"sentiment": "positive", "confidence": 0.7, "positive_score": 0.7,
+                                      "negative_score": 0.1, "neutral_score": 0.2}))
+
+    assert dict(zip(CSV_COLUMNS, row)) == {
+        "_id": ARTICLE_ID, "title": "댐 점검, \"긴급\" 0", "content": "첫 줄\n둘째 줄",
+        "url": "https://news.example.com/0", "published_at": "2024-03-01T03:00:00",
+        "sentiment": "positive", "confidence": 0.7, "positive_score": 0.7, "negative_score": 0.1,
+        "neutral_score": 0.2, "created_at": "2024-03-01T03:05:00", "updated_at": ""
+    }
+
+
+def test_csv_row_without_sentiment_leaves_columns_empty():
+    row = dict(zip(CSV_COLUMNS, _csv_row(article())))
+    assert [row[column] for column in CSV_COLUMNS[5:10]] == [""] * 5
+
+
+def test_stream_csv_round_trips_through_csv_reader(monkeypatch):
+    monkeypatch.setattr(export_stream, "EXPORT_CHUNK_SIZE", 2)
+    collection = FakeCollection([article(index) for index in range(5)])
+
+    chunks = collect(stream_articles(collection, {}, "csv"))
+
+    # 헤더와 2개, 2개, 1개 조각
+    assert len(chunks) == 3
+    rows = list(csv.reader(io.StringIO("".join(chunks))))
+    assert rows[0] == CSV_COLUMNS
+    assert [row[1] for row in rows[1:]] == [f"댐 점검, \"긴급\" {index}" for index in range(5)]
+    assert rows[1][0] == str(ARTICLE_ID)
+    assert rows[1][2] == "첫 줄\n둘째 줄"
+    assert collection.cursor.closed
+
+
+def test_stream_ndjson_writes_one_document_per_line():
+    collection = FakeCollection([article(index) for index in range(3)])
+
+    lines = "".join(collect(stream_articles(collection, {}, limit=2))).splitlines()
+
+    assert [json.loads(line)["url"] for line in lines] == ["https://news.example.com/0", "https://news.example.com/1"]
+    assert json.loads(lines[0])["_id"] == str(ARTICLE_ID)
+    assert json.loads(lines[0])["published_at"] == "2024-03-01T03:00:00"
@@ -0,0 +1,40 @@
+import pytest
+
+from search_index import ARTICLE_PROJECTION, SUMMARY_PROJECTION, article_projection, parse_fields
+
+
+@pytest.mark.parametrize("fields, expected", [
+    ("title,url", ["title", "url"]),
+    (" title , published_at ,", ["title", "published_at"]),
+    ("sentiment.confidence,sentiment.sentiment", ["sentiment.confidence", "sentiment.sentiment"]),
+    ("_id,cluster_id", ["_id", "cluster_id"]),
+    ("", []),
+    (None, []),
+])
+def test_parse_fields(fields, expected):
+    assert parse_fields(fields) == expected
+
+
+@pytest.mark.parametrize("fields", ["title,search_grams", "simhash", "sentiment.unknown", "sentiment.", "title.x"])
+def test_parse_fields_rejects_unknown(fields):
+    with pytest.raises(ValueError):
+        parse_fields(fields)
+
+
+def test_parse_fields_error_names_unknown_fields():
+    with pytest.raises(ValueError, match="search_grams, simhash"):
+        parse_fields("title,search_grams,simhash")
+
+
+def test_article_projection_fields_always_include_published_at():
+    assert article_projection(fields=["_id", "title"]) == {"title": 1, "published_at": 1}
+
+
+def test_article_projection_sentiment_overrides_subfields():
+    projection = article_projection(fields=["sentiment", "sentiment.confidence"])
+    assert projection == {"sentiment": 1, "published_at": 1}
+
+
+def test_article_projection_views():
+    assert article_projection("summary") == SUMMARY_PROJECTION
+    assert article_projection("full") == ARTICLE_PROJECTION
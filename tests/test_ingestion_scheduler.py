@@ -0,0 +1,90 @@
+import asyncio
+
+import pytest
+
+import ingestion_scheduler
+from ingestion_scheduler import IngestionScheduler
+
+SCHEDULES = [{"name": "kwater", "queries": ["한국수자원공사"], "interval_minutes": 30}]
+
+
+class SlowCollector:
+    def __init__(self):
+        self.calls = []
+        self.release = asyncio.Event()
+
+    async def collect_and_save_news(self, **params):
+        self.calls.append(params)
+        await self.release.wait()
+        return {"status": "success"}
+
+
+@pytest.fixture
+def leases(monkeypatch):
+    granted = {}
+
+    async def acquire_lease(name, ttl):
+        granted.setdefault(name, ttl)
+        return granted[name] is not None
+
+    monkeypatch.setattr(ingestion_scheduler, "acquire_lease", acquire_lease)
+    return granted
+
+
+def test_scheduled_run_takes_group_lease(leases):
+    collector = SlowCollector()
+    scheduler = IngestionScheduler(collector, schedules=SCHEDULES)
+
+    async def run():
+        collector.release.set()
+        await scheduler._run_scheduled("kwater")
+
+    asyncio.run(run())
+    assert leases == {"ingest:kwater": 30 * 60}
+    assert len(collector.calls) == 1
+    assert scheduler.list_jobs()[0]["status"] == "success"
+
+
+def test_scheduled_run_skips_when_another_worker_holds_lease(leases):
+    leases["ingest:kwater"] = None
+    collector = SlowCollector()
+    scheduler = IngestionScheduler(collector, schedules=SCHEDULES)
+
+    asyncio.run(scheduler._run_scheduled("kwater"))
+    assert collector.calls == []
+    assert scheduler.list_jobs() == []
+
+
+def test_group_already_running_is_skipped(leases):
+    collector = SlowCollector()
+    scheduler = IngestionScheduler(collector, schedules=SCHEDULES)
+
+    async def run():
+        first = scheduler.enqueue_group("kwater")
+        await asyncio.sleep(0)
+        second = scheduler.enqueue_group("kwater")
+        await scheduler._run_scheduled("kwater")
+        collector.release.set()
+        await asyncio.gather(*scheduler._tasks)
+        return first, second
+
+    first, second = asyncio.run(run())
+    assert second["status"] == "skipped"
+    assert second["result"]["active_job_id"] == first["job_id"]
+    assert [job["status"] for job in scheduler.list_jobs()] == ["skipped", "skipped", "success"]
+    assert len(collector.calls) == 1
+
+
+def test_stop_cancels_running_job(leases):
+    collector = SlowCollector()
+    scheduler = IngestionScheduler(collector, schedules=SCHEDULES)
+
+    async def run():
+        job = scheduler.enqueue_group("kwater")
+        await asyncio.sleep(0)
+        await scheduler.stop()
+        return job
+
+    job = asyncio.run(run())
+    assert job["status"] == "cancelled"
+    assert scheduler.status()["groups"][0]["active"] is False
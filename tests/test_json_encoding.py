@@ -0,0 +1,53 @@
+import json
+from datetime import date, datetime, timezone
+
+import numpy as np
+import pytest
+from bson import ObjectId
+
+from json_encoding import MongoJSONResponse, dumps, dumps_str, json_default
+
+ARTICLE_ID = ObjectId("65e1a2b3c4d5e6f708192a3b")
+
+
+def test_json_default_converts_bson_and_dates():
+    assert json_default(ARTICLE_ID) == "65e1a2b3c4d5e6f708192a3b"
+    assert json_default(datetime(2024, 3, 1, 3, 0)) == "2024-03-01T03:00:00"
+    assert json_default(date(2024, 3, 1)) == "2024-03-01"
+    with pytest.raises(TypeError):
+        json_default(object())
+
+
+def test_json_default_works_with_standard_json():
+    assert json.loads(json.dumps({"_id": ARTICLE_ID}, default=json_default)) == {"_id": str(ARTICLE_ID)}
+
+
+def test_dumps_matches_isoformat_for_naive_and_aware_dates():
+    doc = {
+        "_id": ARTICLE_ID,
+        "title": "댐 점검",
+        "published_at": datetime(2024, 3, 1, 3, 0, 5, 120000),
+        "exported_at": datetime(2024, 3, 1, 3, 0, tzinfo=timezone.utc),
+        "score": np.float64(0.25),
+        "counts": np.array([1, 2]),
+        "by_id": {1: "a"}
+    }
+
+    assert json.loads(dumps(doc)) == {
+        "_id": str(ARTICLE_ID),
+        "title": "댐 점검",
+        "published_at": doc["published_at"].isoformat(),
+        "exported_at": doc["exported_at"].isoformat(),
+        "score": 0.25,
+        "counts": [1, 2],
+        "by_id": {"1": "a"}
+    }
+    # 한글은 이스케이프하지 않음
+    assert "댐 점검" in dumps_str(doc)
+
+
+def test_mongo_json_response_renders_documents_directly():
+    response = MongoJSONResponse({"items": [{"_id": ARTICLE_ID}]})
+
+    assert response.media_type == "application/json"
+    assert json.loads(response.body) == {"items": [{"_id": str(ARTICLE_ID)}]}
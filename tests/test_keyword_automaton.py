@@ -0,0 +1,37 @@
+import random
+
+import pytest
+
+from keyword_automaton import KeywordAutomaton
+
+
+def naive_find(keywords, text):
+    return {keyword for keyword in keywords if keyword in text}
+
+
+@pytest.mark.parametrize("keywords, text", [
+    (["he", "she", "his", "hers"], "ushers"),
+    (["a", "ab", "abc", "bc", "c"], "zabcz"),
+    (["성장", "성장률", "장률"], "올해 경제 성장률이 하락했다"),
+    (["aa", "aaa"], "aaaa"),
+    (["문제", "문제"], "문제가 없다"),
+    (["", "x"], "abc"),
+    (["abc"], ""),
+])
+def test_find_matches_substring_check(keywords, text):
+    assert KeywordAutomaton(keywords).find(text) == naive_find(keywords, text)
+
+
+def test_find_random_texts_match_substring_check():
+    rng = random.Random(0)
+    alphabet = "abc가나"
+    for _ in range(300):
+        keywords = ["".join(rng.choice(alphabet) for _ in range(rng.randint(1, 4))) for _ in range(rng.randint(1, 8))]
+        text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 30)))
+        assert KeywordAutomaton(keywords).find(text) == naive_find(keywords, text), (keywords, text)
+
+
+def test_find_ids_refer_to_deduplicated_keywords():
+    automaton = KeywordAutomaton(["위험", "사고", "위험"])
+    assert automaton.keywords == ["위험", "사고"]
+    assert automaton.find_ids("교통사고 위험") == {0, 1}
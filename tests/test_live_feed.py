@@ -0,0 +1,51 @@
+import json
+
+import live_feed
+from live_feed import LiveFeed, _Subscriber
+from search_index import SEARCH_GRAM_FIELD
+
+
+def test_full_queue_drops_oldest_event(monkeypatch):
+    monkeypatch.setattr(live_feed, "LIVE_FEED_QUEUE_SIZE", 2)
+    subscriber = _Subscriber(None, None)
+
+    for event in ("a", "b", "c", "d"):
+        subscriber.offer(event)
+
+    assert subscriber.dropped == 2
+    assert [subscriber.queue.get_nowait() for _ in range(subscriber.queue.qsize())] == ["c", "d"]
+
+
+def test_subscriber_filters_by_keyword_and_sentiment():
+    subscriber = _Subscriber("K-water", "negative")
+
+    assert subscriber.accepts({"title": "k-water 발표", "sentiment": {"sentiment": "negative"}})
+    assert subscriber.accepts({"title": "", "content": "K-WATER 요금", "sentiment": {"sentiment": "negative"}})
+    assert not subscriber.accepts({"title": "k-water 발표", "sentiment": {"sentiment": "positive"}})
+    assert not subscriber.accepts({"title": "댐 점검", "sentiment": {"sentiment": "negative"}})
+    assert not _Subscriber(None, "negative").accepts({"title": "k-water", "sentiment": None})
+
+
+def test_publish_serializes_once_for_matching_subscribers():
+    feed = LiveFeed("local")
+    matching, other = _Subscriber("댐", None), _Subscriber("수도", None)
+    feed._subscribers.extend([matching, other])
+
+    feed.on_articles_saved([{"_id": "a1", "title": "댐 점검", "content": "", SEARCH_GRAM_FIELD: ["댐 "]}])
+
+    event = matching.queue.get_nowait()
+    assert event.startswith("id: a1\nevent: article\ndata: ")
+    assert event.endswith("\n\n")
+    assert json.loads(event.split("data: ", 1)[1]) == {"_id": "a1", "title": "댐 점검", "content": ""}
+    assert other.queue.empty()
+    assert feed.stats()["published"] == 1
+
+
+def test_change_stream_source_ignores_save_notifications():
+    feed = LiveFeed("change_stream")
+    subscriber = _Subscriber(None, None)
+    feed._subscribers.append(subscriber)
+
+    feed.on_articles_saved([{"_id": "a1", "title": "댐"}])
+
+    assert subscriber.queue.empty()
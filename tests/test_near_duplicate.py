@@ -0,0 +1,49 @@
+import random
+
+import pytest
+
+from near_duplicate import (NEAR_DUPLICATE_DISTANCE, SIMHASH_BITS, band_keys, from_int64,
+                            hamming_distance, simhash, to_int64)
+
+
+def flip_bits(value, bits):
+    for bit in bits:
+        value ^= 1 << bit
+    return value
+
+
+@pytest.mark.parametrize("bands", [NEAR_DUPLICATE_DISTANCE + 1, 4, 5, 7])
+def test_band_keys_share_a_band_within_distance(bands):
+    rng = random.Random(bands)
+    for _ in range(500):
+        value = rng.getrandbits(SIMHASH_BITS)
+        other = flip_bits(value, rng.sample(range(SIMHASH_BITS), rng.randint(0, bands - 1)))
+        assert hamming_distance(value, other) < bands
+        assert set(band_keys(value, bands)) & set(band_keys(other, bands))
+
+
+def test_band_keys_cover_all_bits():
+    keys = band_keys((1 << SIMHASH_BITS) - 1, 5)
+    assert len(keys) == 5
+    widths = [len(bin(int(key.split(":")[1], 16))) - 2 for key in keys]
+    assert sum(widths) == SIMHASH_BITS
+
+
+def test_simhash_is_stable_and_normalized():
+    text = "정부가 오늘 새로운 경제 정책을 발표했다"
+    assert simhash(text) == simhash("  정부가 오늘   새로운 경제 정책을 발표했다 ")
+    assert 0 <= simhash(text) < 1 << SIMHASH_BITS
+
+
+def test_simhash_near_texts_are_closer_than_unrelated():
+    base = "정부는 오늘 내년도 예산안을 국회에 제출했다고 밝혔다. 예산 규모는 역대 최대 수준이다."
+    edited = base + " (종합)"
+    unrelated = "프로야구 개막전에서 홈팀이 연장 접전 끝에 승리를 거뒀다."
+    assert hamming_distance(simhash(base), simhash(edited)) < hamming_distance(simhash(base), simhash(unrelated))
+
+
+@pytest.mark.parametrize("value", [0, 1, (1 << 63) - 1, 1 << 63, (1 << SIMHASH_BITS) - 1])
+def test_int64_round_trip(value):
+    signed = to_int64(value)
+    assert -(1 << 63) <= signed < 1 << 63
+    assert from_int64(signed) == value
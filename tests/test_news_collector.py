@@ -0,0 +1,137 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from bson import ObjectId
+
+import news_collector_mongo
+from near_duplicate import CLUSTER_FIELD, DUPLICATE_FIELD
+from news_collector_mongo import NAVER_PAGE_SIZE, NewsCollectorMongo
+from rate_limiter import NaverRateLimiter, QuotaExceededError
+from sentiment_cache import SentimentCache
+from simple_sentiment_analyzer import SimpleSentimentAnalyzer
+
+NEWEST = datetime(2024, 3, 1, 12, 0, tzinfo=timezone.utc)
+
+
+def naver_item(index):
+    published_at = NEWEST - timedelta(minutes=index)
+    return {
+        "title": f"한국수자원공사 기사 {index}",
+        "description": "물관리 소식",
+        "link": f"https://news.example.com/{index}",
+        "pubDate": published_at.strftime("%a, %d %b %Y %H:%M:%S %z")
+    }
+
+
+class FakeNaverApi:
+    """
+    날짜순 검색 결과를 돌려주는 _fetch_page 대역입니다. quota_after번째 호출부터는 한도 소진으로 실패합니다.
+    """
+
+    def __init__(self, total, quota_after=None):
+        self.items = [naver_item(index) for index in range(total)]
+        self.quota_after = quota_after
+        self.calls = []
+
+    async def __call__(self, query, start, display=NAVER_PAGE_SIZE):
+        self.calls.append(start)
+        if self.quota_after is not None and len(self.calls) > self.quota_after:
+            raise QuotaExceededError("한도 소진")
+        await asyncio.sleep(0)
+        return self.items[start - 1:start - 1 + display]
+
+
+@pytest.fixture
+def collector(monkeypatch):
+    monkeypatch.setattr(news_collector_mongo, "create_indexes", lambda: None)
+    return NewsCollectorMongo(rate_limiter=NaverRateLimiter(shared_quota=False))
+
+
+def test_concurrent_quota_keeps_pages_fetched_before_it(collector):
+    collector._fetch_page = FakeNaverApi(total=1000, quota_after=3)
+    crawl_state = {}
+
+    articles = asyncio.run(collector._fetch_news_by_query(
+        "한국수자원공사", 1000, asyncio.Semaphore(5), crawl_state=crawl_state
+    ))
+
+    assert len(articles) == 3 * NAVER_PAGE_SIZE
+    assert [article["url"] for article in articles] == [item["link"] for item in collector._fetch_page.items[:300]]
+    assert crawl_state["quota_exceeded"] is True
+    assert crawl_state["complete"] is False
+
+
+def test_sequential_quota_stops_remaining_queries(collector):
+    collector._fetch_page = FakeNaverApi(total=50, quota_after=1)
+
+    per_query = asyncio.run(collector._collect_by_queries(["댐", "수도", "하수도"], 100))
+
+    assert len(per_query["댐"]["articles"]) == 50
+    assert per_query["수도"]["crawl_state"]["quota_exceeded"] is True
+    assert per_query["하수도"] == {"articles": [], "elapsed": 0.0,
+                                  "crawl_state": {"complete": False, "quota_exceeded": True}}
+    assert len(collector._fetch_page.calls) == 2
+
+
+@pytest.fixture
+def single_query(monkeypatch):
+    monkeypatch.setattr(news_collector_mongo, "EXTENSIVE_SEARCH_QUERIES", ["댐"])
+
+
+def watermark_at(index):
+    item = naver_item(index)
+    return {"published_at": NEWEST - timedelta(minutes=index), "url": item["link"]}
+
+
+@pytest.mark.parametrize("concurrent", [False, True])
+def test_incremental_pages_past_cap_until_watermark(collector, single_query, concurrent):
+    collector._fetch_page = FakeNaverApi(total=1000)
+    watermarks = {"댐": watermark_at(250)}
+
+    articles, per_query = asyncio.run(collector._fetch_extensive(
+        10, concurrent=concurrent, watermarks=watermarks
+    ))
+
+    assert [article["url"] for article in articles] == [naver_item(index)["link"] for index in range(250)]
+    assert per_query["댐"]["crawl_state"]["complete"] is True
+    marks = collector._advanced_watermarks(per_query, watermarks, articles)
+    assert marks["댐"]["url"] == naver_item(0)["link"]
+
+
+def test_incremental_advances_when_watermark_is_beyond_last_page(collector, single_query):
+    collector._fetch_page = FakeNaverApi(total=1500)
+    watermarks = {"댐": watermark_at(1200)}
+
+    articles, per_query = asyncio.run(collector._fetch_extensive(10, watermarks=watermarks))
+
+    assert len(articles) == 1000
+    assert per_query["댐"]["crawl_state"]["complete"] is True
+    assert "댐" in collector._advanced_watermarks(per_query, watermarks, articles)
+
+
+def test_first_crawl_without_watermark_keeps_cap(collector, single_query):
+    collector._fetch_page = FakeNaverApi(total=1000)
+
+    articles, per_query = asyncio.run(collector._fetch_extensive(10))
+
+    assert len(articles) == 10
+    assert collector._fetch_page.calls == [1]
+
+
+def test_near_duplicate_is_analyzed_with_its_own_text(collector):
+    analyzer = SentimentCache(SimpleSentimentAnalyzer())
+    canonical_id = ObjectId()
+    article = {
+        "title": "한국수자원공사 댐 사고",
+        "content": "피해 우려",
+        "url": "https://news.example.com/dup",
+        "published_at": NEWEST
+    }
+
+    doc = collector._build_mongo_doc(article, analyzer, {"_id": ObjectId(), CLUSTER_FIELD: canonical_id,
+                                                         DUPLICATE_FIELD: True})
+
+    assert doc["sentiment"] == analyzer.analyze("한국수자원공사 댐 사고 피해 우려")
+    assert doc[CLUSTER_FIELD] == canonical_id
+    assert "canonical" not in doc
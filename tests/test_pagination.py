@@ -0,0 +1,56 @@
+from datetime import datetime
+
+import pytest
+from bson import ObjectId
+
+import pagination
+from pagination import decode_cursor, encode_cursor, keyset_filter
+
+OBJECT_ID = ObjectId("65f0c0ffee0000000000abcd")
+
+
+def test_cursor_round_trip_datetime():
+    published_at = datetime(2024, 3, 1, 9, 30, 15, 123000)
+    cursor = encode_cursor({"_id": OBJECT_ID, "published_at": published_at})
+    assert decode_cursor(cursor) == (published_at, OBJECT_ID)
+
+
+def test_cursor_round_trip_legacy_string():
+    cursor = encode_cursor({"_id": OBJECT_ID, "published_at": "2024-03-01T09:30:15+09:00"})
+    assert decode_cursor(cursor) == ("2024-03-01T09:30:15+09:00", OBJECT_ID)
+
+
+def test_cursor_is_url_safe():
+    cursor = encode_cursor({"_id": OBJECT_ID, "published_at": datetime(2024, 3, 1)})
+    assert "=" not in cursor and "+" not in cursor and "/" not in cursor
+
+
+@pytest.mark.parametrize("cursor", ["", "not-a-cursor", "e30", "eyJwIjpudWxsLCJpIjoieCJ9"])
+def test_decode_cursor_rejects_invalid(cursor):
+    with pytest.raises(ValueError):
+        decode_cursor(cursor)
+
+
+def test_keyset_filter_continues_after_cursor(monkeypatch):
+    monkeypatch.setattr(pagination, "PUBLISHED_AT_LEGACY_STRINGS", False)
+    published_at = datetime(2024, 3, 1, 9, 30)
+    cursor = encode_cursor({"_id": OBJECT_ID, "published_at": published_at})
+    assert keyset_filter(cursor) == {"$or": [
+        {"published_at": {"$lt": published_at}},
+        {"published_at": published_at, "_id": {"$lt": OBJECT_ID}}
+    ]}
+
+
+def test_keyset_filter_includes_legacy_strings_after_datetimes(monkeypatch):
+    monkeypatch.setattr(pagination, "PUBLISHED_AT_LEGACY_STRINGS", True)
+    cursor = encode_cursor({"_id": OBJECT_ID, "published_at": datetime(2024, 3, 1)})
+    assert {"published_at": {"$type": "string"}} in keyset_filter(cursor)["$or"]
+
+
+def test_keyset_filter_string_cursor_stays_within_strings(monkeypatch):
+    monkeypatch.setattr(pagination, "PUBLISHED_AT_LEGACY_STRINGS", True)
+    cursor = encode_cursor({"_id": OBJECT_ID, "published_at": "2024-03-01T09:30:00"})
+    assert keyset_filter(cursor) == {"$or": [
+        {"published_at": {"$lt": "2024-03-01T09:30:00"}},
+        {"published_at": "2024-03-01T09:30:00", "_id": {"$lt": OBJECT_ID}}
+    ]}
@@ -0,0 +1,101 @@
+import asyncio
+
+from query_profiler import EXPLAIN_STAGE, SlowQueryLog, StageTimer, query_shape, summarize_explain
+
+
+def test_query_shape_hides_values_and_keeps_clause_structure():
+    query = {
+        "published_at": {"$gte": "2024-03-01", "$lt": "2024-03-08"},
+        "$or": [{"title": {"$regex": "댐", "$options": "i"}}, {"content": {"$regex": "댐", "$options": "i"}}],
+        "search_grams": {"$all": ["댐 ", " 댐"]}
+    }
+    other = dict(query, search_grams={"$all": ["수도"]}, published_at={"$lt": "2020-01-01", "$gte": "2019-01-01"})
+
+    assert query_shape(query) == {
+        "$or": [{"title": {"$options": "?", "$regex": "?"}}, {"content": {"$options": "?", "$regex": "?"}}],
+        "published_at": {"$gte": "?", "$lt": "?"},
+        "search_grams": {"$all": ["?"]}
+    }
+    assert query_shape(other) == query_shape(query)
+
+
+def test_summarize_explain_walks_nested_stages():
+    explain = {
+        "queryPlanner": {
+            "winningPlan": {
+                "stage": "LIMIT",
+                "inputStage": {
+                    "stage": "FETCH",
+                    "inputStage": {
+                        "stage": "OR",
+                        "inputStages": [
+                            {"stage": "IXSCAN", "indexName": "search_grams_1"},
+                            {"stage": "IXSCAN", "indexName": "published_at_-1__id_-1"}
+                        ]
+                    }
+                }
+            },
+            "rejectedPlans": [{}, {}]
+        },
+        "executionStats": {"totalDocsExamined": 40, "totalKeysExamined": 55, "nReturned": 20,
+                           "executionTimeMillis": 3}
+    }
+
+    assert summarize_explain(explain) == {
+        "stages": ["LIMIT", "FETCH", "OR", "IXSCAN", "IXSCAN"],
+        "indexes": ["search_grams_1", "published_at_-1__id_-1"],
+        "collection_scan": False,
+        "docs_examined": 40,
+        "keys_examined": 55,
+        "returned": 20,
+        "execution_ms": 3,
+        "rejected_plans": 2
+    }
+
+
+def test_summarize_explain_reads_slot_engine_plan():
+    explain = {"queryPlanner": {"winningPlan": {"queryPlan": {"stage": "COLLSCAN"}}}}
+
+    summary = summarize_explain(explain)
+
+    assert summary["stages"] == ["COLLSCAN"]
+    assert summary["collection_scan"] is True
+    assert summary["docs_examined"] is None
+
+
+def test_stage_timer_accumulates_repeated_stages():
+    timer = StageTimer()
+    with timer.stage("build"):
+        pass
+    with timer.stage("build"):
+        pass
+    asyncio.run(timer.measure("find", asyncio.sleep(0)))
+
+    assert list(timer.stages) == ["build", "find"]
+    assert timer.server_timing().startswith("build;dur=")
+    assert timer.server_timing().split(", ")[-1].startswith("total;dur=")
+    assert set(timer.summary()) == {"stages_ms", "total_ms"}
+
+
+def test_slow_query_log_records_only_slow_requests_without_explain(monkeypatch):
+    recorded = []
+
+    async def record(endpoint, query, options, timings, params):
+        recorded.append(endpoint)
+
+    async def run():
+        log = SlowQueryLog(threshold_ms=0)
+        monkeypatch.setattr(log, "_record", record)
+        explained = StageTimer()
+        explained.stages[EXPLAIN_STAGE] = 1.0
+        results = [
+            log.maybe_record("/news/search", {}, {}, StageTimer(), {}),
+            log.maybe_record("/news/search", {}, {}, explained, {}),
+            SlowQueryLog(threshold_ms=10 ** 9).maybe_record("/news/search", {}, {}, StageTimer(), {}),
+            SlowQueryLog(threshold_ms=0, enabled=False).maybe_record("/news/search", {}, {}, StageTimer(), {})
+        ]
+        await asyncio.gather(*log._tasks)
+        return results
+
+    assert asyncio.run(run()) == [True, False, False, False]
+    assert recorded == ["/news/search"]
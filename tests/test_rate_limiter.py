@@ -0,0 +1,71 @@
+import asyncio
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+from rate_limiter import KST, NaverRateLimiter, QuotaExceededError
+
+
+def make_limiter(**kwargs):
+    kwargs.setdefault("shared_quota", False)
+    return NaverRateLimiter(**kwargs)
+
+
+def test_refill_is_proportional_to_elapsed_time():
+    limiter = make_limiter(rate_per_second=10, burst=5)
+    limiter._tokens = 0
+    limiter._refill(limiter._last_refill + 0.25)
+    assert limiter._tokens == pytest.approx(2.5)
+    limiter._refill(limiter._last_refill + 10)
+    assert limiter._tokens == 5
+
+
+def test_acquire_waits_for_refill():
+    limiter = make_limiter(rate_per_second=20, burst=1)
+
+    async def run():
+        started = time.monotonic()
+        for _ in range(3):
+            await limiter.acquire()
+        return time.monotonic() - started
+
+    assert asyncio.run(run()) >= 0.09
+    assert limiter.throttled_count >= 2
+
+
+def test_daily_quota_raises_when_exhausted():
+    limiter = make_limiter(rate_per_second=1000, daily_limit=2, burst=10)
+
+    async def run():
+        await limiter.acquire()
+        await limiter.acquire()
+        await limiter.acquire()
+
+    with pytest.raises(QuotaExceededError):
+        asyncio.run(run())
+    assert limiter.status()["daily_remaining"] == 0
+
+
+def test_daily_quota_resets_on_new_kst_day():
+    limiter = make_limiter(rate_per_second=1000, daily_limit=1, burst=10)
+    limiter._daily_used = 1
+    limiter._day -= timedelta(days=1)
+
+    asyncio.run(limiter.acquire())
+    status = limiter.status()
+    assert status["daily_used"] == 1
+    assert status["quota_date"] == datetime.now(KST).date().isoformat()
+
+
+def test_pause_delays_every_caller():
+    limiter = make_limiter(rate_per_second=1000, burst=10)
+    limiter.pause(0.1)
+
+    async def run():
+        started = time.monotonic()
+        await limiter.acquire()
+        return time.monotonic() - started
+
+    assert asyncio.run(run()) >= 0.09
+    assert limiter.backoff_count == 1
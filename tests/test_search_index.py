@@ -0,0 +1,51 @@
+import re
+
+import pytest
+
+from search_index import SEARCH_GRAM_FIELD, document_grams, keyword_filter, query_grams, text_ngrams
+
+
+def test_text_ngrams_are_normalized_and_unique():
+    assert text_ngrams("수자원 수자원") == sorted({"수자", "자원", "원 ", " 수", "수자원", "자원 ", "원 수", " 수자"})
+    assert text_ngrams("K-Water") == text_ngrams("k-water")
+    assert text_ngrams("  ") == []
+
+
+def test_document_grams_do_not_cross_title_and_content():
+    grams = document_grams({"title": "댐", "content": "물"})
+    assert grams == []
+    assert "물관" in document_grams({"title": "댐 점검", "content": "물관리"})
+
+
+@pytest.mark.parametrize("keyword, expected", [
+    ("한국수자원공사", ["국수자", "수자원", "원공사", "자원공", "한국수"]),
+    ("댐", []),
+    ("수도", ["수도"]),
+    ("수도|댐", []),
+    ("", []),
+])
+def test_query_grams(keyword, expected):
+    assert query_grams(keyword) == expected
+
+
+@pytest.mark.parametrize("keyword, text", [
+    ("수자원", "한국수자원공사 발표"),
+    ("K-water", "k-water 물관리"),
+    ("물 관리", "통합 물 관리 계획"),
+])
+def test_documents_matching_the_regex_contain_all_query_grams(keyword, text):
+    assert re.search(keyword, text, re.IGNORECASE)
+    assert set(query_grams(keyword)) <= set(document_grams({"title": text, "content": ""}))
+
+
+def test_keyword_filter_narrows_with_grams_and_keeps_unindexed_documents():
+    query = keyword_filter("수자원", ("title", "content"))
+
+    candidates, match = query["$and"]
+    assert candidates == {"$or": [{SEARCH_GRAM_FIELD: {"$all": ["수자원"]}}, {SEARCH_GRAM_FIELD: None}]}
+    assert match == {"$or": [{"title": {"$regex": "수자원", "$options": "i"}},
+                             {"content": {"$regex": "수자원", "$options": "i"}}]}
+
+
+def test_keyword_filter_falls_back_to_regex_only():
+    assert keyword_filter("댐", ("title",)) == {"title": {"$regex": "댐", "$options": "i"}}
@@ -0,0 +1,52 @@
+import asyncio
+
+import pytest
+
+from sentiment_worker import compile_lexicon, count_keywords, count_matrix
+from simple_sentiment_analyzer import SimpleSentimentAnalyzer
+
+TEXTS = [
+    "정부의 지원으로 경제 성장과 혁신이 기대된다",
+    "사고와 재난으로 인한 손실이 우려된다",
+    "위원회는 정책을 검토하고 회의에서 결정을 발표했다",
+    "성장 기대 속에 불안과 우려도 공존한다",
+    "성공 실패",
+    "아무 키워드도 없는 문장",
+    "",
+    None,
+    "SUCCESS 성공 성장 발전 문제",
+]
+
+
+@pytest.fixture
+def analyzer():
+    analyzer = SimpleSentimentAnalyzer()
+    yield analyzer
+    analyzer.shutdown()
+
+
+def test_analyze_batch_matches_analyze(analyzer):
+    assert analyzer.analyze_batch(TEXTS) == [analyzer.analyze(text) for text in TEXTS]
+
+
+def test_analyze_batch_empty(analyzer):
+    assert analyzer.analyze_batch([]) == []
+
+
+def test_analyze_batch_process_pool_matches_analyze(analyzer):
+    analyzer.parallel_threshold = 1
+    analyzer.batch_workers = 2
+    analyzer.batch_chunk_size = 4
+    texts = TEXTS * 3
+    assert analyzer.analyze_batch(texts) == [analyzer.analyze(text) for text in texts]
+
+
+def test_analyze_batch_async_matches_analyze(analyzer):
+    results = asyncio.run(analyzer.analyze_batch_async(TEXTS))
+    assert results == [analyzer.analyze(text) for text in TEXTS]
+
+
+def test_compile_lexicon_counts_repeated_keywords():
+    matcher, weights = compile_lexicon([["성공", "성장"], ["실패", "실패"], ["성공"]])
+    assert count_keywords(matcher, weights, "성공과 실패") == [1, 2, 1]
+    assert count_matrix(matcher, weights, ["성장", None, ""]).tolist() == [[1, 0, 0], [0, 0, 0], [0, 0, 0]]
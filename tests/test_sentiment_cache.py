@@ -0,0 +1,42 @@
+from sentiment_cache import SentimentCache, sentiment_key
+
+
+class CountingAnalyzer:
+    model_name = "counting"
+    lexicon_version = "v1"
+
+    def __init__(self):
+        self.calls = 0
+
+    def analyze(self, text):
+        self.calls += 1
+        return {"sentiment": "neutral", "text": text}
+
+
+def test_sentiment_key_ignores_case_and_whitespace():
+    assert sentiment_key("K-water  성장\n발표", "v1") == sentiment_key("k-water 성장 발표", "v1")
+    assert sentiment_key("성장", "v1") != sentiment_key("성장", "v2")
+
+
+def test_cache_reuses_results_for_same_text():
+    analyzer = CountingAnalyzer()
+    cache = SentimentCache(analyzer, max_size=10)
+    first = cache.analyze("성장 발표")
+    first["sentiment"] = "changed"
+    assert cache.analyze("성장  발표")["sentiment"] == "neutral"
+    assert analyzer.calls == 1
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_cache_evicts_least_recently_used():
+    analyzer = CountingAnalyzer()
+    cache = SentimentCache(analyzer, max_size=2)
+    cache.analyze("a")
+    cache.analyze("b")
+    cache.analyze("a")
+    cache.analyze("c")
+    assert cache.stats()["size"] == 2
+    cache.analyze("a")
+    assert analyzer.calls == 3
+    cache.analyze("b")
+    assert analyzer.calls == 4
@@ -0,0 +1,36 @@
+from datetime import datetime
+
+from bson import ObjectId
+
+from snapshot_export import UNKNOWN_DAY, SnapshotExporter, _flatten
+
+
+def test_flatten_spreads_sentiment_scores_into_columns():
+    object_id = ObjectId()
+    row = _flatten({
+        "_id": object_id, "title": "제목", "content": "내용", "url": "https://news.example.com/1",
+        "published_at": "2024-03-01T09:00:00+09:00",
+        "sentiment": {"sentiment": "positive", "confidence": 0.5, "positive_score": 0.5,
+                      "negative_score": 0.25, "neutral_score": 0.25},
+        "created_at": datetime(2024, 3, 1, 1, 0)
+    })
+    assert row == {
+        "_id": str(object_id), "title": "제목", "content": "내용", "url": "https://news.example.com/1",
+        "published_at": datetime(2024, 3, 1, 0, 0), "sentiment": "positive",
+        "positive_score": 0.5, "negative_score": 0.25, "neutral_score": 0.25, "confidence": 0.5,
+        "created_at": datetime(2024, 3, 1, 1, 0), "updated_at": None
+    }
+
+
+def test_flatten_without_sentiment():
+    row = _flatten({"_id": ObjectId(), "published_at": None, "sentiment": None})
+    assert row["sentiment"] is None and row["confidence"] is None and row["published_at"] is None
+
+
+def test_day_query_covers_datetime_and_legacy_string_values():
+    # 내보내기 디렉터리·MongoDB 연결 없이 조건만 확인
+    exporter = object.__new__(SnapshotExporter)
+    query = exporter._day_query("2024-03-01")
+    assert query["$or"][0] == {"published_at": {"$gte": datetime(2024, 3, 1), "$lt": datetime(2024, 3, 2)}}
+    assert query["$or"][1]["published_at"] == {"$type": "string"}
+    assert "$expr" in exporter._day_query(UNKNOWN_DAY)
@@ -0,0 +1,85 @@
+import asyncio
+from datetime import datetime
+
+import stats_rollup
+from stats_rollup import TOTALS_ID, StatsRollup
+
+
+def updates_by_id(operations):
+    return {operation._filter["_id"]: operation._doc for operation in operations}
+
+
+def test_increments_group_counts_by_stat_document():
+    docs = [
+        {"title": "한국수자원공사 댐 점검", "content": "", "published_at": datetime(2024, 3, 1, 23, 0),
+         "sentiment": {"sentiment": "positive"}},
+        {"title": "상수도 요금", "content": "수도 요금 인상", "published_at": "2024-03-02T08:00:00+09:00",
+         "sentiment": {"sentiment": "negative"}, "is_duplicate": True},
+        {"title": "기타", "content": "", "published_at": None, "sentiment": None},
+    ]
+
+    updates = updates_by_id(StatsRollup(keywords=["한국수자원공사", "댐", "수도", "상수도"])._increments(docs))
+
+    assert updates[TOTALS_ID] == {
+        "$inc": {"total": 3, "sentiment.positive": 1, "sentiment.negative": 1, "sentiment.Unknown": 1,
+                 "unique_total": 2},
+        "$set": {"kind": "totals"},
+        "$min": {"oldest_published_at": datetime(2024, 3, 1, 23, 0)},
+        "$max": {"newest_published_at": datetime(2024, 3, 1, 23, 0)},
+    }
+    # 두 번째 기사는 KST 2일 오전이라 UTC 날짜로는 1일
+    assert updates["day:2024-03-01"]["$inc"] == {"total": 2, "sentiment.positive": 1, "sentiment.negative": 1}
+    assert updates["keyword:댐"]["$inc"] == {"total": 1, "sentiment.positive": 1}
+    assert updates["keyword:수도"]["$inc"] == {"total": 1, "sentiment.negative": 1}
+    assert updates["keyword:상수도"]["$set"] == {"kind": "keyword", "keyword": "상수도"}
+    assert set(updates) == {TOTALS_ID, "day:2024-03-01", "keyword:한국수자원공사", "keyword:댐",
+                            "keyword:수도", "keyword:상수도"}
+
+
+def test_increments_empty():
+    assert StatsRollup()._increments([]) == []
+
+
+class EmptyStatsCollection:
+    async def find_one(self, *args, **kwargs):
+        return None
+
+    def find(self, *args, **kwargs):
+        return self
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        raise StopAsyncIteration
+
+
+def test_read_stats_without_totals_schedules_reconcile(monkeypatch):
+    calls = []
+
+    async def get_collection(name):
+        return EmptyStatsCollection()
+
+    async def acquire_lease(name, ttl):
+        calls.append(("lease", name))
+        return True
+
+    monkeypatch.setattr(stats_rollup, "get_async_collection_by_name", get_collection)
+    monkeypatch.setattr(stats_rollup, "acquire_lease", acquire_lease)
+    rollup = StatsRollup()
+
+    async def reconcile_if_missing():
+        calls.append(("reconcile", None))
+
+    rollup.reconcile_if_missing = reconcile_if_missing
+
+    async def run():
+        first = await rollup.read_stats()
+        second = await rollup.read_stats()
+        await rollup._pending_reconcile
+        return first, second
+
+    first, second = asyncio.run(run())
+    assert first["pending"] is True and first["total_articles"] == 0
+    assert second["pending"] is True
+    assert calls == [("lease", stats_rollup.STATS_RECONCILE_LEASE), ("reconcile", None)]
@@ -0,0 +1,47 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from trend_rollup import ALL_SCOPE, TrendRollup, _BucketCounter, _bucket_id, _format_bucket, bucket_start
+
+UTC = timezone.utc
+
+
+@pytest.mark.parametrize("granularity, expected", [
+    ("hour", datetime(2024, 3, 7, 15, 0, tzinfo=UTC)),
+    ("day", datetime(2024, 3, 7, tzinfo=UTC)),
+    # 2024-03-07은 목요일이므로 그 주 월요일
+    ("week", datetime(2024, 3, 4, tzinfo=UTC)),
+])
+def test_bucket_start(granularity, expected):
+    assert bucket_start(datetime(2024, 3, 7, 15, 42, 10, 500, tzinfo=UTC), granularity) == expected
+
+
+def test_bucket_id_is_stable_per_granularity_and_scope():
+    start = datetime(2024, 3, 4, tzinfo=UTC)
+    assert _bucket_id("week", ALL_SCOPE, start) == "week:*:2024-03-04T00:00:00+00:00"
+    assert _bucket_id("week", "댐", start) != _bucket_id("day", "댐", start)
+
+
+def test_count_assigns_each_article_to_every_granularity_and_keyword_scope():
+    counter = _BucketCounter()
+    docs = [
+        {"title": "댐 점검", "content": "", "published_at": datetime(2024, 3, 7, 15, 42, tzinfo=UTC),
+         "sentiment": {"sentiment": "positive", "positive_score": 0.8, "confidence": 0.6}},
+        # KST 3월 8일 0시 10분 = UTC 3월 7일 15시 10분
+        {"title": "기타", "content": "", "published_at": "2024-03-08T00:10:00+09:00", "sentiment": None},
+        {"title": "댐", "content": "", "published_at": None},
+    ]
+
+    TrendRollup(keywords=["댐"])._count(counter, docs)
+
+    # 구간 시작은 MongoDB가 돌려주는 형태와 같은 naive UTC
+    hour = datetime(2024, 3, 7, 15)
+    assert counter.buckets[("hour", ALL_SCOPE, hour)]["count"] == 2
+    assert counter.buckets[("hour", "댐", hour)]["count"] == 1
+    assert len(counter.buckets) == 6
+
+    formatted = _format_bucket(hour, counter.buckets[("hour", ALL_SCOPE, hour)])
+    assert formatted["sentiment_counts"] == {"positive": 1, "Unknown": 1}
+    assert formatted["mean_scores"]["positive_score"] == 0.8
+    assert formatted["mean_scores"]["negative_score"] == 0.0
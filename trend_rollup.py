@@ -0,0 +1,229 @@
+import asyncio
+import functools
+import logging
+import os
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+from dotenv import load_dotenv
+from pymongo import UpdateOne, ReplaceOne
+from database_mongo import get_async_collection, get_async_collection_by_name, TRENDS_COLLECTION_NAME
+from date_utils import to_utc_datetime, utc_now, published_at_filter
+from keyword_automaton import KeywordAutomaton
+from news_collector_mongo import ARTICLE_KEYWORDS
+from search_index import keyword_filter
+from stats_rollup import matched_keywords, run_periodically
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+load_dotenv()
+
+TRENDS_REBUILD_INTERVAL = float(os.getenv("TRENDS_REBUILD_INTERVAL", "86400"))
+TRENDS_REBUILD_LEASE = "trends_rebuild"
+
+# 시간 구간 단위 (모두 UTC 기준, 주는 월요일 시작)
+TREND_GRANULARITIES = ("hour", "day", "week")
+
+# 평균을 내는 감정분석 점수 필드
+SCORE_FIELDS = ("positive_score", "negative_score", "neutral_score", "confidence")
+
+# 키워드 조건이 없을 때의 집계 범위
+ALL_SCOPE = "*"
+
+
+def bucket_start(published_at: datetime, granularity: str) -> datetime:
+    """
+    발행일시가 속한 시간 구간의 시작 시각을 반환합니다.
+    """
+    if granularity == "hour":
+        return published_at.replace(minute=0, second=0, microsecond=0)
+    day = published_at.replace(hour=0, minute=0, second=0, microsecond=0)
+    if granularity == "week":
+        return day - timedelta(days=day.weekday())
+    return day
+
+
+class _BucketCounter:
+    """
+    (단위, 범위, 구간 시작)별 기사 수, 감정별 수, 점수 합계를 모읍니다.
+    """
+
+    def __init__(self):
+        self.buckets: Dict[tuple, Dict[str, Any]] = {}
+
+    def add(self, granularity: str, scope: str, start: datetime, doc: Dict[str, Any]):
+        entry = self.buckets.setdefault((granularity, scope, start), {
+            "count": 0, "scored": 0, "sentiment": {}, "score_sum": {field: 0.0 for field in SCORE_FIELDS}
+        })
+        entry["count"] += 1
+        sentiment = doc.get("sentiment")
+        if isinstance(sentiment, dict) and sentiment.get("sentiment"):
+            label = sentiment["sentiment"]
+            entry["sentiment"][label] = entry["sentiment"].get(label, 0) + 1
+            entry["scored"] += 1
+            for field in SCORE_FIELDS:
+                entry["score_sum"][field] += float(sentiment.get(field) or 0.0)
+        else:
+            entry["sentiment"]["Unknown"] = entry["sentiment"].get("Unknown", 0) + 1
+
+
+def _bucket_id(granularity: str, scope: str, start: datetime) -> str:
+    return f"{granularity}:{scope}:{start.isoformat()}"
+
+
+def _format_bucket(start: datetime, entry: Dict[str, Any]) -> Dict[str, Any]:
+    scored = entry.get("scored", 0)
+    return {
+        "bucket": start,
+        "count": entry.get("count", 0),
+        "sentiment_counts": entry.get("sentiment", {}),
+        "mean_scores": {
+            field: round(entry.get("score_sum", {}).get(field, 0.0) / scored, 3) if scored else None
+            for field in SCORE_FIELDS
+        }
+    }
+
+
+class TrendRollup:
+    """
+    감정 추이용 시간 구간 집계 컬렉션을 관리합니다.
+
+    구간 문서는 (단위, 범위, 구간 시작)마다 하나이며, 범위는 전체("*") 또는 관련 키워드입니다.
+    저장 리스너로 새 기사를 해당 구간에 더하고, rebuild()가 주기적으로 원본에서 다시 만듭니다.
+    """
+
+    def __init__(self, keywords: List[str] = None):
+        self.keywords = [keyword.lower() for keyword in (keywords or ARTICLE_KEYWORDS)]
+        self._matcher = KeywordAutomaton(self.keywords)
+        self._rebuild_lock = asyncio.Lock()
+        self._task = None
+
+    def _count(self, counter: _BucketCounter, docs: List[Dict[str, Any]]):
+        for doc in docs:
+            published_at = to_utc_datetime(doc.get("published_at"))
+            if published_at is None:
+                continue
+            scopes = [ALL_SCOPE, *matched_keywords(self._matcher, doc)]
+            for granularity in TREND_GRANULARITIES:
+                start = bucket_start(published_at, granularity)
+                for scope in scopes:
+                    counter.add(granularity, scope, start, doc)
+
+    async def on_articles_saved(self, docs: List[Dict[str, Any]]):
+        """
+        새로 저장된 기사를 시간 구간 카운터에 더합니다.
+        """
+        counter = _BucketCounter()
+        self._count(counter, docs)
+        if not counter.buckets:
+            return
+
+        operations = []
+        for (granularity, scope, start), entry in counter.buckets.items():
+            inc = {"count": entry["count"], "scored": entry["scored"]}
+            inc.update({f"sentiment.{label}": count for label, count in entry["sentiment"].items()})
+            inc.update({f"score_sum.{field}": value for field, value in entry["score_sum"].items()})
+            operations.append(UpdateOne(
+                {"_id": _bucket_id(granularity, scope, start)},
+                {"$inc": inc, "$set": {"granularity": granularity, "scope": scope, "bucket": start}},
+                upsert=True
+            ))
+        trends_collection = await get_async_collection_by_name(TRENDS_COLLECTION_NAME)
+        await trends_collection.bulk_write(operations, ordered=False)
+
+    async def rebuild(self, batch_size: int = 1000) -> Dict[str, Any]:
+        """
+        기사 컬렉션 전체를 한 번 읽어 구간 집계를 다시 만듭니다.
+        재생성 중 저장된 기사의 증분은 덮어써질 수 있으며 다음 재생성에서 맞춰집니다.
+        """
+        async with self._rebuild_lock:
+            rebuilt_at = utc_now()
+            collection = await get_async_collection()
+            trends_collection = await get_async_collection_by_name(TRENDS_COLLECTION_NAME)
+
+            counter = _BucketCounter()
+            batch = []
+            cursor = collection.find({}, {"title": 1, "content": 1, "published_at": 1, "sentiment": 1})
+            async for doc in cursor.batch_size(batch_size):
+                batch.append(doc)
+                if len(batch) >= batch_size:
+                    self._count(counter, batch)
+                    batch = []
+            self._count(counter, batch)
+
+            replacements = []
+            for (granularity, scope, start), entry in counter.buckets.items():
+                replacements.append({
+                    "_id": _bucket_id(granularity, scope, start),
+                    "granularity": granularity, "scope": scope, "bucket": start,
+                    "rebuilt_at": rebuilt_at, **entry
+                })
+            for start in range(0, len(replacements), batch_size):
+                chunk = replacements[start:start + batch_size]
+                await trends_collection.bulk_write(
+                    [ReplaceOne({"_id": doc["_id"]}, doc, upsert=True) for doc in chunk],
+                    ordered=False
+                )
+            # 이번 재생성에 없던 이전 구간 문서 정리 (재생성 이후 증분으로 생긴 문서는 rebuilt_at이 없음)
+            await trends_collection.delete_many({"rebuilt_at": {"$lt": rebuilt_at}})
+
+            logger.info(f"감정 추이 집계 재생성 완료: 구간 {len(replacements)}개")
+            return {"buckets": len(replacements)}
+
+    async def rebuild_if_stale(self, max_age: float = TRENDS_REBUILD_INTERVAL):
+        """
+        집계가 비어 있거나 마지막 재생성이 max_age초보다 오래됐을 때만 재생성합니다.
+        """
+        trends_collection = await get_async_collection_by_name(TRENDS_COLLECTION_NAME)
+        latest = await trends_collection.find_one({"rebuilt_at": {"$exists": True}}, {"rebuilt_at": 1},
+                                                  sort=[("rebuilt_at", -1)])
+        if latest is None or latest["rebuilt_at"] < utc_now() - timedelta(seconds=max_age):
+            await self.rebuild()
+
+    async def query(self, granularity: str, start: datetime, end: datetime,
+                    keyword: Optional[str] = None) -> Dict[str, Any]:
+        """
+        [start, end] 범위의 구간별 감정 추이를 반환합니다.
+        전체 또는 관련 키워드는 집계 컬렉션에서 읽고, 그 밖의 키워드는 해당 기사만 조회해 계산합니다.
+        """
+        scope = keyword.lower() if keyword else ALL_SCOPE
+        if scope == ALL_SCOPE or scope in self.keywords:
+            trends_collection = await get_async_collection_by_name(TRENDS_COLLECTION_NAME)
+            cursor = trends_collection.find({
+                "granularity": granularity,
+                "scope": scope,
+                "bucket": {"$gte": bucket_start(start, granularity), "$lte": end}
+            }).sort("bucket", 1)
+            buckets = [_format_bucket(doc["bucket"], doc) async for doc in cursor]
+            return {"source": "rollup", "buckets": buckets}
+
+        collection = await get_async_collection()
+        query = {"$and": [keyword_filter(keyword, ("title", "content")), published_at_filter(start, end)]}
+        counter = _BucketCounter()
+        async for doc in collection.find(query, {"published_at": 1, "sentiment": 1}):
+            published_at = to_utc_datetime(doc.get("published_at"))
+            if published_at is not None:
+                counter.add(granularity, scope, bucket_start(published_at, granularity), doc)
+        buckets = [_format_bucket(bucket, entry) for (_, _, bucket), entry in sorted(counter.buckets.items())]
+        return {"source": "articles", "buckets": buckets}
+
+    def start(self, interval: float = TRENDS_REBUILD_INTERVAL):
+        """
+        주기적인 재생성 작업을 시작합니다. interval이 0 이하면 시작하지 않습니다.
+        시작할 때는 집계가 비어 있거나 오래됐을 때만 재생성하며, 여러 워커 중 한 프로세스만 재생성합니다.
+        """
+        if interval > 0 and self._task is None:
+            self._task = asyncio.create_task(run_periodically(
+                self.rebuild, interval, "감정 추이 집계 재생성",
+                lease=TRENDS_REBUILD_LEASE, startup_job=functools.partial(self.rebuild_if_stale, interval)
+            ))
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None